@@ -0,0 +1,16 @@
+"""Performance benchmarks for the validation engine.
+
+The suite runs the validator on synthetic modules of configurable size
+(1k, 10k and 100k lines by default) and rule files of 10, 100 and 1000
+rules. It measures `StaticValidator` end to end as well as every selector
+and constraint type in isolation, and records wall time and peak memory
+(via `tracemalloc`) for each case.
+
+Run it from the project root:
+
+.. code-block:: bash
+
+    python -m benchmarks --output .benchmarks/latest.json
+    python -m benchmarks --baseline .benchmarks/baseline.json --threshold 0.15
+
+"""
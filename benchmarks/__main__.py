@@ -0,0 +1,105 @@
+"""Command-line entry point of the benchmark suite.
+
+Example:
+    .. code-block:: bash
+
+        # Quick run on small inputs only
+        python -m benchmarks --sizes 1000 --rule-counts 10 --repeat 3
+
+        # Store a baseline, then check a later run against it
+        python -m benchmarks --output .benchmarks/baseline.json
+        python -m benchmarks --baseline .benchmarks/baseline.json --threshold 0.15
+
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from .suite import DEFAULT_RULE_COUNTS, DEFAULT_SIZES, build_cases, compare, run_suite
+
+
+def setup_arg_parser() -> argparse.ArgumentParser:
+    """Creates the argument parser of the benchmark runner.
+
+    Returns:
+        argparse.ArgumentParser: The configured parser.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmarks the validation engine.")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), metavar="LINES", help="Module sizes in lines."
+    )
+    parser.add_argument(
+        "--rule-counts",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_RULE_COUNTS),
+        metavar="N",
+        help="Numbers of rules per rule file.",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case. Default: 5.")
+    parser.add_argument("--filter", default=None, metavar="TEXT", help="Only run cases whose name contains TEXT.")
+    parser.add_argument("--output", type=Path, default=None, metavar="PATH", help="Write the results as JSON.")
+    parser.add_argument(
+        "--baseline", type=Path, default=None, metavar="PATH", help="Compare the results with a stored run."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed relative slowdown or memory growth against the baseline. Default: 0.2 (20%%).",
+    )
+    return parser
+
+
+def _print_result(name: str, result: dict[str, Any]) -> None:
+    """Prints one finished case."""
+    print(
+        f"{name:<52} {result['min_ms']:>12.3f} ms {result['median_ms']:>12.3f} ms "
+        f"{result['peak_kib']:>12.1f} KiB  (x{result['runs']})",
+        flush=True,
+    )
+
+
+def main() -> int:
+    """Runs the benchmarks and reports regressions.
+
+    Returns:
+        0 on success, 1 if a regression against the baseline was found.
+    """
+    args = setup_arg_parser().parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="code-validator-bench-") as workdir:
+        cases = build_cases(args.sizes, args.rule_counts, Path(workdir))
+        if args.filter:
+            cases = [case for case in cases if args.filter in case.name]
+
+        print(f"{'case':<52} {'min':>15} {'median':>15} {'peak memory':>16}")
+        document = run_suite(cases, repeat=args.repeat, progress=_print_result)
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(document, indent=2), encoding="utf-8")
+        print(f"\nResults written to: {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        comparisons, regressions = compare(document, baseline, threshold=args.threshold)
+        print(f"\nCompared {len(comparisons)} metrics with {args.baseline} (threshold {args.threshold:.0%}).")
+        for row in regressions:
+            print(
+                f"REGRESSION {row['name']} {row['metric']}: "
+                f"{row['baseline']:.3f} -> {row['current']:.3f} ({row['change']:+.1%})"
+            )
+        if regressions:
+            return 1
+        print("No regressions.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,208 @@
+"""Generates synthetic Python modules and rule files for the benchmarks.
+
+All generated data is deterministic, so results of different runs (and
+different commits) are comparable. The module is built from a repeated block
+of realistic code (a class with methods, a helper function, constants and
+loops), and the rules exercise every selector and constraint type against
+names that exist in that module, plus a few that do not, so that typo
+detection runs as well.
+"""
+
+from typing import Any
+
+_HEADER = '''"""Synthetic module generated for benchmarks."""
+
+import math
+import os
+
+
+class Base:
+    """Common base class."""
+
+    def describe(self):
+        return self.__class__.__name__
+
+'''
+
+_BLOCK = '''
+CONSTANT_{i} = {i}
+
+
+class Entity{i}(Base):
+    """Entity number {i}."""
+
+    def __init__(self, speed, health):
+        self.speed = speed * {factor}
+        self.health = health
+        self.name = "entity_{i}"
+
+    def update(self, delta_time):
+        if self.health > 0:
+            self.speed += delta_time
+        for step in range({steps}):
+            print(step, self.name, math.sqrt(step))
+        return self.speed
+
+
+def helper_{i}(value, factor=2):
+    total = 0
+    while value > 0:
+        total += value * factor
+        value -= 1
+    return total
+'''
+
+_FOOTER = """
+
+def main():
+    entities = [Entity0(1, 10)]
+    for entity in entities:
+        entity.update(0.5)
+
+
+if __name__ == "__main__":
+    main()
+"""
+
+BLOCK_LINES = _BLOCK.count("\n")
+
+
+def generate_module(lines: int) -> str:
+    """Generates a syntactically valid module of roughly the given length.
+
+    Args:
+        lines: The desired number of lines. The result is rounded up to a
+            whole number of generated blocks.
+
+    Returns:
+        The source code of the module.
+    """
+    blocks = max(1, -(-(lines - _HEADER.count("\n") - _FOOTER.count("\n")) // BLOCK_LINES))
+    parts = [_HEADER]
+    parts.extend(_BLOCK.format(i=i, factor=i % 7 + 1, steps=i % 5 + 2) for i in range(blocks))
+    parts.append(_FOOTER)
+    return "".join(parts)
+
+
+def block_count(source_code: str) -> int:
+    """Returns the number of generated blocks in a module from `generate_module`."""
+    return source_code.count("\nclass Entity")
+
+
+# Selector and constraint pairs used to build rules. `{k}` is replaced by the
+# index of an existing block, so most rules pass; the last template refers to
+# a misspelled attribute and triggers typo detection.
+_RULE_TEMPLATES: list[dict[str, Any]] = [
+    {"selector": {"type": "function_def", "name": "helper_{k}"}, "constraint": {"type": "is_required"}},
+    {
+        "selector": {"type": "class_def", "name": "Entity{k}"},
+        "constraint": {"type": "must_inherit_from", "parent_name": "Base"},
+    },
+    {
+        "selector": {"type": "function_call", "name": "print", "in_scope": {"class": "Entity{k}", "method": "update"}},
+        "constraint": {"type": "is_required"},
+    },
+    {
+        "selector": {"type": "assignment", "name": "CONSTANT_{k}", "in_scope": "global"},
+        "constraint": {"type": "must_be_type", "expected_type": "int"},
+    },
+    {"selector": {"type": "import_statement", "name": "math"}, "constraint": {"type": "is_required"}},
+    {
+        "selector": {"type": "ast_node", "node_type": "While", "in_scope": {"function": "helper_{k}"}},
+        "constraint": {"type": "is_required"},
+    },
+    {
+        "selector": {"type": "usage", "name": "self.speed", "in_scope": "Entity{k}.update"},
+        "constraint": {"type": "is_required"},
+    },
+    {
+        "selector": {"type": "function_def", "name": "helper_{k}"},
+        "constraint": {"type": "must_have_args", "count": 2},
+    },
+    {"selector": {"type": "function_call", "name": "eval"}, "constraint": {"type": "is_forbidden"}},
+    {
+        "selector": {
+            "type": "assignment",
+            "name": "self.sped",
+            "in_scope": {"class": "Entity{k}", "method": "__init__"},
+        },
+        "constraint": {"type": "is_required"},
+    },
+]
+
+
+def _fill(value: Any, k: int) -> Any:
+    """Replaces `{k}` placeholders in all strings of a JSON value."""
+    if isinstance(value, str):
+        return value.replace("{k}", str(k))
+    if isinstance(value, dict):
+        return {key: _fill(item, k) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_fill(item, k) for item in value]
+    return value
+
+
+def generate_rules(count: int, blocks: int, *, with_linter: bool = False) -> dict[str, Any]:
+    """Generates a rules document with the given number of rules.
+
+    Args:
+        count: The total number of rules, including the syntax check.
+        blocks: The number of blocks in the module the rules will run against.
+        with_linter: If True, a `check_linter_pep8` rule is included.
+
+    Returns:
+        A dictionary in the format of a JSON rules file.
+    """
+    rules: list[dict[str, Any]] = [{"rule_id": 1, "type": "check_syntax", "message": "Syntax error."}]
+    if with_linter:
+        rules.append({"rule_id": 2, "type": "check_linter_pep8", "message": "PEP8.", "params": {"ignore": ["E501"]}})
+
+    index = 0
+    while len(rules) < count:
+        template = _RULE_TEMPLATES[index % len(_RULE_TEMPLATES)]
+        # Spread the rules over the whole module instead of its first block.
+        k = (index * 7919) % blocks
+        rules.append({"rule_id": 100 + index, "message": f"Generated rule {index}.", "check": _fill(template, k)})
+        index += 1
+
+    return {"description": f"{count} generated rules", "validation_rules": rules}
+
+
+def selector_configs(blocks: int) -> dict[str, dict[str, Any]]:
+    """Returns one selector configuration per selector type.
+
+    Args:
+        blocks: The number of blocks in the module the selectors will run against.
+
+    Returns:
+        A mapping of selector type to its raw configuration.
+    """
+    k = blocks // 2
+    return {
+        "function_def": {"type": "function_def", "name": f"helper_{k}"},
+        "class_def": {"type": "class_def", "name": f"Entity{k}"},
+        "import_statement": {"type": "import_statement", "name": "os"},
+        "function_call": {"type": "function_call", "name": "print"},
+        "assignment": {"type": "assignment", "name": "self.speed"},
+        "usage": {"type": "usage", "name": "self.name"},
+        "literal": {"type": "literal", "name": "number"},
+        "ast_node": {"type": "ast_node", "node_type": ["For", "While"]},
+    }
+
+
+def constraint_configs() -> dict[str, tuple[str, dict[str, Any]]]:
+    """Returns one constraint configuration per constraint type.
+
+    Returns:
+        A mapping of constraint type to the selector type whose nodes it is
+        applied to and the raw constraint configuration.
+    """
+    return {
+        "is_required": ("function_call", {"type": "is_required"}),
+        "is_forbidden": ("function_call", {"type": "is_forbidden"}),
+        "must_inherit_from": ("class_def", {"type": "must_inherit_from", "parent_name": "Base"}),
+        "must_be_type": ("assignment", {"type": "must_be_type", "expected_type": "int"}),
+        "must_have_args": ("function_def", {"type": "must_have_args", "count": 2}),
+        "name_must_be_in": ("usage", {"type": "name_must_be_in", "allowed_names": ["self.name"]}),
+        "value_must_be_in": ("literal", {"type": "value_must_be_in", "allowed_values": [0, 1, 2]}),
+    }
@@ -0,0 +1,278 @@
+"""Defines the benchmark cases, measures them and compares results.
+
+Every case consists of a setup step, which prepares its inputs and is not
+measured, and a measured callable. A case is run a few times to measure its
+wall time, then once more under `tracemalloc` to measure its peak memory, so
+that the overhead of memory tracing never distorts the timings.
+"""
+
+import json
+import logging
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from src.code_validator import __version__
+from src.code_validator.components.ast_utils import parse_source
+from src.code_validator.components.factories import ConstraintFactory, SelectorFactory
+from src.code_validator.components.linter import Flake8Engine
+from src.code_validator.config import AppConfig, ConstraintConfig, LogLevel, SelectorConfig
+from src.code_validator.core import CompiledRuleSet, StaticValidator
+from src.code_validator.output import Console
+
+from .generators import block_count, constraint_configs, generate_module, generate_rules, selector_configs
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+DEFAULT_RULE_COUNTS = (10, 100, 1_000)
+
+# A case whose first run takes longer than this is not repeated.
+SLOW_CASE_SECONDS = 2.0
+
+# How many messages or objects the logging cases create per run.
+LOGGING_CALLS = 10_000
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """A single measurable benchmark.
+
+    Attributes:
+        name: The unique name of the case, used as the key in result files.
+        setup: Prepares the inputs and returns the callable to measure.
+    """
+
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+
+
+def _quiet_console() -> Console:
+    """Creates a console that neither prints nor logs during measurements."""
+    logger = logging.getLogger("code_validator.benchmarks")
+    logger.setLevel(logging.CRITICAL)
+    logger.propagate = False
+    return Console(logger, is_quiet=True)
+
+
+def build_cases(sizes: Iterable[int], rule_counts: Iterable[int], workdir: Path) -> list[BenchmarkCase]:
+    """Builds the benchmark cases for the given module sizes and rule counts.
+
+    Args:
+        sizes: The lengths, in lines, of the generated modules.
+        rule_counts: The numbers of rules in the generated rule files.
+        workdir: A directory for generated solution and rule files.
+
+    Returns:
+        The cases, cheapest first within each group.
+    """
+    sizes = sorted(sizes)
+    rule_counts = sorted(rule_counts)
+    console = _quiet_console()
+    sources = {size: generate_module(size) for size in sizes}
+    cases: list[BenchmarkCase] = []
+
+    def source_file(size: int) -> Path:
+        path = workdir / f"module_{size}.py"
+        if not path.exists():
+            path.write_text(sources[size], encoding="utf-8")
+        return path
+
+    def rules_file(size: int, count: int) -> Path:
+        path = workdir / f"rules_{size}_{count}.json"
+        if not path.exists():
+            rules = generate_rules(count, block_count(sources[size]))
+            path.write_text(json.dumps(rules), encoding="utf-8")
+        return path
+
+    for size in sizes:
+        cases.append(BenchmarkCase(f"parse[lines={size}]", lambda size=size: lambda: parse_source(sources[size])))
+
+    for count in rule_counts:
+
+        def setup_compile(count: int = count) -> Callable[[], Any]:
+            rules = generate_rules(count, block_count(sources[sizes[0]]))
+            return lambda: CompiledRuleSet.from_dict(rules, console)
+
+        cases.append(BenchmarkCase(f"compile_rules[rules={count}]", setup_compile))
+
+    for size in sizes:
+        for count in rule_counts:
+
+            def setup_end_to_end(size: int = size, count: int = count) -> Callable[[], Any]:
+                config = AppConfig(
+                    solution_path=source_file(size),
+                    rules_path=rules_file(size, count),
+                    log_level=LogLevel.CRITICAL,
+                    is_quiet=True,
+                    exit_on_first_error=False,
+                )
+                return lambda: StaticValidator(config, console).run()
+
+            cases.append(BenchmarkCase(f"end_to_end[lines={size},rules={count}]", setup_end_to_end))
+
+    for size in sizes:
+        blocks = block_count(sources[size])
+        selectors = selector_configs(blocks)
+
+        for selector_type, raw in selectors.items():
+
+            def setup_selector(size: int = size, raw: dict = raw) -> Callable[[], Any]:
+                tree = parse_source(sources[size])
+                selector = SelectorFactory.create(SelectorConfig(**raw))
+                return lambda: selector.select(tree)
+
+            cases.append(BenchmarkCase(f"selector[{selector_type},lines={size}]", setup_selector))
+
+        for constraint_type, (selector_type, raw) in constraint_configs().items():
+
+            def setup_constraint(size: int = size, selector_raw: dict = selectors[selector_type], raw: dict = raw):
+                tree = parse_source(sources[size])
+                nodes = SelectorFactory.create(SelectorConfig(**selector_raw)).select(tree)
+                constraint = ConstraintFactory.create(ConstraintConfig(**raw))
+                return lambda: constraint.check(nodes)
+
+            cases.append(BenchmarkCase(f"constraint[{constraint_type},lines={size}]", setup_constraint))
+
+    def setup_disabled_console(lazy: bool) -> Callable[[], Any]:
+        rules_data = generate_rules(rule_counts[0], block_count(sources[sizes[0]]))
+
+        def log_lazily() -> None:
+            for _ in range(LOGGING_CALLS):
+                console.print("Load rules:\n%s", rules_data, level=LogLevel.TRACE)
+
+        def log_eagerly() -> None:
+            for _ in range(LOGGING_CALLS):
+                console.print(f"Load rules:\n{rules_data}", level=LogLevel.TRACE)
+
+        return log_lazily if lazy else log_eagerly
+
+    # The eager case is the reference: the cost of formatting a message that is discarded
+    cases.append(BenchmarkCase(f"logging[disabled,eager,calls={LOGGING_CALLS}]", lambda: setup_disabled_console(False)))
+    cases.append(BenchmarkCase(f"logging[disabled,lazy,calls={LOGGING_CALLS}]", lambda: setup_disabled_console(True)))
+
+    def setup_disabled_init() -> Callable[[], Any]:
+        config = ConstraintConfig(type="is_required")
+        return lambda: [ConstraintFactory.create(config) for _ in range(LOGGING_CALLS)]
+
+    cases.append(BenchmarkCase(f"logging[disabled,init,calls={LOGGING_CALLS}]", setup_disabled_init))
+
+    for size in sizes:
+
+        def setup_linter(size: int = size) -> Callable[[], Any]:
+            # Without a lint cache, so that every iteration runs flake8 instead of a lookup
+            engine = Flake8Engine(cache=None)
+            return lambda: engine.check(sources[size], ignore=["E501"])
+
+        cases.append(BenchmarkCase(f"linter[lines={size}]", setup_linter))
+
+    return cases
+
+
+def measure(func: Callable[[], Any], repeat: int) -> dict[str, Any]:
+    """Measures the wall time and peak memory of a callable.
+
+    The first call doubles as a warm-up and is only counted for slow cases,
+    which are not repeated.
+
+    Args:
+        func: The callable to measure.
+        repeat: How many timed runs to make for fast cases.
+
+    Returns:
+        The number of timed runs, the min/median/mean time in milliseconds
+        and the peak traced memory in KiB.
+    """
+    start = time.perf_counter()
+    func()
+    first = time.perf_counter() - start
+
+    timings = [first] if first > SLOW_CASE_SECONDS else []
+    while len(timings) < max(1, repeat) and first <= SLOW_CASE_SECONDS:
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "runs": len(timings),
+        "min_ms": min(timings) * 1000,
+        "median_ms": statistics.median(timings) * 1000,
+        "mean_ms": statistics.fmean(timings) * 1000,
+        "peak_kib": peak / 1024,
+    }
+
+
+def run_suite(
+    cases: Iterable[BenchmarkCase], *, repeat: int, progress: Callable[[str, dict[str, Any]], None] | None = None
+) -> dict[str, Any]:
+    """Runs benchmark cases and collects their results.
+
+    Args:
+        cases: The cases to run.
+        repeat: How many timed runs to make for fast cases.
+        progress: An optional callback invoked with each finished case.
+
+    Returns:
+        A JSON-serializable document with environment metadata and the
+        results of every case.
+    """
+    results: dict[str, dict[str, Any]] = {}
+    for case in cases:
+        result = measure(case.setup(), repeat)
+        results[case.name] = result
+        if progress is not None:
+            progress(case.name, result)
+
+    return {
+        "meta": {
+            "validator_version": __version__,
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    current: dict[str, Any], baseline: dict[str, Any], *, threshold: float
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Compares results against a baseline.
+
+    A case regresses when its minimum time or its peak memory exceeds the
+    baseline by more than `threshold` (0.2 means 20%). Cases that exist in
+    only one of the documents are ignored.
+
+    Args:
+        current: A document returned by `run_suite`.
+        baseline: A previously stored document returned by `run_suite`.
+        threshold: The allowed relative increase.
+
+    Returns:
+        All comparisons and the subset of them that are regressions. Each
+        comparison holds the case name, the metric, both values and the
+        relative change.
+    """
+    comparisons = []
+    for name, result in current["results"].items():
+        reference = baseline.get("results", {}).get(name)
+        if reference is None:
+            continue
+        for metric in ("min_ms", "peak_kib"):
+            before, after = reference[metric], result[metric]
+            change = (after - before) / before if before else 0.0
+            comparisons.append({"name": name, "metric": metric, "baseline": before, "current": after, "change": change})
+
+    regressions = [row for row in comparisons if row["change"] > threshold]
+    return comparisons, regressions
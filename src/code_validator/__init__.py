@@ -41,12 +41,16 @@ Attributes:
 
 """
 
-from .config import AppConfig, ExitCode, LogLevel
-from .core import StaticValidator
+from .config import AppConfig, ExitCode, LogLevel, RuleFailure, RuleResult, ValidationResult
+from .core import CompiledRuleSet, StaticValidator
 from .exceptions import RuleParsingError, ValidationFailedError
 
 __all__ = [
     "StaticValidator",
+    "CompiledRuleSet",
+    "ValidationResult",
+    "RuleFailure",
+    "RuleResult",
     "AppConfig",
     "ExitCode",
     "LogLevel",
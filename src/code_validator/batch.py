@@ -0,0 +1,271 @@
+"""Validates many solution files in parallel with a single rule set.
+
+This module implements the batch mode of the validator. Inputs may be files,
+directories or glob patterns; they are expanded into a list of Python files
+which are then validated by a pool of worker processes. Each worker compiles
+the rules exactly once in its initializer and reuses the resulting
+`CompiledRuleSet` for every file it receives.
+
+Results are streamed back as soon as they are ready. By default they arrive
+in completion order; with `keep_order=True` a small reorder buffer holds
+early results back until every earlier input has been yielded.
+
+Example:
+    .. code-block:: python
+
+        from code_validator.batch import expand_solution_paths, validate_batch
+
+        paths = expand_solution_paths(["submissions/", "extra/*.py"])
+        for result in validate_batch(paths, Path("rules.json"), jobs=8):
+            print(result.solution_path, result.is_valid)
+
+"""
+
+import glob
+import logging
+import multiprocessing
+import os
+from pathlib import Path
+from typing import Iterable, Iterator, Sequence
+
+from .config import DEFAULT_CACHE_MAX_BYTES, LogLevel, ValidationResult
+from .core import CompiledRuleSet
+from .output import Console, setup_logging
+
+_GLOB_CHARS = frozenset("*?[")
+
+# The rule set compiled by `_init_worker`, one per worker process.
+_worker_rule_set: CompiledRuleSet | None = None
+_worker_exit_on_first_error: bool = False
+_worker_max_typo_suggestions: int | None = None
+
+
+def expand_solution_paths(inputs: Iterable[str | Path]) -> list[Path]:
+    """Expands files, directories and glob patterns into a list of files.
+
+    Directories are searched recursively for ``*.py`` files. Glob patterns
+    support ``**``. Plain paths are kept as they are, even if they do not
+    exist, so that the missing file is reported in the results.
+
+    Args:
+        inputs: The raw paths or patterns given by the user.
+
+    Returns:
+        The expanded file paths, without duplicates, in a stable order.
+    """
+    expanded: list[Path] = []
+    seen: set[Path] = set()
+
+    for raw in inputs:
+        raw_str = str(raw)
+        if _GLOB_CHARS.intersection(raw_str):
+            candidates = [Path(p) for p in sorted(glob.glob(raw_str, recursive=True)) if os.path.isfile(p)]
+        elif os.path.isdir(raw_str):
+            candidates = sorted(p for p in Path(raw_str).rglob("*.py") if p.is_file())
+        else:
+            candidates = [Path(raw_str)]
+
+        for path in candidates:
+            if path not in seen:
+                seen.add(path)
+                expanded.append(path)
+
+    return expanded
+
+
+def is_batch_input(inputs: Sequence[str | Path]) -> bool:
+    """Checks whether the given solution inputs require batch mode.
+
+    Args:
+        inputs: The raw paths or patterns given by the user.
+
+    Returns:
+        True if there is more than one input, or any input is a directory or
+        a glob pattern.
+    """
+    if len(inputs) != 1:
+        return True
+    raw_str = str(inputs[0])
+    return bool(_GLOB_CHARS.intersection(raw_str)) or os.path.isdir(raw_str)
+
+
+def _init_worker(
+    rules_path: Path,
+    log_level: LogLevel,
+    exit_on_first_error: bool,
+    cache_dir: Path | None,
+    cache_max_bytes: int,
+    queued_logging: bool = False,
+    cache_rules: bool = False,
+    max_typo_suggestions: int | None = None,
+) -> None:
+    """Compiles the rule set once per worker process.
+
+    Args:
+        rules_path: The path to the JSON rules file.
+        log_level: The logging level for the worker.
+        exit_on_first_error: If True, each file halts after its first failed rule.
+        cache_dir: The directory of the shared result cache, or None.
+        cache_max_bytes: The size limit of the result cache directory.
+        queued_logging: If True, the worker logs through a background thread.
+        cache_rules: If True, the compiled rules are loaded from the cache next
+            to the rules file.
+        max_typo_suggestions: The number of leading failures of each file
+            whose typo suggestion is analyzed. None analyzes every failure.
+    """
+    global _worker_rule_set, _worker_exit_on_first_error, _worker_max_typo_suggestions
+
+    logger = setup_logging(log_level, queued=queued_logging)
+    console = Console(logger, is_quiet=True)
+    _worker_rule_set = CompiledRuleSet.from_file(
+        rules_path, console, cache_dir=cache_dir, cache_max_bytes=cache_max_bytes, cache_rules=cache_rules
+    )
+    _worker_exit_on_first_error = exit_on_first_error
+    _worker_max_typo_suggestions = max_typo_suggestions
+
+
+def _validate_file(
+    rule_set: CompiledRuleSet, solution_path: Path, exit_on_first_error: bool, max_typo_suggestions: int | None = None
+) -> ValidationResult:
+    """Validates a single file, turning per-file I/O errors into results.
+
+    Errors that concern only this file (missing or unreadable source) are
+    returned as part of the result instead of aborting the whole batch.
+
+    Args:
+        rule_set: The compiled rules to apply.
+        solution_path: The path of the file to validate.
+        exit_on_first_error: If True, halts after the first failed rule.
+        max_typo_suggestions: The number of leading failures whose typo
+            suggestion is analyzed. None analyzes every failure.
+
+    Returns:
+        The validation result for the file.
+    """
+    try:
+        return rule_set.validate(
+            solution_path, exit_on_first_error=exit_on_first_error, max_typo_suggestions=max_typo_suggestions
+        )
+    except FileNotFoundError:
+        return ValidationResult(solution_path, False, error=f"Input file not found: {solution_path}")
+    except (OSError, UnicodeDecodeError) as e:
+        return ValidationResult(solution_path, False, error=f"Cannot read source file: {e}")
+
+
+def _validate_in_worker(task: tuple[int, Path]) -> tuple[int, ValidationResult]:
+    """Validates one file with the rule set compiled by `_init_worker`.
+
+    Args:
+        task: The input position and the path of the file to validate.
+
+    Returns:
+        The input position together with the validation result.
+    """
+    index, solution_path = task
+    return index, _validate_file(
+        _worker_rule_set, solution_path, _worker_exit_on_first_error, _worker_max_typo_suggestions
+    )
+
+
+def _reorder(results: Iterable[tuple[int, ValidationResult]]) -> Iterator[tuple[int, ValidationResult]]:
+    """Yields results in input order from a stream in completion order.
+
+    Args:
+        results: Pairs of input position and result, in any order.
+
+    Yields:
+        The same pairs, sorted by input position, as early as possible.
+    """
+    pending: dict[int, ValidationResult] = {}
+    next_index = 0
+    for index, result in results:
+        pending[index] = result
+        while next_index in pending:
+            yield next_index, pending.pop(next_index)
+            next_index += 1
+
+
+def validate_batch(
+    solution_paths: Sequence[Path],
+    rules_path: Path,
+    *,
+    jobs: int = 0,
+    keep_order: bool = False,
+    exit_on_first_error: bool = False,
+    log_level: LogLevel = LogLevel.ERROR,
+    cache_dir: Path | None = None,
+    cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    cache_rules: bool = False,
+    queued_logging: bool = False,
+    max_typo_suggestions: int | None = None,
+) -> Iterator[ValidationResult]:
+    """Validates many files against one rules file using a process pool.
+
+    Args:
+        solution_paths: The files to validate, e.g. from `expand_solution_paths`.
+        rules_path: The path to the JSON rules file.
+        jobs: The number of worker processes. 0 uses every available CPU, 1
+            validates in the current process without a pool.
+        keep_order: If True, results are yielded in the order of
+            `solution_paths` instead of completion order.
+        exit_on_first_error: If True, each file halts after its first failed rule.
+        log_level: The logging level for worker processes.
+        cache_dir: The directory of a result cache shared by all workers.
+            None disables caching.
+        cache_max_bytes: The size limit of the result cache directory.
+        cache_rules: If True, the compiled rules are cached next to the rules
+            file, so that workers load them instead of building them.
+        queued_logging: If True, worker processes log through a background
+            thread (see `setup_logging`).
+        max_typo_suggestions: The number of leading failures of each file
+            whose typo suggestion is analyzed, for example the failures that
+            will be displayed. None analyzes every failure.
+
+    Yields:
+        One `ValidationResult` per input file.
+
+    Raises:
+        FileNotFoundError: If the rules file does not exist.
+        RuleParsingError: If the rules file is invalid.
+    """
+    # Compiling once up front surfaces rule errors before any worker starts.
+    rule_set = CompiledRuleSet.from_file(
+        rules_path,
+        Console(logging.getLogger(__name__), is_quiet=True),
+        cache_dir=cache_dir,
+        cache_max_bytes=cache_max_bytes,
+        cache_rules=cache_rules,
+    )
+
+    tasks = list(enumerate(solution_paths))
+    jobs = jobs or os.cpu_count() or 1
+    jobs = min(jobs, len(tasks))
+
+    if jobs <= 1:
+        for solution_path in solution_paths:
+            yield _validate_file(rule_set, solution_path, exit_on_first_error, max_typo_suggestions)
+        return
+
+    chunksize = max(1, min(16, len(tasks) // (jobs * 4)))
+    with multiprocessing.Pool(
+        processes=jobs,
+        initializer=_init_worker,
+        initargs=(
+            rules_path,
+            log_level,
+            exit_on_first_error,
+            cache_dir,
+            cache_max_bytes,
+            queued_logging,
+            cache_rules,
+            max_typo_suggestions,
+        ),
+    ) as pool:
+        stream = pool.imap_unordered(_validate_in_worker, tasks, chunksize=chunksize)
+        if keep_order:
+            stream = _reorder(stream)
+        for _, result in stream:
+            yield result
+        # Let the workers exit normally, so that they write their queued logs.
+        pool.close()
+        pool.join()
@@ -0,0 +1,634 @@
+"""Provides an opt-in, content-addressed cache of validation results.
+
+Grading the same submission twice gives the same verdict as long as the
+source, the rules and the validator itself are unchanged. This module stores
+finished `ValidationResult` objects on disk, keyed by a hash of exactly those
+three inputs. A later run with an identical submission returns the stored
+verdict, failed rules, messages and typo suggestions without parsing the
+source or executing any rule.
+
+The cache is a plain directory of small JSON files, so several processes (for
+example batch workers) can share it safely: writes are atomic renames and a
+concurrently evicted entry is simply a miss. The directory is bounded in
+size; when it grows past the limit, the least recently used entries are
+removed first.
+
+Example:
+    .. code-block:: python
+
+        cache = ResultCache(Path(".validator-cache"), rules_data)
+        key = cache.key_for(source_code)
+        result = cache.get(key, "solution.py")
+        if result is None:
+            result = rule_set.validate_source(source_code, "solution.py")
+            cache.put(key, result)
+
+"""
+
+import ast
+import hashlib
+import io
+import json
+import os
+import pickle
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+from .config import DEFAULT_CACHE_MAX_BYTES, RuleFailure, ValidationResult
+
+# After an eviction the cache is trimmed to this fraction of its limit, so
+# that the next few writes do not trigger another directory scan.
+_EVICTION_TARGET = 0.9
+
+# The number of linter outcomes kept in memory by each process.
+DEFAULT_LINT_CACHE_ENTRIES = 1024
+
+# The subdirectory of a cache directory that holds linter outcomes.
+LINT_CACHE_SUBDIR = "lint"
+
+# A linter violation as stored in the cache: code, line, column and text.
+LintEntry = tuple[str, int, int, str]
+
+# The subdirectory of a cache directory that holds parsed syntax trees.
+AST_CACHE_SUBDIR = "ast"
+
+# Appended to the name of a rules file to name its compiled rules cache.
+RULES_CACHE_SUFFIX = ".cache"
+
+
+def _encode_json(value: Any) -> bytes:
+    """Serializes a cache entry as compact UTF-8 JSON."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _decode_json(data: bytes) -> Any:
+    """Deserializes a cache entry written by `_encode_json`."""
+    return json.loads(data.decode("utf-8"))
+
+
+class DiskCache:
+    """A size-bounded key-value store of documents in a directory.
+
+    Every entry lives in its own file under a two-character fan-out
+    directory. Reading an entry refreshes its modification time, which is
+    what the least-recently-used eviction is based on. Entries are JSON
+    documents unless `get` and `put` are given another encoding.
+
+    Attributes:
+        directory (Path): The root directory of the cache.
+        max_bytes (int): The size limit of all entries together.
+        suffix (str): The file name suffix of the entries.
+        hits (int): The number of successful lookups.
+        misses (int): The number of lookups that found nothing.
+        evictions (int): The number of entries removed to respect `max_bytes`.
+    """
+
+    def __init__(self, directory: Path, *, max_bytes: int = DEFAULT_CACHE_MAX_BYTES, suffix: str = ".json"):
+        """Initializes the cache and creates its directory if needed.
+
+        Args:
+            directory: The root directory of the cache.
+            max_bytes: The size limit of all entries together.
+            suffix: The file name suffix of the entries.
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._total_bytes: int | None = None
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path_for(self, key: str) -> Path:
+        """Returns the file that stores the entry for `key`."""
+        return self.directory / key[:2] / f"{key}{self.suffix}"
+
+    def get(self, key: str, *, decode: Callable[[bytes], Any] = _decode_json) -> Any | None:
+        """Looks up an entry and marks it as recently used.
+
+        Args:
+            key: The hexadecimal key of the entry.
+            decode: Turns the stored bytes back into the entry; JSON by default.
+
+        Returns:
+            The decoded document, or None if there is no usable entry.
+        """
+        path = self._path_for(key)
+        try:
+            value = decode(path.read_bytes())
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:
+            # A damaged entry is treated as missing and replaced on the next put.
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Any, *, encode: Callable[[Any], bytes] = _encode_json) -> None:
+        """Stores an entry, evicting old entries if the cache is too large.
+
+        Args:
+            key: The hexadecimal key of the entry.
+            value: The document to store, JSON-serializable by default.
+            encode: Turns the document into bytes; JSON by default.
+        """
+        data = encode(value)
+        path = self._path_for(key)
+        path.parent.mkdir(exist_ok=True)
+
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        if self._total_bytes is None:
+            self._total_bytes = sum(size for _, _, size in self._scan())
+        else:
+            self._total_bytes += len(data)
+        if self._total_bytes > self.max_bytes:
+            self._evict()
+
+    def _scan(self) -> list[tuple[float, Path, int]]:
+        """Lists all entries as (mtime, path, size) tuples."""
+        entries = []
+        for path in self.directory.glob(f"??/*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, path, stat.st_size))
+        return entries
+
+    def _evict(self) -> None:
+        """Removes least recently used entries until the cache fits its limit."""
+        entries = sorted(self._scan())
+        total = sum(size for _, _, size in entries)
+        target = int(self.max_bytes * _EVICTION_TARGET)
+
+        for _, path, size in entries:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            self.evictions += 1
+
+        self._total_bytes = total
+
+
+class ResultCache:
+    """Caches `ValidationResult` objects for one set of rules.
+
+    The cache key of a source combines the SHA-256 of the source text, the
+    SHA-256 of the normalized rules JSON, the package version and the
+    `exit_on_first_error` flag, which changes how many rules are reported.
+
+    Attributes:
+        rules_digest (str): The hash of the normalized rules JSON.
+        _store (DiskCache): The underlying on-disk store.
+        _version (str): The validator version that is part of every key.
+    """
+
+    def __init__(self, directory: Path, rules_data: dict[str, Any], *, max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        """Initializes the result cache.
+
+        Args:
+            directory: The root directory of the cache.
+            rules_data: The decoded content of the rules file.
+            max_bytes: The size limit of the cache directory.
+        """
+        from . import __version__
+
+        self._store = DiskCache(directory, max_bytes=max_bytes)
+        self._version = __version__
+        normalized_rules = json.dumps(rules_data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        self.rules_digest = hashlib.sha256(normalized_rules.encode("utf-8")).hexdigest()
+
+    @property
+    def hits(self) -> int:
+        """int: The number of lookups answered from the cache."""
+        return self._store.hits
+
+    @property
+    def misses(self) -> int:
+        """int: The number of lookups that required a real validation."""
+        return self._store.misses
+
+    @property
+    def evictions(self) -> int:
+        """int: The number of entries evicted by this process."""
+        return self._store.evictions
+
+    def key_for(self, source_code: str, *, exit_on_first_error: bool = False) -> str:
+        """Computes the cache key of a source for these rules.
+
+        Args:
+            source_code: The raw source code that is going to be validated.
+            exit_on_first_error: Whether validation halts after the first failure.
+
+        Returns:
+            A hexadecimal SHA-256 key.
+        """
+        source_digest = hashlib.sha256(source_code.encode("utf-8")).hexdigest()
+        key_material = f"{self._version}\0{self.rules_digest}\0{source_digest}\0{int(exit_on_first_error)}"
+        return hashlib.sha256(key_material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, solution_path: Path | str) -> ValidationResult | None:
+        """Returns the stored result for a key.
+
+        Args:
+            key: A key computed by `key_for`.
+            solution_path: The path to put into the returned result.
+
+        Returns:
+            The cached result, or None on a cache miss.
+        """
+        payload = self._store.get(key)
+        if payload is None:
+            return None
+        failures = tuple(RuleFailure(rule_id, message, typo) for rule_id, message, typo in payload["failures"])
+        return ValidationResult(solution_path, payload["is_valid"], failures, syntax_error=payload["syntax_error"])
+
+    def put(self, key: str, result: ValidationResult) -> None:
+        """Stores a finished result.
+
+        Results describing an I/O error are not stored, since they say
+        nothing about the source itself.
+
+        Args:
+            key: A key computed by `key_for`.
+            result: The result of validating the source the key was computed for.
+        """
+        if result.error is not None:
+            return
+        self._store.put(
+            key,
+            {
+                "is_valid": result.is_valid,
+                "syntax_error": result.syntax_error,
+                "failures": [[f.rule_id, f.message, f.typo_suggestion] for f in result.failures],
+            },
+        )
+
+
+class LintCache:
+    """Caches linter outcomes by source and linter settings.
+
+    Outcomes are kept in a per-process LRU memory tier and, once a directory
+    is attached, also in a `DiskCache` shared by all processes, so a source
+    that was linted before with the same settings costs a hash lookup. An
+    empty outcome means the source passed. If the disk tier fails, for
+    example because its directory was removed, it is dropped and only the
+    memory tier is used.
+
+    Attributes:
+        max_entries (int): The size limit of the memory tier.
+        hits (int): The number of lookups answered from either tier.
+        misses (int): The number of lookups that found nothing.
+        _memory (OrderedDict[str, tuple[LintEntry, ...]]): The memory tier, oldest first.
+        _disk (DiskCache | None): The on-disk tier, if a directory is attached.
+        _lock (threading.Lock): Guards the memory tier against concurrent threads.
+    """
+
+    def __init__(self, *, max_entries: int = DEFAULT_LINT_CACHE_ENTRIES):
+        """Initializes an empty cache without a disk tier.
+
+        Args:
+            max_entries: The size limit of the memory tier.
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._memory: OrderedDict[str, tuple[LintEntry, ...]] = OrderedDict()
+        self._disk: DiskCache | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self) -> Path | None:
+        """Path | None: The directory of the disk tier, if one is attached."""
+        return self._disk.directory if self._disk is not None else None
+
+    def attach_directory(self, directory: Path, *, max_bytes: int = DEFAULT_CACHE_MAX_BYTES) -> None:
+        """Adds a disk tier in `directory`, replacing any previous one.
+
+        Args:
+            directory: The root directory of the disk tier.
+            max_bytes: The size limit of the disk tier.
+        """
+        if self.directory != Path(directory):
+            self._disk = DiskCache(directory, max_bytes=max_bytes)
+
+    @staticmethod
+    def key_for(source_code: str, select: Sequence[str], ignore: Sequence[str], settings: str) -> str:
+        """Computes the cache key of a linter run.
+
+        Args:
+            source_code: The linted source code.
+            select: The selected error codes.
+            ignore: The ignored error codes.
+            settings: Everything else that affects the outcome, such as the
+                linter and plugin versions and its configuration.
+
+        Returns:
+            A hexadecimal SHA-256 key.
+        """
+        source_digest = hashlib.sha256(source_code.encode("utf-8")).hexdigest()
+        key_material = f"{settings}\0{','.join(select)}\0{','.join(ignore)}\0{source_digest}"
+        return hashlib.sha256(key_material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> tuple[LintEntry, ...] | None:
+        """Looks up the outcome of a linter run.
+
+        Args:
+            key: A key computed by `key_for`.
+
+        Returns:
+            The stored violations, or None on a cache miss.
+        """
+        with self._lock:
+            entries = self._memory.get(key)
+            if entries is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return entries
+
+        payload = None
+        if self._disk is not None:
+            try:
+                payload = self._disk.get(key)
+            except OSError:
+                # The disk tier is only an optimization; a lost directory must not fail linting.
+                self._disk = None
+        if payload is None:
+            self.misses += 1
+            return None
+
+        entries = tuple((code, line, column, text) for code, line, column, text in payload)
+        self._remember(key, entries)
+        self.hits += 1
+        return entries
+
+    def put(self, key: str, entries: Sequence[LintEntry]) -> None:
+        """Stores the outcome of a linter run in both tiers.
+
+        Args:
+            key: A key computed by `key_for`.
+            entries: The reported violations; empty if the source passed.
+        """
+        entries = tuple(entries)
+        self._remember(key, entries)
+        if self._disk is not None:
+            try:
+                self._disk.put(key, [list(entry) for entry in entries])
+            except OSError:
+                self._disk = None
+
+    def _remember(self, key: str, entries: tuple[LintEntry, ...]) -> None:
+        """Stores an outcome in the memory tier, evicting the oldest one if full."""
+        with self._lock:
+            self._memory[key] = entries
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+
+_lint_cache = LintCache()
+
+
+def get_lint_cache() -> LintCache:
+    """Returns the process-wide linter cache.
+
+    Returns:
+        The shared `LintCache` instance.
+    """
+    return _lint_cache
+
+
+def _load_tree(data: bytes) -> ast.Module:
+    """Unpickles a syntax tree written by `AstCache.put`.
+
+    Raises:
+        TypeError: If the entry does not hold a module.
+    """
+    tree = pickle.loads(data)
+    if not isinstance(tree, ast.Module):
+        raise TypeError(f"Expected a pickled ast.Module, got {type(tree).__name__}")
+    return tree
+
+
+class AstCache:
+    """Caches parsed and enriched syntax trees on disk.
+
+    An entry is a pickled tree together with its parent references and node
+    index, which loads considerably faster than parsing and enriching the
+    source again. Keys combine the SHA-256 of the source with the exact
+    Python version, whose `ast` classes the tree is made of, and the
+    validator version, which determines the enrichment.
+
+    Warning:
+        Loading an entry unpickles it, so the cache directory must only be
+        writable by trusted users.
+
+    Attributes:
+        _store (DiskCache): The underlying on-disk store.
+        _version (str): The Python and validator versions that are part of every key.
+    """
+
+    def __init__(self, directory: Path, *, max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        """Initializes the syntax tree cache.
+
+        Args:
+            directory: The root directory of the cache.
+            max_bytes: The size limit of the cache directory.
+        """
+        from . import __version__
+
+        self._store = DiskCache(directory, max_bytes=max_bytes, suffix=".pickle")
+        self._version = f"{sys.version}\0{__version__}"
+
+    @property
+    def hits(self) -> int:
+        """int: The number of trees loaded from the cache."""
+        return self._store.hits
+
+    @property
+    def misses(self) -> int:
+        """int: The number of sources that had to be parsed."""
+        return self._store.misses
+
+    def key_for(self, source_code: str) -> str:
+        """Computes the cache key of a source.
+
+        Args:
+            source_code: The raw source code.
+
+        Returns:
+            A hexadecimal SHA-256 key.
+        """
+        source_digest = hashlib.sha256(source_code.encode("utf-8")).hexdigest()
+        return hashlib.sha256(f"{self._version}\0{source_digest}".encode("utf-8")).hexdigest()
+
+    def get(self, source_code: str) -> ast.Module | None:
+        """Loads the tree of a source that was parsed before.
+
+        A damaged entry is removed and reported as a miss.
+
+        Args:
+            source_code: The raw source code.
+
+        Returns:
+            A new copy of the enriched tree, or None on a cache miss.
+        """
+        return self._store.get(self.key_for(source_code), decode=_load_tree)
+
+    def put(self, source_code: str, tree: ast.Module) -> None:
+        """Stores the enriched tree of a source.
+
+        Trees too deeply nested to be pickled are not stored.
+
+        Args:
+            source_code: The raw source code the tree was parsed from.
+            tree: The parsed and enriched tree.
+        """
+        try:
+            self._store.put(
+                self.key_for(source_code), tree, encode=lambda value: pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+            )
+        except RecursionError:
+            pass
+
+
+class _ConsolePickler(pickle.Pickler):
+    """Pickles rule objects, leaving out the console they print to."""
+
+    def __init__(self, file: io.BytesIO, console: Any):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self._console = console
+
+    def persistent_id(self, obj: Any) -> str | None:
+        return "console" if obj is self._console else None
+
+
+class _ConsoleUnpickler(pickle.Unpickler):
+    """Unpickles rule objects, connecting them to the current console."""
+
+    def __init__(self, file: io.BytesIO, console: Any):
+        super().__init__(file)
+        self._console = console
+
+    def persistent_load(self, pid: Any) -> Any:
+        if pid != "console":
+            raise pickle.UnpicklingError(f"Unknown persistent id: {pid!r}")
+        return self._console
+
+
+class RuleSetCache:
+    """Caches the rule objects built from a rules file next to that file.
+
+    The cache file is named after the rules file with `RULES_CACHE_SUFFIX`
+    appended. It starts with a key line, the hash of the rules file content
+    together with the Python and validator versions, followed by the pickled
+    rules. A cache file with another key, or one that cannot be loaded, is
+    ignored and replaced by the next `store`. The console the rules print to
+    is not stored; loaded rules print to the console of the current run.
+
+    Warning:
+        Loading the cache unpickles it, so the directory of the rules file
+        must only be writable by trusted users.
+
+    Attributes:
+        path (Path): The cache file.
+        _version (str): The Python and validator versions that are part of every key.
+    """
+
+    def __init__(self, rules_path: Path):
+        """Initializes the cache of one rules file.
+
+        Args:
+            rules_path: The path to the JSON rules file.
+        """
+        from . import __version__
+
+        rules_path = Path(rules_path)
+        self.path = rules_path.with_name(rules_path.name + RULES_CACHE_SUFFIX)
+        self._version = f"{sys.version}\0{__version__}"
+
+    def key_for(self, rules_bytes: bytes) -> str:
+        """Computes the cache key of a rules file.
+
+        Args:
+            rules_bytes: The raw content of the rules file.
+
+        Returns:
+            A hexadecimal SHA-256 key.
+        """
+        rules_digest = hashlib.sha256(rules_bytes).hexdigest()
+        return hashlib.sha256(f"{self._version}\0{rules_digest}".encode("utf-8")).hexdigest()
+
+    def load(self, rules_bytes: bytes, console: Any) -> list | None:
+        """Loads the rules compiled from exactly this rules file content.
+
+        Args:
+            rules_bytes: The raw content of the rules file.
+            console: The console the loaded rules print to.
+
+        Returns:
+            The rule objects in execution order, or None if there is no
+            usable cache.
+        """
+        try:
+            data = self.path.read_bytes()
+        except OSError:
+            return None
+
+        header, _, payload = data.partition(b"\n")
+        if header != self.key_for(rules_bytes).encode("ascii"):
+            return None
+        try:
+            rules = _ConsoleUnpickler(io.BytesIO(payload), console).load()
+        except Exception:
+            # A damaged cache file is rebuilt on the next store.
+            return None
+        return rules if isinstance(rules, list) else None
+
+    def store(self, rules_bytes: bytes, rules: list, console: Any) -> None:
+        """Stores the rules compiled from a rules file.
+
+        The cache is an optimization only: if it cannot be written, for
+        example because the directory is read-only, nothing is stored.
+
+        Args:
+            rules_bytes: The raw content of the rules file the rules were built from.
+            rules: The rule objects in execution order.
+            console: The console the rules print to, which is left out.
+        """
+        buffer = io.BytesIO()
+        buffer.write(self.key_for(rules_bytes).encode("ascii") + b"\n")
+        try:
+            _ConsolePickler(buffer, console).dump(rules)
+        except Exception:
+            return
+
+        try:
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(buffer.getvalue())
+            os.replace(tmp_name, self.path)
+        except OSError:
+            Path(tmp_name).unlink(missing_ok=True)
@@ -10,14 +10,18 @@ including robust top-level error handling to ensure meaningful exit codes.
 """
 
 import argparse
+import json
 import sys
 from pathlib import Path
 
 from . import __version__
-from .config import AppConfig, ExitCode, LogLevel
+from .batch import expand_solution_paths, is_batch_input, validate_batch
+from .config import DEFAULT_CACHE_MAX_BYTES, AppConfig, ExitCode, LogLevel, ValidationResult
 from .core import StaticValidator
 from .exceptions import CodeValidatorError
-from .output import Console, setup_logging
+from .output import RESULT_WRITERS, Console, ResultWriter, create_result_writer, report_failures, setup_logging
+from .profiling import Profiler
+from .server import DEFAULT_HOST, DEFAULT_PORT, DEFAULT_TIMEOUT, ValidationServer, discover_rule_files
 
 
 def setup_arg_parser() -> argparse.ArgumentParser:
@@ -36,7 +40,13 @@ def setup_arg_parser() -> argparse.ArgumentParser:
         description="Validates a Python source file against a set of JSON rules.",
     )
 
-    parser.add_argument("solution_path", type=Path, help="Path to the Python solution file to validate.")
+    parser.add_argument(
+        "solution_path",
+        type=Path,
+        nargs="+",
+        help="Path to the Python solution file to validate. Several files, directories or glob patterns "
+        "switch to batch mode.",
+    )
     parser.add_argument("rules_path", type=Path, help="Path to the JSON file with validation rules.")
 
     parser.add_argument(
@@ -45,10 +55,22 @@ def setup_arg_parser() -> argparse.ArgumentParser:
         default=LogLevel.ERROR,
         help="Set the logging level for stderr (TRACE, DEBUG, INFO, WARNING, ERROR, CRITICAL). Default: ERROR.",
     )
+    parser.add_argument(
+        "--async-log",
+        action="store_true",
+        help="Write logs and stdout output from background threads, so validation never waits on the terminal.",
+    )
     parser.add_argument(
         "--quiet", action="store_true", help="Suppress all stdout output (validation errors and final verdict)."
     )
     parser.add_argument("--no-verdict", action="store_true", help="Suppress stdout output verdict, show failed rules.")
+    parser.add_argument(
+        "--format",
+        choices=["text", *RESULT_WRITERS],
+        default="text",
+        help="Format of the results on stdout: human-readable text, or JSON Lines, a JSON array or SARIF with "
+        "one record per rule (per file in batch mode), written as results arrive. Default: text.",
+    )
     parser.add_argument(
         "--max-messages",
         type=int,
@@ -59,47 +81,301 @@ def setup_arg_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "-x", "--exit-on-first-error", action="store_true", help="Exit instantly on the first error found."
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Validate in batch mode with N worker processes. 0 uses all CPU cores. Default: all cores in batch mode.",
+    )
+    parser.add_argument(
+        "--keep-order", action="store_true", help="In batch mode, report results in input order instead of as ready."
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help="Reuse results of previously validated, identical sources from this directory. Default: no cache.",
+    )
+    parser.add_argument(
+        "--cache-max-size",
+        type=int,
+        default=DEFAULT_CACHE_MAX_BYTES // (1024 * 1024),
+        metavar="MB",
+        help=f"Size limit of the result cache in megabytes. Default: {DEFAULT_CACHE_MAX_BYTES // (1024 * 1024)}.",
+    )
+    parser.add_argument(
+        "--cache-rules",
+        action="store_true",
+        help="Store the compiled rules next to the rules file and reuse them while the file is unchanged.",
+    )
+    parser.add_argument(
+        "--profile", action="store_true", help="Print a table of the time spent in each validation phase to stderr."
+    )
+    parser.add_argument(
+        "--profile-output",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Write the timings of each validation phase as JSON to this file.",
+    )
     parser.add_argument("--version", "-v", action="version", version=f"%(prog)s {__version__}")
     return parser
 
 
+def setup_serve_arg_parser() -> argparse.ArgumentParser:
+    """Creates the argument parser for the ``validate-code serve`` command.
+
+    Returns:
+        argparse.ArgumentParser: The configured parser.
+    """
+    parser = argparse.ArgumentParser(
+        prog="validate-code serve",
+        description="Serves validation requests over HTTP with rule sets kept in memory.",
+    )
+    parser.add_argument(
+        "rules_path",
+        type=Path,
+        nargs="+",
+        help="JSON rules files or directories of them. Each rule set is requested by its file name stem.",
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Interface to listen on. Default: {DEFAULT_HOST}.")
+    parser.add_argument(
+        "--port", type=int, default=DEFAULT_PORT, help=f"TCP port to listen on. Default: {DEFAULT_PORT}."
+    )
+    parser.add_argument(
+        "--socket", type=Path, default=None, metavar="PATH", help="Listen on this Unix socket instead of TCP."
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Number of worker processes. 0 uses all CPU cores, 1 validates in the server process. Default: 0.",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        metavar="SECONDS",
+        help=f"Maximum time to wait for a verdict. Default: {DEFAULT_TIMEOUT:g}.",
+    )
+    parser.add_argument(
+        "--log",
+        type=LogLevel,
+        default=LogLevel.INFO,
+        help="Set the logging level for stderr (TRACE, DEBUG, INFO, WARNING, ERROR, CRITICAL). Default: INFO.",
+    )
+    parser.add_argument(
+        "--async-log",
+        action="store_true",
+        help="Write logs from background threads, so request handling never waits on the terminal.",
+    )
+    return parser
+
+
+def run_serve(argv: list[str]) -> ExitCode:
+    """Runs the validation server until it is interrupted.
+
+    Args:
+        argv: The arguments following ``serve`` on the command line.
+
+    Returns:
+        ExitCode.SUCCESS after a keyboard interrupt.
+
+    Raises:
+        FileNotFoundError: If a rules file does not exist.
+        RuleParsingError: If a rules file is invalid.
+    """
+    args = setup_serve_arg_parser().parse_args(argv)
+    console = Console(setup_logging(args.log, queued=args.async_log))
+
+    rule_files = discover_rule_files(args.rules_path)
+    with ValidationServer(
+        rule_files,
+        console,
+        jobs=args.jobs,
+        timeout=args.timeout,
+        log_level=args.log,
+        queued_logging=args.async_log,
+    ) as server:
+        http_server = server.create_http_server(args.host, args.port, socket_path=args.socket)
+        address = args.socket or f"http://{args.host}:{http_server.server_address[1]}"
+        console.print(f"Listening on {address}", level=LogLevel.INFO)
+        try:
+            http_server.serve_forever()
+        except KeyboardInterrupt:
+            console.print("Shutting down.", level=LogLevel.INFO)
+        finally:
+            http_server.server_close()
+
+    return ExitCode.SUCCESS
+
+
+def run_batch(args: argparse.Namespace, console: Console, writer: ResultWriter | None = None) -> ExitCode:
+    """Validates every solution matched by the CLI inputs in batch mode.
+
+    Each result is reported as soon as it arrives from the worker pool: a
+    ``PASS``/``FAIL`` line with the file path, followed by the numbered
+    failure messages, or a file record written by `writer`.
+
+    Args:
+        args: The parsed command-line arguments.
+        console: The console used for all output.
+        writer: The writer of a structured output format. None reports text.
+
+    Returns:
+        ExitCode.SUCCESS if every file passed, otherwise ExitCode.VALIDATION_FAILED.
+    """
+    solution_paths = expand_solution_paths(args.solution_path)
+    console.print(f"Batch mode: {len(solution_paths)} files, jobs={args.jobs}", level=LogLevel.INFO)
+
+    if writer is not None:
+        # Writers output every failure with its suggestion
+        max_typo_suggestions = None
+    elif not console.is_enabled(LogLevel.WARNING, show_user=True):
+        max_typo_suggestions = 0
+    else:
+        max_typo_suggestions = args.max_messages or None
+
+    total = failed = 0
+    for result in validate_batch(
+        solution_paths,
+        args.rules_path,
+        jobs=args.jobs or 0,
+        keep_order=args.keep_order,
+        exit_on_first_error=args.exit_on_first_error,
+        log_level=args.log,
+        cache_dir=args.cache_dir,
+        cache_max_bytes=args.cache_max_size * 1024 * 1024,
+        cache_rules=args.cache_rules,
+        queued_logging=args.async_log,
+        max_typo_suggestions=max_typo_suggestions,
+    ):
+        total += 1
+        if writer is not None:
+            failed += not result.is_valid
+            writer.write_file(result)
+            continue
+        if result.is_valid:
+            console.print(f"PASS {result.solution_path}", level=LogLevel.INFO, is_verdict=True)
+            continue
+
+        failed += 1
+        console.print(f"FAIL {result.solution_path}", level=LogLevel.WARNING, is_verdict=True)
+        if result.error:
+            console.print(result.error, level=LogLevel.ERROR, show_user=True)
+        elif result.syntax_error and not result.failures:
+            console.print(f"Syntax Error found: {result.syntax_error}", level=LogLevel.ERROR, show_user=True)
+        report_failures(console, result.failures, args.max_messages)
+
+    console.print(f"Validated {total} files: {total - failed} passed, {failed} failed.", level=LogLevel.INFO)
+    return ExitCode.SUCCESS if failed == 0 else ExitCode.VALIDATION_FAILED
+
+
+def write_profile(profiler: Profiler, args: argparse.Namespace, console: Console) -> None:
+    """Outputs the timings collected during the run.
+
+    Args:
+        profiler: The profiler that was active during the run.
+        args: The parsed command-line arguments.
+        console: The console used for logging.
+    """
+    if args.profile:
+        print(profiler.format_table(), file=sys.stderr)
+    if args.profile_output:
+        args.profile_output.write_text(json.dumps(profiler.report(), indent=2), encoding="utf-8")
+        console.print(f"Profile written to: {args.profile_output}", level=LogLevel.INFO)
+
+
 def run_from_cli() -> None:
     """Runs the full application lifecycle from the command line.
 
-    This is the main entry point for the `validate-code` script. It performs
-    the following steps:
+    This is the main entry point for the `validate-code` script. The
+    ``validate-code serve ...`` form starts the validation server instead
+    (see `run_serve`). Otherwise it performs the following steps:
     1. Parses command-line arguments.
     2. Initializes the logger, console, and configuration.
-    3. Instantiates and runs the `StaticValidator`.
+    3. Instantiates and runs the `StaticValidator`, or the batch runner when
+       several files, a directory or a glob pattern are given. With a
+       structured ``--format``, results are written by a `ResultWriter`.
     4. Handles all top-level exceptions and exits with an appropriate status code.
 
     Raises:
         SystemExit: This function will always terminate the process with an
             exit code defined in the `ExitCode` enum.
     """
+    if sys.argv[1:2] == ["serve"]:
+        try:
+            sys.exit(run_serve(sys.argv[2:]))
+        except CodeValidatorError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(ExitCode.VALIDATION_FAILED)
+        except FileNotFoundError as e:
+            print(f"Error: Input file not found: {e.filename}", file=sys.stderr)
+            sys.exit(ExitCode.FILE_NOT_FOUND)
+
     parser = setup_arg_parser()
     args = parser.parse_args()
 
-    logger = setup_logging(args.log)
-    console = Console(logger, is_quiet=args.quiet, show_verdict=not args.no_verdict)
+    logger = setup_logging(args.log, queued=args.async_log)
+    # Structured output owns stdout; text messages would corrupt it
+    writer = create_result_writer(args.format, sys.stdout) if args.format != "text" else None
+    console = Console(
+        logger,
+        is_quiet=args.quiet or writer is not None,
+        show_verdict=not args.no_verdict,
+        buffered_output=args.async_log,
+    )
     console.print(f"Level of logging: {args.log}", level=LogLevel.DEBUG)
+
     config = AppConfig(
-        solution_path=args.solution_path,
+        solution_path=args.solution_path[0],
         rules_path=args.rules_path,
         log_level=args.log,
         is_quiet=args.quiet,
         exit_on_first_error=args.exit_on_first_error,
         max_messages=args.max_messages,
+        cache_dir=args.cache_dir,
+        cache_max_bytes=args.cache_max_size * 1024 * 1024,
+        cache_rules=args.cache_rules,
     )
-    console.print(f"Config is: {config}", level=LogLevel.TRACE)
+    console.print("Config is: %s", config, level=LogLevel.TRACE)
+
+    profiler = Profiler() if args.profile or args.profile_output else None
+    if profiler is not None:
+        profiler.start()
+    if writer is not None:
+        writer.start()
 
     try:
+        if args.jobs is not None or is_batch_input(args.solution_path):
+            if profiler is not None and args.jobs != 1:
+                console.print(
+                    "Profiling covers only this process; use --jobs 1 to include the validation of each file.",
+                    level=LogLevel.WARNING,
+                )
+            sys.exit(run_batch(args, console, writer))
+
         console.print(f"Starting validation for: {config.solution_path}", level=LogLevel.INFO)
         validator = StaticValidator(config, console)
 
         console.print("Start of validation..", level=LogLevel.TRACE)
-        is_valid = validator.run()
+        if writer is None:
+            is_valid = validator.run()
+        else:
+            for result in validator.iter_results():
+                writer.write_rule(config.solution_path, result)
+            is_valid = validator.is_valid
+            writer.write_file(
+                ValidationResult(config.solution_path, is_valid, validator.failures, validator.syntax_error)
+            )
         console.print(f"End of validation with result: {is_valid = }", level=LogLevel.TRACE)
+        if (cache := validator.result_cache) is not None:
+            console.print(f"Result cache: {cache.hits} hits, {cache.misses} misses.", level=LogLevel.DEBUG)
 
         if is_valid:
             console.print("Validation successful.", level=LogLevel.INFO, is_verdict=True)
@@ -126,3 +402,10 @@ def run_from_cli() -> None:
             exc_info=True,
         )
         sys.exit(ExitCode.UNEXPECTED_ERROR)
+    finally:
+        if writer is not None:
+            writer.finish()
+        if profiler is not None:
+            profiler.stop()
+            write_profile(profiler, args, console)
+        console.flush()
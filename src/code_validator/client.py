@@ -0,0 +1,201 @@
+"""A minimal client for the validation server.
+
+The client keeps one HTTP/1.1 connection open and reuses it for every
+request, so repeated validations only pay for the round trip and the
+validation itself. It talks to a server started with ``validate-code serve``
+over TCP or over a Unix socket. A client is not thread-safe; use one client
+per thread.
+
+It can also be run from the command line to validate a file against a
+running server:
+
+.. code-block:: bash
+
+    validate-code serve rules/ --port 8765 &
+    python -m code_validator.client solution.py --rules lab1 --url http://127.0.0.1:8765
+
+Example:
+    .. code-block:: python
+
+        with ValidationClient("http://127.0.0.1:8765") as client:
+            result = client.validate(Path("solution.py").read_text(), "lab1")
+            print(result.is_valid, result.failed_rules_id)
+
+"""
+
+import argparse
+import http.client
+import json
+import socket
+import sys
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+from .config import ExitCode, ValidationResult
+from .exceptions import ServerRequestError
+from .server import DEFAULT_HOST, DEFAULT_PORT
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """An HTTP connection over a Unix domain socket."""
+
+    def __init__(self, socket_path: Path, timeout: float):
+        """Initializes the connection to the socket file at `socket_path`."""
+        super().__init__("localhost", timeout=timeout)
+        self._socket_path = str(socket_path)
+
+    def connect(self) -> None:
+        """Connects to the Unix socket."""
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self._socket_path)
+
+
+class ValidationClient:
+    """Sends validation requests to a running `ValidationServer`.
+
+    Attributes:
+        _connection (http.client.HTTPConnection): The reused connection.
+    """
+
+    def __init__(
+        self,
+        url: str = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}",
+        *,
+        socket_path: Path | None = None,
+        timeout: float = 30.0,
+    ):
+        """Initializes the client. The connection is opened on first use.
+
+        Args:
+            url: The base URL of a server listening on TCP.
+            socket_path: The Unix socket of the server. Takes precedence over `url`.
+            timeout: The socket timeout in seconds.
+        """
+        if socket_path is not None:
+            self._connection: http.client.HTTPConnection = _UnixHTTPConnection(socket_path, timeout)
+        else:
+            parts = urlsplit(url)
+            self._connection = http.client.HTTPConnection(
+                parts.hostname or DEFAULT_HOST, parts.port or DEFAULT_PORT, timeout=timeout
+            )
+
+    def __enter__(self) -> "ValidationClient":
+        """Returns the client itself."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Closes the connection."""
+        self.close()
+
+    def close(self) -> None:
+        """Closes the connection."""
+        self._connection.close()
+
+    def _request(self, method: str, path: str, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Sends a request and decodes the JSON response.
+
+        A request on a connection that the server has closed is retried once
+        on a new connection.
+
+        Raises:
+            ServerRequestError: If the server answers with an error status.
+        """
+        data = json.dumps(body).encode("utf-8") if body is not None else None
+        headers = {"Content-Type": "application/json"} if data is not None else {}
+
+        for attempt in range(2):
+            try:
+                self._connection.request(method, path, body=data, headers=headers)
+                response = self._connection.getresponse()
+                payload = json.loads(response.read() or b"{}")
+                break
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                self._connection.close()
+                if attempt:
+                    raise
+
+        if response.will_close:
+            self._connection.close()
+        if response.status != 200:
+            raise ServerRequestError(payload.get("error", response.reason), response.status)
+        return payload
+
+    def health(self) -> dict[str, Any]:
+        """Fetches the state of the server.
+
+        Returns:
+            The decoded ``/health`` response.
+        """
+        return self._request("GET", "/health")
+
+    def validate(
+        self,
+        source_code: str,
+        rules_id: str | None = None,
+        *,
+        path: str = "<string>",
+        exit_on_first_error: bool = False,
+    ) -> ValidationResult:
+        """Validates a source on the server.
+
+        Args:
+            source_code: The source code to validate.
+            rules_id: The id of the rule set. May be omitted if the server
+                serves a single rule set.
+            path: The display name of the source, returned in the result.
+            exit_on_first_error: If True, halts after the first failed rule.
+
+        Returns:
+            The validation result.
+
+        Raises:
+            ServerRequestError: If the request was rejected, timed out on the
+                server or the rule set is unknown.
+        """
+        body: dict[str, Any] = {"source": source_code, "path": path, "exit_on_first_error": exit_on_first_error}
+        if rules_id is not None:
+            body["rules"] = rules_id
+        return ValidationResult.from_dict(self._request("POST", "/validate", body))
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Validates files against a running server and prints the verdicts.
+
+    Args:
+        argv: The command-line arguments, without the program name.
+
+    Returns:
+        The exit code: success if every file passed.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m code_validator.client", description="Validates files on a running validation server."
+    )
+    parser.add_argument("solution_path", type=Path, nargs="*", help="Python files to validate.")
+    parser.add_argument("--rules", default=None, metavar="ID", help="The rule set id. Optional for a single set.")
+    parser.add_argument("--url", default=f"http://{DEFAULT_HOST}:{DEFAULT_PORT}", help="The server URL.")
+    parser.add_argument("--socket", type=Path, default=None, metavar="PATH", help="The Unix socket of the server.")
+    parser.add_argument("--health", action="store_true", help="Print the server state instead of validating.")
+    args = parser.parse_args(argv)
+
+    with ValidationClient(args.url, socket_path=args.socket) as client:
+        if args.health:
+            print(json.dumps(client.health(), indent=2))
+            return ExitCode.SUCCESS
+
+        failed = 0
+        for solution_path in args.solution_path:
+            result = client.validate(solution_path.read_text(encoding="utf-8"), args.rules, path=str(solution_path))
+            print(f"{'PASS' if result.is_valid else 'FAIL'} {result.solution_path}")
+            if result.syntax_error:
+                print(f"  Syntax Error found: {result.syntax_error}")
+            for failure in result.failures:
+                print(f"  [{failure.rule_id}] {failure.message}")
+            failed += not result.is_valid
+
+    return ExitCode.SUCCESS if failed == 0 else ExitCode.VALIDATION_FAILED
+
+
+if __name__ == "__main__":
+    sys.exit(main())
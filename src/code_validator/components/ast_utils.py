@@ -6,21 +6,261 @@ various components of the validator to simplify complex tree analysis.
 """
 
 import ast
+from bisect import bisect_left
+from typing import Iterator
 
+from ..cache import AstCache
+from ..profiling import profile_phase
+from .source_buffer import SourceBuffer
 
-def enrich_ast_with_parents(tree: ast.Module) -> None:
-    """Walks the AST and adds a 'parent' attribute to each node.
+# Name of the attribute under which the index is stored on an enriched tree.
+_INDEX_ATTR = "_code_validator_index"
+
+# Name of the attribute under which `parse_source` stores the parsed text.
+_SOURCE_ATTR = "_code_validator_source"
+
+
+class AstIndex:
+    """A node-type index of a single AST, built in one traversal.
+
+    The index keeps every node of the tree in depth-first (pre-order) order,
+    together with the extent of each node's subtree. This makes two kinds of
+    queries cheap: "all nodes of these types" and "all nodes of these types
+    inside this subtree". Results are yielded lazily in the same
+    breadth-first order that `ast.walk` would produce, so switching a
+    selector from `ast.walk` to the index does not change its output.
+
+    `ast.walk` visits nodes by depth, and nodes of equal depth in pre-order,
+    so the positions of each type are kept per depth: a query bisects the
+    subtree's range out of each depth and yields one depth at a time.
+
+    Attributes:
+        _nodes (list[ast.AST]): All nodes in pre-order.
+        _positions (dict[int, int]): Maps `id(node)` to its pre-order position.
+        _subtree_end (list[int]): For each position, the position after its subtree.
+        _depths (list[int]): For each position, the depth of the node.
+        _levels_by_type (dict[type, list[list[int]]]): For each node type, the
+            sorted pre-order positions of its nodes at each depth.
+    """
+
+    def __init__(
+        self,
+        nodes: list[ast.AST],
+        positions: dict[int, int],
+        subtree_end: list[int],
+        depths: list[int],
+        levels_by_type: dict[type, list[list[int]]],
+    ):
+        """Initializes the index from data collected by `enrich_ast_with_parents`.
+
+        Args:
+            nodes: All nodes in pre-order.
+            positions: Maps `id(node)` to its pre-order position.
+            subtree_end: For each position, the position after its subtree.
+            depths: For each position, the depth of the node.
+            levels_by_type: For each node type, the sorted pre-order
+                positions of its nodes at each depth.
+        """
+        self._nodes = nodes
+        self._positions = positions
+        self._subtree_end = subtree_end
+        self._depths = depths
+        self._levels_by_type = levels_by_type
+        self._resolved_types: dict[tuple[type, ...], tuple[type, ...]] = {}
+
+    def __getstate__(self) -> dict:
+        """Returns the picklable state, without the identity-based lookup tables."""
+        state = self.__dict__.copy()
+        del state["_positions"], state["_resolved_types"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restores a pickled index, rebuilding the lookup tables for the new node objects."""
+        self.__dict__.update(state)
+        self._positions = {id(node): position for position, node in enumerate(self._nodes)}
+        self._resolved_types = {}
+
+    def nodes_of_type(self, node_types: type | tuple[type, ...], within: ast.AST | None = None) -> Iterator[ast.AST]:
+        """Yields all indexed nodes that are instances of the given types.
+
+        Nodes are looked up one depth at a time as they are consumed, so a
+        caller that stops early skips the deeper levels of the lookup.
+
+        Args:
+            node_types: An AST class or a tuple of classes. Abstract classes
+                such as `ast.stmt` match all of their concrete subclasses.
+            within: If given, only nodes inside this subtree (including the
+                node itself) are yielded.
+
+        Returns:
+            An iterator over the matching nodes, in `ast.walk` order.
+        """
+        if within is None:
+            return self._iter_nodes(self._resolve(node_types), 0, len(self._nodes), 0)
+
+        start = self._positions.get(id(within))
+        if start is None or self._nodes[start] is not within:
+            # The node does not belong to the indexed tree.
+            return (node for node in ast.walk(within) if isinstance(node, node_types))
+        return self._iter_nodes(self._resolve(node_types), start, self._subtree_end[start], self._depths[start])
+
+    def _iter_nodes(self, node_types: tuple[type, ...], start: int, end: int, depth: int) -> Iterator[ast.AST]:
+        """Yields the nodes of the given types between two pre-order positions, depth by depth.
+
+        Args:
+            node_types: Concrete node types present in the tree.
+            start: The first pre-order position of the range.
+            end: The pre-order position after the range.
+            depth: The depth of the node at `start`, the shallowest in the range.
+
+        Yields:
+            The matching nodes, in `ast.walk` order.
+        """
+        typed_levels = [self._levels_by_type[node_type] for node_type in node_types]
+        max_depth = max(map(len, typed_levels), default=0)
+        nodes = self._nodes
+        for level in range(depth, max_depth):
+            # Only one depth is gathered at a time; sorting it beats a lazy merge of the types.
+            found: list[int] = []
+            for levels in typed_levels:
+                if level < len(levels):
+                    positions = levels[level]
+                    low = bisect_left(positions, start)
+                    high = bisect_left(positions, end, low)
+                    if low < high:
+                        found += positions[low:high]
+            if len(typed_levels) > 1:
+                found.sort()
+            yield from map(nodes.__getitem__, found)
+
+    def _resolve(self, node_types: type | tuple[type, ...]) -> tuple[type, ...]:
+        """Expands requested types to the concrete node types present in the tree."""
+        key = node_types if isinstance(node_types, tuple) else (node_types,)
+        resolved = self._resolved_types.get(key)
+        if resolved is None:
+            resolved = tuple(t for t in self._levels_by_type if issubclass(t, key))
+            self._resolved_types[key] = resolved
+        return resolved
+
+
+def enrich_ast_with_parents(tree: ast.Module) -> AstIndex:
+    """Walks the AST, adds a 'parent' attribute to each node and indexes it.
 
     This function mutates the AST in-place, making it easier to traverse upwards
     or determine the context of a specific node. This is a crucial preprocessing
     step for many complex validation rules.
 
+    The same traversal builds an `AstIndex` of the tree, which is attached to
+    the tree and can be retrieved later with `get_ast_index`.
+
     Args:
         tree: The root node of the AST (typically an ast.Module object) to enrich.
+
+    Returns:
+        The index built for the tree.
     """
-    for node in ast.walk(tree):
-        for child in ast.iter_child_nodes(node):
+    nodes: list[ast.AST] = []
+    positions: dict[int, int] = {}
+    levels_by_type: dict[type, list[list[int]]] = {}
+    depths: list[int] = []
+    iter_child_nodes = ast.iter_child_nodes
+
+    # Iterative pre-order traversal that links parents on the way down.
+    stack: list[tuple[ast.AST, int]] = [(tree, 0)]
+    while stack:
+        node, depth = stack.pop()
+        position = len(nodes)
+        nodes.append(node)
+        positions[id(node)] = position
+        depths.append(depth)
+        levels = levels_by_type.get(type(node))
+        if levels is None:
+            levels = levels_by_type[type(node)] = []
+        while len(levels) <= depth:
+            levels.append([])
+        # Pre-order visits each depth in increasing position, so the lists stay sorted.
+        levels[depth].append(position)
+
+        children = list(iter_child_nodes(node))
+        child_depth = depth + 1
+        for child in children:
             child.parent = node
+        for child in reversed(children):
+            stack.append((child, child_depth))
+
+    # A subtree ends at the next node that is not deeper than its root.
+    subtree_end = [0] * len(nodes)
+    open_positions: list[int] = []
+    for position, depth in enumerate(depths):
+        while open_positions and depths[open_positions[-1]] >= depth:
+            subtree_end[open_positions.pop()] = position
+        open_positions.append(position)
+    for position in open_positions:
+        subtree_end[position] = len(nodes)
+
+    index = AstIndex(nodes, positions, subtree_end, depths, levels_by_type)
+    setattr(tree, _INDEX_ATTR, index)
+    return index
+
+
+def get_ast_index(tree: ast.AST) -> AstIndex | None:
+    """Returns the index attached to a tree by `enrich_ast_with_parents`.
+
+    Args:
+        tree: The root node of the AST.
+
+    Returns:
+        The tree's index, or None if the tree was never enriched.
+    """
+    return getattr(tree, _INDEX_ATTR, None)
+
+
+def parse_source(source_code: str, cache: AstCache | None = None) -> ast.Module:
+    """Parses source code into an AST that is ready for rule execution.
+
+    This is the single place where the validator turns source text into a
+    tree, so every consumer gets an AST with the same preprocessing applied.
+    With a cache, a source that was parsed before is loaded from it instead.
+
+    Args:
+        source_code: The raw Python source code to parse.
+        cache: An optional cache of enriched trees.
+
+    Returns:
+        The parsed module, enriched with parent references and carrying its
+        source text as a `SourceBuffer` (see `get_source_buffer`).
+
+    Raises:
+        SyntaxError: If the source code is not valid Python.
+    """
+    tree = None
+    if cache is not None:
+        with profile_phase("ast_cache"):
+            tree = cache.get(source_code)
+
+    if tree is None:
+        with profile_phase("parse"):
+            tree = ast.parse(source_code)
+        with profile_phase("enrich"):
+            enrich_ast_with_parents(tree)
+        if cache is not None:
+            with profile_phase("ast_cache"):
+                cache.put(source_code, tree)
+
+    setattr(tree, _SOURCE_ATTR, SourceBuffer(source_code))
+    return tree
+
+
+def get_source_buffer(tree: ast.AST) -> SourceBuffer | None:
+    """Returns the source text attached to a tree by `parse_source`.
+
+    Args:
+        tree: The root node of the AST.
+
+    Returns:
+        The tree's source buffer, or None if the tree was parsed elsewhere.
+    """
+    return getattr(tree, _SOURCE_ATTR, None)
 
 
 def get_full_name(node: ast.AST) -> str | None:
@@ -0,0 +1,100 @@
+"""Holds the state of a single rule execution.
+
+Rule, selector and constraint objects are built once per rule set and then
+reused for every source it validates, possibly by several threads at once.
+Everything that belongs to one validation — the path of the source and the
+typo suggestions of its failed rules — therefore lives in an
+`ExecutionContext` that is created per validation and passed through
+`Rule.execute` down to the constraints, instead of on the shared objects.
+"""
+
+import threading
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from .definitions import Rule
+    from .typo_detection import TypoDetector
+
+# A typo suggestion, or a callable that runs the analysis producing it.
+DeferredTypoSuggestion = str | Callable[[], str | None] | None
+
+
+class ExecutionContext:
+    """The per-validation state of executing a rule set against one source.
+
+    A context belongs to one validation and must not be shared between
+    concurrent validations; the rule set it is used with may be.
+
+    Typo suggestions are stored per rule as prepared by the constraints: a
+    callable runs the analysis on first access, and its result replaces it,
+    so the analysis runs at most once however often the suggestion is read.
+
+    Attributes:
+        file_path (str): The path or display name of the validated source,
+            used in typo suggestions.
+        _typo_suggestions (dict[Rule, DeferredTypoSuggestion]): The typo
+            suggestions of the failed rules.
+        _typo_detector (TypoDetector | None): The detector for typo analysis,
+            created on first use.
+        _lock (threading.Lock): Guards the deferred typo suggestions in
+            `_typo_suggestions`, which may be resolved from a thread other
+            than the one executing the rules, so each analysis runs once.
+    """
+
+    def __init__(self, file_path: str = "<unknown>"):
+        """Initializes an empty context.
+
+        Args:
+            file_path: The path or display name of the validated source.
+        """
+        self.file_path = file_path
+        self._typo_suggestions: dict["Rule", DeferredTypoSuggestion] = {}
+        self._typo_detector: "TypoDetector | None" = None
+        self._lock = threading.Lock()
+
+    @property
+    def typo_detector(self) -> "TypoDetector":
+        """TypoDetector: The detector used for the typo analysis of this validation."""
+        if self._typo_detector is None:
+            # Lazy import to avoid circular dependencies
+            from .typo_detection import TypoDetector
+
+            self._typo_detector = TypoDetector()
+        return self._typo_detector
+
+    def set_typo_suggestion(self, rule: "Rule", suggestion: DeferredTypoSuggestion) -> None:
+        """Stores the typo suggestion of a rule, replacing an earlier one.
+
+        Args:
+            rule: The executed rule.
+            suggestion: The suggestion, a callable producing it, or None.
+        """
+        if suggestion is None:
+            self._typo_suggestions.pop(rule, None)
+        else:
+            self._typo_suggestions[rule] = suggestion
+
+    def deferred_typo_suggestion(self, rule: "Rule") -> DeferredTypoSuggestion:
+        """Returns the typo suggestion of a rule without running a pending analysis."""
+        return self._typo_suggestions.get(rule)
+
+    def typo_suggestion(self, rule: "Rule") -> str | None:
+        """Returns the typo suggestion of a rule, running its analysis if needed.
+
+        Args:
+            rule: The executed rule.
+
+        Returns:
+            The suggestion message, or None if the rule has none.
+        """
+        suggestion = self._typo_suggestions.get(rule)
+        if not callable(suggestion):
+            return suggestion
+
+        # Results may be reported from another thread than the one executing
+        with self._lock:
+            suggestion = self._typo_suggestions.get(rule)
+            if callable(suggestion):
+                suggestion = suggestion()
+                self._typo_suggestions[rule] = suggestion
+        return suggestion
@@ -12,6 +12,7 @@ import ast
 from typing import Protocol, runtime_checkable
 
 from ..config import FullRuleConfig, ShortRuleConfig
+from .context import ExecutionContext
 
 
 @runtime_checkable
@@ -21,6 +22,10 @@ class Selector(Protocol):
     A Selector's main responsibility is to traverse the Abstract Syntax Tree (AST)
     of a Python source file and return a list of nodes that match a specific
     criterion (e.g., all function definitions, all import statements).
+
+    Selectors may also provide an ``iter_select(tree)`` method that yields the
+    same nodes lazily, in the same order. Rules use it to stop the search as
+    soon as the constraint has seen enough nodes.
     """
 
     def select(self, tree: ast.Module) -> list[ast.AST]:
@@ -43,6 +48,15 @@ class Constraint(Protocol):
     A Constraint takes the list of nodes found by a Selector and checks if they
     satisfy a specific condition (e.g., the list must not be empty, the node
     must inherit from a specific class).
+
+    Constraints whose verdict is decided by the first few nodes may declare a
+    ``max_nodes`` attribute. Rules then pass them at most that many nodes,
+    which must yield the same result as checking the complete list.
+
+    Constraints that need the state of the current validation, such as typo
+    detection, may provide a ``check_with_context`` method that also receives
+    the `ExecutionContext`. Constraints must not keep per-validation state of
+    their own, as one instance serves every validation of its rule set.
     """
 
     def check(self, nodes: list[ast.AST]) -> bool:
@@ -66,16 +80,20 @@ class Rule(Protocol):
     a Selector and a Constraint. The core validator engine interacts with
     objects conforming to this protocol.
 
+    A rule may be executed by several threads at once for different sources,
+    so anything produced by one execution, such as a typo suggestion, is
+    stored in the `ExecutionContext` rather than on the rule.
+
     Attributes:
         config: The dataclass object holding the configuration for this rule,
             parsed from the JSON file.
-        typo_suggestion: Optional typo suggestion message for user display.
     """
 
     config: FullRuleConfig | ShortRuleConfig
-    typo_suggestion: str | None
 
-    def execute(self, tree: ast.Module | None, source_code: str | None = None) -> bool:
+    def execute(
+        self, tree: ast.Module | None, source_code: str | None = None, context: ExecutionContext | None = None
+    ) -> bool:
         """Executes the validation rule.
 
         Depending on the rule type, this method might operate on the AST, the
@@ -84,6 +102,8 @@ class Rule(Protocol):
         Args:
             tree: The full AST of the source code (for structural checks).
             source_code: The raw source code string (e.g., for linter checks).
+            context: The state of the current validation. None uses a fresh
+                context whose state is discarded.
 
         Returns:
             True if the validation check passes, False otherwise.
@@ -102,10 +102,10 @@ class RuleFactory:
                 required keys, or specifies an unknown type.
         """
         rule_id = rule_config.get("rule_id")
-        self._console.print(f"Start parsing rule ({rule_id}):\n{rule_config}", level=LogLevel.TRACE)
+        self._console.print("Start parsing rule (%s):\n%s", rule_id, rule_config, level=LogLevel.TRACE)
         try:
             if "type" in rule_config:
-                self._console.print(f"Rule {rule_id} is shorted rule - {rule_config['type']}", level=LogLevel.DEBUG)
+                self._console.print("Rule %s is shorted rule - %s", rule_id, rule_config["type"], level=LogLevel.DEBUG)
                 config = _create_dataclass_from_dict(ShortRuleConfig, rule_config)
                 return self._create_short_rule(config)
 
@@ -126,7 +126,7 @@ class RuleFactory:
                 )
 
                 check_cfg = FullRuleCheck(selector=selector_cfg, constraint=constraint_cfg)
-                self._console.print(f"Create FullRuleCheck: {check_cfg}", level=LogLevel.TRACE)
+                self._console.print("Create FullRuleCheck: %s", check_cfg, level=LogLevel.TRACE)
 
                 config = FullRuleConfig(
                     rule_id=rule_config["rule_id"],
@@ -134,7 +134,7 @@ class RuleFactory:
                     check=check_cfg,
                     is_critical=rule_config.get("is_critical", False),
                 )
-                self._console.print(f"Create FullRuleConfig: {config}", level=LogLevel.TRACE)
+                self._console.print("Create FullRuleConfig: %s", config, level=LogLevel.TRACE)
                 return FullRuleHandler(config, selector, constraint, self._console)
             else:
                 self._console.print(f"Invalid syntax of rule: {rule_id}", level=LogLevel.WARNING)
@@ -0,0 +1,300 @@
+"""Runs flake8 checks inside the current Python process.
+
+Launching ``python -m flake8`` for every rule and every submission pays for
+interpreter startup and plugin discovery each time. This module instead
+builds flake8's plugin registry and option parser once per process and
+reuses them for every source. Sources are checked straight from memory,
+without temporary files or stdin.
+
+The engine relies on flake8's internal modules (plugin finder, option
+aggregation and `FileChecker`) and mirrors what ``flake8 -`` does for a
+single source read from stdin. Select/ignore semantics and ``# noqa`` comments
+behave exactly as they do on the command line.
+"""
+
+import argparse
+import io
+import threading
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+import flake8
+from flake8 import checker, processor
+from flake8.main import options as main_options
+from flake8.options import aggregator, config, manager
+from flake8.plugins import finder
+from flake8.style_guide import Decision, DecisionEngine
+from flake8.violation import Violation
+
+from ..cache import LintCache, get_lint_cache
+from ..profiling import profile_phase
+
+# Display name flake8 uses for sources read from stdin.
+STDIN_DISPLAY_NAME = "stdin"
+
+
+@dataclass(frozen=True)
+class LintViolation:
+    """A single problem reported by flake8.
+
+    Attributes:
+        code: The error code, e.g. "E302".
+        line: The line number (1-based).
+        column: The column number (1-based).
+        text: The description of the problem.
+    """
+
+    code: str
+    line: int
+    column: int
+    text: str
+
+    def format(self, filename: str = STDIN_DISPLAY_NAME) -> str:
+        """Formats the violation like flake8's default output.
+
+        Args:
+            filename: The file name to show at the start of the line.
+
+        Returns:
+            A string such as ``stdin:1:1: E302 expected 2 blank lines``.
+        """
+        return f"{filename}:{self.line}:{self.column}: {self.code} {self.text}"
+
+
+class _SourceChecker(checker.FileChecker):
+    """A flake8 `FileChecker` for an in-memory source instead of a file on disk."""
+
+    def __init__(self, *, lines: list[str], **kwargs: Any):
+        self._lines = lines
+        super().__init__(filename=STDIN_DISPLAY_NAME, **kwargs)
+
+    def _make_processor(self) -> processor.FileProcessor:
+        return processor.FileProcessor(self.filename, self.options, lines=self._lines)
+
+
+class Flake8Engine:
+    """Checks source code with flake8 without spawning a subprocess.
+
+    Creating an engine discovers and loads flake8 plugins and reads flake8's
+    configuration files; both happen once. Parsed options are cached per
+    select/ignore combination, so repeated checks only pay for the actual
+    linting. With a `LintCache`, a source that was checked before with the
+    same settings is not linted again.
+
+    `check_async` lints a source on a background thread. A `check` for the
+    same source and settings waits for that run instead of linting again.
+
+    Attributes:
+        cache (LintCache | None): The cache of linter outcomes, if any.
+        _plugins: The loaded flake8 plugins.
+        _option_manager: flake8's option manager with all plugin options registered.
+        _prelim_parser: flake8's preliminary argument parser.
+        _cfg: The parsed flake8 configuration.
+        _cfg_dir (str): The directory the configuration was loaded from.
+        _options (dict): Cached option namespaces and decision engines per params.
+        _settings (str): The flake8 version, plugin versions and configuration,
+            as part of every cache key.
+        _pending (dict[str, Future]): Background runs that have not finished, by cache key.
+        _executor (ThreadPoolExecutor | None): The thread of the background runs,
+            started on first use.
+    """
+
+    def __init__(self, cache: LintCache | None = None) -> None:
+        """Discovers plugins and prepares the option parser.
+
+        Args:
+            cache: The cache of linter outcomes. None disables caching.
+        """
+        self.cache = cache
+        self._prelim_parser = main_options.stage1_arg_parser()
+        self._cfg, self._cfg_dir = config.load_config(config=None, extra=[], isolated=False)
+
+        plugin_opts = finder.parse_plugin_options(
+            self._cfg, self._cfg_dir, enable_extensions=None, require_plugins=None
+        )
+        self._plugins = finder.load_plugins(finder.find_plugins(self._cfg, plugin_opts), plugin_opts)
+
+        self._option_manager = manager.OptionManager(
+            version=flake8.__version__,
+            plugin_versions=self._plugins.versions_str(),
+            parents=[self._prelim_parser],
+            formatter_names=list(self._plugins.reporters),
+        )
+        main_options.register_default_options(self._option_manager)
+        self._option_manager.register_plugins(self._plugins)
+
+        self._options: dict[tuple[tuple[str, ...], tuple[str, ...]], tuple[argparse.Namespace, DecisionEngine]] = {}
+        config_items = sorted(
+            (section, key, value) for section in self._cfg.sections() for key, value in self._cfg.items(section)
+        )
+        self._settings = f"{flake8.__version__}\0{self._plugins.versions_str()}\0{self._cfg_dir}\0{config_items}"
+        self._lock = threading.Lock()
+        self._pending: dict[str, Future[list[LintViolation]]] = {}
+        self._pending_lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def _options_for(self, select: Sequence[str], ignore: Sequence[str]) -> tuple[argparse.Namespace, DecisionEngine]:
+        """Returns parsed options and a decision engine for the given params.
+
+        Args:
+            select: Error codes passed as ``--select``.
+            ignore: Error codes passed as ``--ignore``.
+
+        Returns:
+            The option namespace and flake8's `DecisionEngine` for it.
+        """
+        key = (tuple(select), tuple(ignore))
+        cached = self._options.get(key)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            cached = self._options.get(key)
+            if cached is not None:
+                return cached
+
+            argv = []
+            if select:
+                argv.append(f"--select={','.join(select)}")
+            if ignore:
+                argv.append(f"--ignore={','.join(ignore)}")
+
+            _, rest = self._prelim_parser.parse_known_args(argv)
+            options = aggregator.aggregate_options(self._option_manager, self._cfg, self._cfg_dir, rest)
+            for loaded in self._plugins.all_plugins():
+                parse_options = getattr(loaded.obj, "parse_options", None)
+                if parse_options is None:
+                    continue
+                try:
+                    parse_options(self._option_manager, options, options.filenames)
+                except TypeError:
+                    parse_options(options)
+
+            cached = (options, DecisionEngine(options))
+            self._options[key] = cached
+            return cached
+
+    def check(
+        self, source_code: str, select: Sequence[str] | None = None, ignore: Sequence[str] | None = None
+    ) -> list[LintViolation]:
+        """Lints a source string.
+
+        Args:
+            source_code: The Python source code to check.
+            select: Error codes to select, as with ``flake8 --select``.
+            ignore: Error codes to ignore, as with ``flake8 --ignore``.
+
+        Returns:
+            The reported violations, sorted by line and column. An empty list
+            means the source is clean.
+
+        Raises:
+            flake8.exceptions.PluginExecutionFailed: If a plugin crashes.
+        """
+        select, ignore = select or (), ignore or ()
+        key = LintCache.key_for(source_code, select, ignore, self._settings)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return [LintViolation(*entry) for entry in cached]
+
+        with self._pending_lock:
+            pending = self._pending.get(key)
+        if pending is not None:
+            try:
+                return list(pending.result())
+            except CancelledError:
+                pass
+
+        return self._check_and_store(key, source_code, select, ignore)
+
+    def check_async(
+        self, source_code: str, select: Sequence[str] | None = None, ignore: Sequence[str] | None = None
+    ) -> "Future[list[LintViolation]]":
+        """Starts linting a source on a background thread.
+
+        Runs are queued on a single thread. A run that has not started yet can
+        be cancelled with `Future.cancel`; a run that has started completes
+        and stores its outcome in the cache.
+
+        Args:
+            source_code: The Python source code to check.
+            select: Error codes to select, as with ``flake8 --select``.
+            ignore: Error codes to ignore, as with ``flake8 --ignore``.
+
+        Returns:
+            A future of the reported violations, as returned by `check`.
+        """
+        select, ignore = select or (), ignore or ()
+        key = LintCache.key_for(source_code, select, ignore, self._settings)
+        cached = self.cache.get(key) if self.cache is not None else None
+        if cached is not None:
+            future: Future[list[LintViolation]] = Future()
+            future.set_result([LintViolation(*entry) for entry in cached])
+            return future
+
+        with self._pending_lock:
+            pending = self._pending.get(key)
+            if pending is not None:
+                return pending
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="flake8")
+            future = self._executor.submit(self._check_and_store, key, source_code, select, ignore)
+            self._pending[key] = future
+
+        future.add_done_callback(lambda _: self._forget_pending(key, future))
+        return future
+
+    def _forget_pending(self, key: str, future: "Future[list[LintViolation]]") -> None:
+        """Removes a finished or cancelled background run from the pending runs."""
+        with self._pending_lock:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+
+    def _check_and_store(
+        self, key: str, source_code: str, select: Sequence[str], ignore: Sequence[str]
+    ) -> list[LintViolation]:
+        """Lints a source and stores the outcome in the cache, if any."""
+        violations = self._check(source_code, select, ignore)
+        if self.cache is not None:
+            self.cache.put(key, [(v.code, v.line, v.column, v.text) for v in violations])
+        return violations
+
+    def _check(self, source_code: str, select: Sequence[str], ignore: Sequence[str]) -> list[LintViolation]:
+        """Lints a source string without consulting the cache."""
+        options, decider = self._options_for(select, ignore)
+        checker = _SourceChecker(lines=list(io.StringIO(source_code)), plugins=self._plugins.checkers, options=options)
+        _, results, _ = checker.run_checks()
+
+        violations = []
+        for code, line, column, text, physical_line in sorted(results, key=lambda r: (r[1], r[2])):
+            # flake8 reports 0-based columns internally and shows them 1-based.
+            violation = Violation(code, STDIN_DISPLAY_NAME, line, (column or 0) + 1, text, physical_line)
+            if decider.decision_for(code) is not Decision.Selected:
+                continue
+            if violation.is_inline_ignored(options.disable_noqa):
+                continue
+            violations.append(LintViolation(code, line, violation.column_number, text))
+        return violations
+
+
+_engine: Flake8Engine | None = None
+_engine_lock = threading.Lock()
+
+
+def get_flake8_engine() -> Flake8Engine:
+    """Returns the process-wide flake8 engine, creating it on first use.
+
+    The engine uses the process-wide `LintCache` (see `get_lint_cache`).
+
+    Returns:
+        The shared `Flake8Engine` instance.
+    """
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                with profile_phase("flake8_setup"):
+                    _engine = Flake8Engine(cache=get_lint_cache())
+    return _engine
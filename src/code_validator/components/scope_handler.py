@@ -1,22 +1,159 @@
 """Provides functionality to find and isolate specific scopes within an AST.
 
 This module contains a key helper function, `find_scope_node`, which is used
-by `ScopedSelector` instances. Its purpose is to traverse the AST and return
-a specific subtree (e.g., a function body or class body) based on the
-`in_scope` configuration from a JSON rule. This allows rules to be applied
-with high precision to specific parts of the source code.
+by `ScopedSelector` instances. Its purpose is to return a specific subtree
+(e.g., a function body or class body) based on the `in_scope` configuration
+from a JSON rule. This allows rules to be applied with high precision to
+specific parts of the source code.
+
+Scopes are resolved through a `SymbolIndex`, which is built once per tree on
+first use and then answers every lookup with a dictionary access instead of
+a walk over the whole tree.
 """
 
 import ast
 from typing import Any
 
+# Name of the attribute under which the symbol index is stored on a tree.
+_SYMBOLS_ATTR = "_code_validator_symbols"
+
+# Nodes that can (directly) contain statements. Expressions never contain
+# class or function definitions, so the index does not descend into them.
+_STATEMENT_CONTAINERS = (ast.stmt, ast.excepthandler, ast.match_case)
+
+
+class SymbolIndex:
+    """An index of the classes and functions defined in one AST.
+
+    Every class and function definition is registered under its qualified
+    path, built from the names of the enclosing definitions, e.g. ``Hero``,
+    ``Hero.__init__``, ``Outer.Inner.method`` or ``factory.helper``. If a
+    path is defined more than once, the first definition in the source wins.
+
+    For the dictionary form of `in_scope`, the index also keeps the lookups
+    that `find_scope_node` has always used: a class is the first class with
+    that name in `ast.walk` order (at any depth), a method is looked up in
+    that class's body, and a function is looked up in the module body only.
+
+    Attributes:
+        _paths (dict[str, ast.AST]): Definitions by qualified path.
+        _classes (dict[str, ast.ClassDef]): Classes by name, first in `ast.walk` order.
+        _methods (dict[ast.ClassDef, dict[str, ast.FunctionDef]]): Methods of each class by name.
+        _functions (dict[str, ast.FunctionDef]): Module-level functions by name.
+    """
+
+    def __init__(self, tree: ast.Module):
+        """Builds the index in a single traversal of the tree's statements.
+
+        Args:
+            tree: The root of the AST (the module object).
+        """
+        self._paths: dict[str, ast.AST] = {}
+        self._methods: dict[ast.ClassDef, dict[str, ast.FunctionDef]] = {}
+        self._functions: dict[str, ast.FunctionDef] = {}
+
+        classes: list[tuple[int, int, ast.ClassDef]] = []
+        order = 0
+        stack: list[tuple[ast.AST, str, int]] = [(tree, "", 0)]
+        while stack:
+            node, prefix, depth = stack.pop()
+            order += 1
+
+            if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+                path = prefix + node.name
+                self._paths.setdefault(path, node)
+                prefix = path + "."
+                if isinstance(node, ast.ClassDef):
+                    classes.append((depth, order, node))
+                    methods: dict[str, ast.FunctionDef] = {}
+                    for item in node.body:
+                        if isinstance(item, ast.FunctionDef):
+                            methods.setdefault(item.name, item)
+                    self._methods[node] = methods
+
+            children = [child for child in ast.iter_child_nodes(node) if isinstance(child, _STATEMENT_CONTAINERS)]
+            stack.extend((child, prefix, depth + 1) for child in reversed(children))
+
+        # `ast.walk` is breadth-first, i.e. ordered by depth and then by position.
+        self._classes: dict[str, ast.ClassDef] = {}
+        for _, _, node in sorted(classes, key=lambda entry: entry[:2]):
+            self._classes.setdefault(node.name, node)
+
+        for node in tree.body:
+            if isinstance(node, ast.FunctionDef):
+                self._functions.setdefault(node.name, node)
+
+    def resolve(self, path: str) -> ast.AST | None:
+        """Returns the definition with the given qualified path.
+
+        Args:
+            path: A dotted path such as ``"Hero"`` or ``"Hero.__init__"``.
+
+        Returns:
+            The ast.ClassDef, ast.FunctionDef or ast.AsyncFunctionDef node, or
+            None if nothing is defined under that path.
+        """
+        return self._paths.get(path)
+
+    def find(self, scope_config: dict[str, Any] | str) -> ast.AST | None:
+        """Returns the scope node described by an `in_scope` configuration.
+
+        Args:
+            scope_config: Either a qualified path string, or a dictionary
+                with the keys "class", "method" and "function" as described
+                in `find_scope_node`.
 
-def find_scope_node(tree: ast.Module, scope_config: dict[str, Any]) -> ast.AST | None:
+        Returns:
+            The scope node, or None if the scope is not found.
+        """
+        if isinstance(scope_config, str):
+            return self.resolve(scope_config)
+        if not isinstance(scope_config, dict):
+            return None
+
+        class_name = scope_config.get("class")
+        if class_name:
+            class_node = self._classes.get(class_name)
+            if class_node is not None:
+                # If only a class scope is needed, return it.
+                if "method" not in scope_config:
+                    return class_node
+                # Class was found; the method may still be missing.
+                return self._methods[class_node].get(scope_config.get("method"))
+
+        function_name = scope_config.get("function")
+        if function_name:
+            return self._functions.get(function_name)
+
+        return None
+
+
+def get_symbol_index(tree: ast.Module) -> SymbolIndex:
+    """Returns the symbol index of a tree, building it on first use.
+
+    The index is stored on the tree itself, so every selector and the typo
+    analyzer share the same index for the lifetime of the tree.
+
+    Args:
+        tree: The root of the AST (the module object).
+
+    Returns:
+        The tree's `SymbolIndex`.
+    """
+    index = getattr(tree, _SYMBOLS_ATTR, None)
+    if index is None:
+        index = SymbolIndex(tree)
+        setattr(tree, _SYMBOLS_ATTR, index)
+    return index
+
+
+def find_scope_node(tree: ast.Module, scope_config: dict[str, Any] | str) -> ast.AST | None:
     """Finds a specific scope node (class or function) within the AST.
 
-    This function traverses the AST to locate a node that matches the provided
-    scope configuration. It supports finding global functions, classes, and
-    methods within classes.
+    This function locates a node that matches the provided scope
+    configuration through the tree's `SymbolIndex`. It supports finding
+    global functions, classes, methods within classes, and any definition
+    given by its qualified path.
 
     Args:
         tree: The root of the AST (the module object).
@@ -25,6 +162,8 @@ def find_scope_node(tree: ast.Module, scope_config: dict[str, Any]) -> ast.AST |
             - "function": name of a global function.
             - "class": name of a class.
             - "method": name of a method (must be used with "class").
+            Alternatively, a qualified path string such as "MyClass.my_func"
+            or "Outer.Inner.method".
 
     Returns:
         The found ast.AST node (either ast.ClassDef or ast.FunctionDef) that
@@ -36,26 +175,4 @@ def find_scope_node(tree: ast.Module, scope_config: dict[str, Any]) -> ast.AST |
         >>> find_scope_node(my_ast_tree, scope_config)
         <ast.FunctionDef object at ...>
     """
-    class_name = scope_config.get("class")
-    if class_name:
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef) and node.name == class_name:
-                # If only a class scope is needed, return it.
-                if "method" not in scope_config:
-                    return node
-
-                # If a method is needed, search within the class body.
-                method_name = scope_config.get("method")
-                for item in node.body:
-                    if isinstance(item, ast.FunctionDef) and item.name == method_name:
-                        return item
-                return None  # Class was found, but the method was not.
-
-    function_name = scope_config.get("function")
-    if function_name:
-        # For global functions, search only the top-level body of the module.
-        for node in tree.body:
-            if isinstance(node, ast.FunctionDef) and node.name == function_name:
-                return node
-
-    return None
+    return get_symbol_index(tree).find(scope_config)
@@ -0,0 +1,109 @@
+"""An in-memory view of a source text with constant-time line lookups.
+
+The validator reads each solution once. `SourceBuffer` keeps that text and a
+table of line start offsets, so that formatters can show the line or the
+code snippet of a node without reading the file again. This also works for
+sources that never existed on disk, such as those sent to the validation
+server.
+"""
+
+import ast
+import re
+from pathlib import Path
+
+# Line breaks as the Python tokenizer recognizes them. `str.splitlines` also
+# splits on form feeds and other separators, which would shift line numbers.
+_LINE_BREAK = re.compile(r"\r\n|\r|\n")
+
+
+class SourceBuffer:
+    """Source text with a table of line offsets.
+
+    The table is built on the first lookup, so a buffer costs nothing for
+    sources whose lines are never shown.
+
+    Attributes:
+        text (str): The complete source text.
+        _line_starts (list[int] | None): The offset of the start of each line,
+            followed by the length of the text.
+    """
+
+    def __init__(self, text: str):
+        """Initializes the buffer.
+
+        Args:
+            text: The complete source text.
+        """
+        self.text = text
+        self._line_starts: list[int] | None = None
+
+    @classmethod
+    def from_file(cls, path: Path | str) -> "SourceBuffer":
+        """Reads a UTF-8 source file into a buffer.
+
+        Args:
+            path: The path to the source file.
+
+        Returns:
+            A buffer with the contents of the file.
+
+        Raises:
+            OSError: If the file cannot be read.
+            UnicodeDecodeError: If the file is not valid UTF-8.
+        """
+        return cls(Path(path).read_text(encoding="utf-8"))
+
+    def _starts(self) -> list[int]:
+        """Returns the line offset table, building it on first use."""
+        if self._line_starts is None:
+            starts = [0]
+            starts.extend(match.end() for match in _LINE_BREAK.finditer(self.text))
+            if starts[-1] != len(self.text):
+                starts.append(len(self.text))
+            self._line_starts = starts
+        return self._line_starts
+
+    def __len__(self) -> int:
+        """Returns the number of lines."""
+        return len(self._starts()) - 1
+
+    def line(self, line_number: int) -> str | None:
+        """Returns one line without its line break.
+
+        Args:
+            line_number: The line number, 1-based as in AST nodes.
+
+        Returns:
+            The line, or None if the number is out of range.
+        """
+        starts = self._starts()
+        if not 1 <= line_number < len(starts):
+            return None
+        return self.text[starts[line_number - 1] : starts[line_number]].rstrip("\r\n")
+
+    def segment(self, node: ast.AST) -> str | None:
+        """Returns the source code of a node, like `ast.get_source_segment`.
+
+        Args:
+            node: An AST node with location information.
+
+        Returns:
+            The source of the node, or None if it has no complete location.
+        """
+        try:
+            lineno, end_lineno = node.lineno, node.end_lineno
+            col_offset, end_col_offset = node.col_offset, node.end_col_offset
+        except AttributeError:
+            return None
+        if end_lineno is None or end_col_offset is None:
+            return None
+
+        first, last = self.line(lineno), self.line(end_lineno)
+        if first is None or last is None:
+            return None
+
+        # Column offsets count UTF-8 bytes, not characters
+        starts = self._starts()
+        start = starts[lineno - 1] + len(first.encode("utf-8")[:col_offset].decode("utf-8", "ignore"))
+        end = starts[end_lineno - 1] + len(last.encode("utf-8")[:end_col_offset].decode("utf-8", "ignore"))
+        return self.text[start:end]
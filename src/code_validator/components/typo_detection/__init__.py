@@ -12,8 +12,11 @@ Classes:
     TypoDetector: Main detector class for analyzing failed searches
     ScopeAnalyzer: Extracts names from specific AST scopes
     PythonStyleFormatter: Formats suggestions like Python 3.11+ errors
+    NGramCandidateIndex: Finds candidates within an edit distance of a target
+    LinearCandidateIndex: Compares a target with every candidate
 """
 
+from .candidate_index import LinearCandidateIndex, NGramCandidateIndex
 from .detector import TypoDetector
 from .formatters import PythonStyleFormatter
 from .scope_analyzer import ScopeAnalyzer
@@ -22,4 +25,6 @@ __all__ = [
     "TypoDetector",
     "ScopeAnalyzer",
     "PythonStyleFormatter",
+    "NGramCandidateIndex",
+    "LinearCandidateIndex",
 ]
@@ -6,9 +6,25 @@ strings to detect potential typos and suggest corrections.
 Currently implemented:
     - Levenshtein Distance: For basic character insertions/deletions/substitutions
     - Future: Jaro-Winkler Distance for transpositions
+
+Typo detection only cares about close matches, so the algorithms also offer a
+bounded variant that takes a cutoff and gives up on a pair as soon as its
+distance is known to exceed it.
 """
 
-from typing import Protocol
+from typing import NamedTuple, Protocol
+
+
+class BoundedMatch(NamedTuple):
+    """The distance and similarity of a pair within a distance cutoff.
+
+    Attributes:
+        distance: The edit distance between the two strings.
+        similarity: The similarity score from 0.0 to 1.0.
+    """
+
+    distance: int
+    similarity: float
 
 
 class SimilarityAlgorithm(Protocol):
@@ -38,6 +54,19 @@ class SimilarityAlgorithm(Protocol):
         """
         ...
 
+    def bounded_match(self, s1: str, s2: str, max_distance: int) -> BoundedMatch | None:
+        """Calculate distance and similarity if the distance is within a cutoff.
+
+        Args:
+            s1: First string
+            s2: Second string
+            max_distance: The largest distance of interest
+
+        Returns:
+            The distance and similarity, or None if the distance exceeds `max_distance`
+        """
+        ...
+
 
 class LevenshteinDistance:
     """Levenshtein distance algorithm for measuring string similarity.
@@ -115,3 +144,93 @@ class LevenshteinDistance:
 
         distance = self.distance(s1, s2)
         return 1.0 - (distance / max_len)
+
+    def bounded_distance(self, s1: str, s2: str, max_distance: int) -> int | None:
+        """Calculate Levenshtein distance only if it does not exceed a cutoff.
+
+        Pairs whose lengths differ by more than `max_distance` are rejected
+        without any work, and a common prefix and suffix are skipped. The DP
+        table is then filled only within the diagonal band of width
+        ``2 * max_distance + 1``, which takes O(max(n, m) * max_distance)
+        time, and the computation stops at the first row whose cells all
+        exceed the cutoff.
+
+        Args:
+            s1: First string
+            s2: Second string
+            max_distance: The largest distance of interest
+
+        Returns:
+            The same distance as `distance`, or None if it exceeds `max_distance`
+        """
+        if max_distance < 0:
+            return None
+        if s1 == s2:
+            return 0
+
+        # Ensure s1 is the shorter string, so the band covers its columns
+        if len(s1) > len(s2):
+            s1, s2 = s2, s1
+        if len(s2) - len(s1) > max_distance:
+            return None
+
+        # A common prefix and suffix never change the distance
+        start = 0
+        while start < len(s1) and s1[start] == s2[start]:
+            start += 1
+        end1, end2 = len(s1), len(s2)
+        while end1 > start and s1[end1 - 1] == s2[end2 - 1]:
+            end1 -= 1
+            end2 -= 1
+        s1, s2 = s1[start:end1], s2[start:end2]
+
+        len1 = len(s1)
+        if len1 == 0:
+            return len(s2)
+
+        # Every cell outside the band holds a value above the cutoff
+        over = max_distance + 1
+        prev_row = [j if j <= max_distance else over for j in range(len1 + 1)]
+
+        for i in range(1, len(s2) + 1):
+            curr_row = [over] * (len1 + 1)
+            curr_row[0] = i if i <= max_distance else over
+            row_min = curr_row[0]
+            char2 = s2[i - 1]
+
+            for j in range(max(1, i - max_distance), min(len1, i + max_distance) + 1):
+                cost = prev_row[j - 1] if s1[j - 1] == char2 else prev_row[j - 1] + 1
+                value = min(cost, prev_row[j] + 1, curr_row[j - 1] + 1)
+                if value > over:
+                    value = over
+                curr_row[j] = value
+                if value < row_min:
+                    row_min = value
+
+            if row_min > max_distance:
+                return None
+            prev_row = curr_row
+
+        distance = prev_row[len1]
+        return distance if distance <= max_distance else None
+
+    def bounded_match(self, s1: str, s2: str, max_distance: int) -> BoundedMatch | None:
+        """Calculate distance and similarity in one pass, within a cutoff.
+
+        Args:
+            s1: First string
+            s2: Second string
+            max_distance: The largest distance of interest
+
+        Returns:
+            The distance and the similarity as `similarity` computes it, or
+            None if the distance exceeds `max_distance`
+        """
+        distance = self.bounded_distance(s1, s2, max_distance)
+        if distance is None:
+            return None
+
+        max_len = max(len(s1), len(s2))
+        if max_len == 0:
+            return BoundedMatch(0, 1.0)
+        return BoundedMatch(distance, 1.0 - (distance / max_len))
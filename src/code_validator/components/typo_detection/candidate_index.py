@@ -0,0 +1,155 @@
+"""Candidate indexes for finding names within an edit distance of a target.
+
+The typo detector needs every candidate whose edit distance to the target is
+at most `max_distance`. Comparing the target with every candidate is linear
+in the size of the scope; the indexes in this module narrow the comparison
+down to plausible neighbours first.
+
+Currently implemented:
+    - LinearCandidateIndex: Compares the target with every candidate
+    - NGramCandidateIndex: An inverted index of character n-grams
+
+The n-gram index relies on the q-gram lemma: two strings within edit distance
+``k`` share at least ``max(len) - q + 1 - k * q`` of their q-grams, because
+one edit destroys at most ``q`` of them. A neighbour must therefore contain
+at least one of any ``k * q + 1`` gram occurrences of the target, so the
+index only looks up the target's rarest grams and verifies the candidates
+found there with the bounded distance. Targets too short for the lemma to
+exclude anything fall back to a full scan.
+"""
+
+from collections import Counter, defaultdict
+from typing import Callable, Protocol
+
+from .algorithms import BoundedMatch, LevenshteinDistance, SimilarityAlgorithm
+from .scope_analyzer import NameCandidate
+
+# A candidate together with its distance and similarity to the target.
+CandidateMatch = tuple[NameCandidate, BoundedMatch]
+
+
+class CandidateIndex(Protocol):
+    """Protocol for indexes over the name candidates of one scope."""
+
+    def query(self, target: str, max_distance: int) -> list[CandidateMatch]:
+        """Find all candidates within an edit distance of the target.
+
+        Args:
+            target: The name that was being searched for
+            max_distance: The largest edit distance of interest
+
+        Returns:
+            The matching candidates with their distance and similarity, in
+            the order the candidates were given to the index
+        """
+        ...
+
+
+# Builds an index from the candidates of a scope and a similarity algorithm.
+CandidateIndexFactory = Callable[[list[NameCandidate], SimilarityAlgorithm], CandidateIndex]
+
+
+class LinearCandidateIndex:
+    """Finds neighbours by comparing the target with every candidate.
+
+    Attributes:
+        _candidates: The candidates of the scope
+        _algorithm: The algorithm that computes bounded distances
+    """
+
+    def __init__(self, candidates: list[NameCandidate], algorithm: SimilarityAlgorithm | None = None):
+        """Initialize the index.
+
+        Args:
+            candidates: The candidates of the scope
+            algorithm: The algorithm that computes bounded distances
+        """
+        self._candidates = list(candidates)
+        self._algorithm = algorithm or LevenshteinDistance()
+
+    def __len__(self) -> int:
+        """Return the number of indexed candidates."""
+        return len(self._candidates)
+
+    def query(self, target: str, max_distance: int) -> list[CandidateMatch]:
+        """Find all candidates within an edit distance of the target."""
+        matches = []
+        for candidate in self._candidates:
+            match = self._algorithm.bounded_match(target, candidate.name, max_distance)
+            if match is not None:
+                matches.append((candidate, match))
+        return matches
+
+
+class NGramCandidateIndex:
+    """Finds neighbours through an inverted index of character n-grams.
+
+    Attributes:
+        gram_size: The length of the indexed n-grams
+        _candidates: The candidates of the scope
+        _algorithm: The algorithm that computes bounded distances
+        _postings: Maps each n-gram to the positions of the candidates containing it
+    """
+
+    def __init__(
+        self, candidates: list[NameCandidate], algorithm: SimilarityAlgorithm | None = None, gram_size: int = 2
+    ):
+        """Build the index.
+
+        Args:
+            candidates: The candidates of the scope
+            algorithm: The algorithm that computes bounded distances
+            gram_size: The length of the indexed n-grams. Bigrams suit short
+                identifiers best.
+        """
+        self.gram_size = gram_size
+        self._candidates = list(candidates)
+        self._algorithm = algorithm or LevenshteinDistance()
+        self._postings: dict[str, list[int]] = defaultdict(list)
+
+        for position, candidate in enumerate(self._candidates):
+            for gram in set(self._grams(candidate.name)):
+                self._postings[gram].append(position)
+
+    def __len__(self) -> int:
+        """Return the number of indexed candidates."""
+        return len(self._candidates)
+
+    def _grams(self, name: str) -> list[str]:
+        """Split a name into its overlapping n-grams."""
+        return [name[i : i + self.gram_size] for i in range(len(name) - self.gram_size + 1)]
+
+    def query(self, target: str, max_distance: int) -> list[CandidateMatch]:
+        """Find all candidates within an edit distance of the target.
+
+        Args:
+            target: The name that was being searched for
+            max_distance: The largest edit distance of interest
+
+        Returns:
+            The same matches as `LinearCandidateIndex.query`, in candidate order
+        """
+        target_grams = Counter(self._grams(target))
+        needed = max_distance * self.gram_size + 1
+
+        if sum(target_grams.values()) < needed:
+            # The target is too short for the n-gram filter to exclude anything
+            positions: list[int] | range = range(len(self._candidates))
+        else:
+            # Any neighbour contains one of the `needed` rarest gram occurrences of the target
+            selected: set[int] = set()
+            covered = 0
+            for gram in sorted(target_grams, key=lambda g: len(self._postings.get(g, ()))):
+                selected.update(self._postings.get(gram, ()))
+                covered += target_grams[gram]
+                if covered >= needed:
+                    break
+            positions = sorted(selected)
+
+        matches = []
+        for position in positions:
+            candidate = self._candidates[position]
+            match = self._algorithm.bounded_match(target, candidate.name, max_distance)
+            if match is not None:
+                matches.append((candidate, match))
+        return matches
@@ -6,12 +6,15 @@ helpful suggestions for users.
 """
 
 import ast
+import math
 from dataclasses import dataclass
 from typing import Any
 
+from ..ast_utils import get_source_buffer
 from .algorithms import LevenshteinDistance
+from .candidate_index import CandidateIndex, CandidateIndexFactory, NGramCandidateIndex
 from .formatters import PythonStyleFormatter, SuggestionMatch
-from .scope_analyzer import NameCandidate, ScopeAnalyzer
+from .scope_analyzer import NameCandidate, ScopeAnalyzer, get_candidate_cache, scope_cache_key
 
 
 @dataclass
@@ -74,6 +77,7 @@ class TypoDetector:
         scope_analyzer: Analyzer for extracting names from AST scopes
         message_formatter: Formatter for creating user-friendly messages
         similarity_algo: Algorithm for calculating string similarity
+        index_factory: Builds the candidate index that is queried for neighbours
 
     Examples:
         >>> detector = TypoDetector()
@@ -85,19 +89,28 @@ class TypoDetector:
         ...     print(suggestion.message)
     """
 
-    def __init__(self, max_distance: int = 2, min_confidence: float = 0.6, max_candidates: int = 512):
+    def __init__(
+        self,
+        max_distance: int = 2,
+        min_confidence: float = 0.6,
+        max_candidates: int = 512,
+        index_factory: CandidateIndexFactory = NGramCandidateIndex,
+    ):
         """Initialize the typo detector.
 
         Args:
             max_distance: Maximum Levenshtein distance to consider for suggestions
             min_confidence: Minimum confidence score (0.0-1.0) to show suggestions
             max_candidates: Maximum number of candidates to analyze per scope
+            index_factory: Builds a candidate index from the candidates of a scope
+                and the similarity algorithm, e.g. `LinearCandidateIndex`
         """
         self.max_distance = max_distance
         self.min_confidence = min_confidence
         self.scope_analyzer = ScopeAnalyzer(max_candidates=max_candidates)
         self.message_formatter = PythonStyleFormatter()
         self.similarity_algo = LevenshteinDistance()
+        self.index_factory = index_factory
 
     def analyze_failed_search(
         self,
@@ -145,8 +158,20 @@ class TypoDetector:
         if not candidates:
             return TypoSuggestion.empty(target_name, file_path)
 
-        # Find similar names using similarity algorithm
-        suggestions = self._find_similar_names(target_name, candidates)
+        # Find similar names among the neighbours in the candidate index, which
+        # is built once per scope and target type and shared by all failing rules
+        index_key = (
+            "index",
+            scope_cache_key(scope_config),
+            target_type,
+            self.scope_analyzer.max_candidates,
+            self.index_factory,
+            type(self.similarity_algo),
+        )
+        index = get_candidate_cache(ast_tree).get(
+            index_key, lambda: self.index_factory(candidates, self.similarity_algo)
+        )
+        suggestions = self._find_similar_names(target_name, index)
 
         # Create debug information
         debug_info = self.message_formatter.format_debug_info(target_name, suggestions)
@@ -158,7 +183,7 @@ class TypoDetector:
                 format_func = self.message_formatter.format_suggestion_compact
             else:
                 format_func = self.message_formatter.format_suggestion
-            message = format_func(target_name, best_match, file_path, scope_config)
+            message = format_func(target_name, best_match, file_path, scope_config, get_source_buffer(ast_tree))
 
             return TypoSuggestion(
                 original_name=target_name,
@@ -210,27 +235,21 @@ class TypoDetector:
         else:
             return "assignment"  # Default fallback
 
-    def _find_similar_names(self, target: str, candidates: list[NameCandidate]) -> list[SuggestionMatch]:
-        """Find and rank similar names from the candidate list.
+    def _find_similar_names(self, target: str, index: CandidateIndex) -> list[SuggestionMatch]:
+        """Find and rank similar names from the candidate index.
 
         Args:
             target: The target name to find similarities for
-            candidates: List of name candidates to compare against
+            index: The index over the name candidates of the scope
 
         Returns:
             List of suggestion matches sorted by confidence (highest first)
         """
         matches = []
 
-        for candidate in candidates:
-            distance = self.similarity_algo.distance(target, candidate.name)
-
-            # Skip candidates that are too different
-            if distance > self.max_distance:
-                continue
-
+        # Only candidates within max_distance are returned by the index
+        for candidate, (distance, similarity) in index.query(target, self.max_distance):
             # Calculate confidence score
-            similarity = self.similarity_algo.similarity(target, candidate.name)
             confidence = self._calculate_confidence(target, candidate, similarity)
 
             matches.append(
@@ -279,9 +298,11 @@ class TypoDetector:
         for t_part in target_parts:
             for c_part in candidate_parts:
                 if len(t_part) > 3 and len(c_part) > 3:
-                    # Check if words are similar (like center/centre)
-                    part_similarity = self.similarity_algo.similarity(t_part, c_part)
-                    if part_similarity > 0.7:
+                    # Check if words are similar (like center/centre); a similarity
+                    # above 0.7 needs a distance below 30% of the longer word
+                    cutoff = math.ceil(0.3 * max(len(t_part), len(c_part)))
+                    part_match = self.similarity_algo.bounded_match(t_part, c_part, cutoff)
+                    if part_match is not None and part_match.similarity > 0.7:
                         confidence += 0.1
 
         # Penalty for very different lengths
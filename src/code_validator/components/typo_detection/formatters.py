@@ -7,6 +7,7 @@ with typo suggestions in the style of Python 3.11+ error messages.
 from dataclasses import dataclass
 from typing import Any
 
+from ..source_buffer import SourceBuffer
 from .scope_analyzer import NameCandidate
 
 
@@ -49,7 +50,12 @@ class PythonStyleFormatter:
     """
 
     def format_suggestion_compact(
-        self, target_name: str, best_match: SuggestionMatch, file_path: str, scope_config: dict[str, Any] | str
+        self,
+        target_name: str,
+        best_match: SuggestionMatch,
+        file_path: str,
+        scope_config: dict[str, Any] | str,
+        source: SourceBuffer | None = None,
     ) -> str:
         """Format a compact typo suggestion in Russian for user display.
 
@@ -58,6 +64,7 @@ class PythonStyleFormatter:
             best_match: The best matching candidate found
             file_path: Path to the source file
             scope_config: Scope configuration for context
+            source: The source text; read from `file_path` if not given
 
         Returns:
             Compact formatted suggestion message in Russian
@@ -65,8 +72,8 @@ class PythonStyleFormatter:
         candidate = best_match.candidate
         scope_context = self._format_scope_context_ru(scope_config)
 
-        # Read source line for highlighting
-        source_line = self._get_source_line(file_path, candidate.line_number)
+        # Look up source line for highlighting
+        source_line = self._get_source_line(file_path, candidate.line_number, source)
         highlight = self._create_highlight(candidate.col_offset, candidate.end_col_offset)
 
         return f"""💡 Найдено похожее в {scope_context} (строка {candidate.line_number}):
@@ -75,7 +82,12 @@ class PythonStyleFormatter:
 Возможно, вы имели в виду '{target_name}' вместо '{candidate.name}'?"""
 
     def format_suggestion(
-        self, target_name: str, best_match: SuggestionMatch, file_path: str, scope_config: dict[str, Any] | str
+        self,
+        target_name: str,
+        best_match: SuggestionMatch,
+        file_path: str,
+        scope_config: dict[str, Any] | str,
+        source: SourceBuffer | None = None,
     ) -> str:
         """Format a typo suggestion in Python 3.11+ error style.
 
@@ -84,6 +96,7 @@ class PythonStyleFormatter:
             best_match: The best matching candidate found
             file_path: Path to the source file
             scope_config: Scope configuration for context
+            source: The source text; read from `file_path` if not given
 
         Returns:
             Formatted error message with file location, source highlighting,
@@ -92,8 +105,8 @@ class PythonStyleFormatter:
         candidate = best_match.candidate
         scope_context = self._format_scope_context(scope_config)
 
-        # Read source line for highlighting
-        source_line = self._get_source_line(file_path, candidate.line_number)
+        # Look up source line for highlighting
+        source_line = self._get_source_line(file_path, candidate.line_number, source)
         highlight = self._create_highlight(candidate.col_offset, candidate.end_col_offset)
 
         return f"""File "{file_path}", line {candidate.line_number}, in {scope_context}
@@ -178,24 +191,24 @@ Note: This is a suggestion based on similarity analysis."""
         else:
             return "<module>"
 
-    def _get_source_line(self, file_path: str, line_number: int) -> str:
-        """Read the specified line from the source file.
+    def _get_source_line(self, file_path: str, line_number: int, source: SourceBuffer | None = None) -> str:
+        """Look up the specified line of the source.
 
         Args:
-            file_path: Path to the source file
-            line_number: Line number to read (1-based)
+            file_path: Path to the source file, read only if `source` is not given
+            line_number: Line number to look up (1-based)
+            source: The source text, if it is already in memory
 
         Returns:
             The source line content, or placeholder if unavailable
         """
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-                if 1 <= line_number <= len(lines):
-                    return lines[line_number - 1].rstrip()
-        except (IOError, IndexError, UnicodeDecodeError):
-            pass
-        return "<source unavailable>"
+        if source is None:
+            try:
+                source = SourceBuffer.from_file(file_path)
+            except (OSError, UnicodeDecodeError):
+                return "<source unavailable>"
+        line = source.line(line_number)
+        return line.rstrip() if line is not None else "<source unavailable>"
 
     def _create_highlight(self, start_col: int, end_col: int) -> str:
         """Create a highlight string with carets pointing to the problematic code.
@@ -3,14 +3,24 @@
 This module provides functionality to extract all names of a specific type
 (assignments, function definitions, class definitions) from a given scope
 in the AST, preserving location information for error reporting.
+
+Extracted names are kept in a `CandidateCache` stored on the tree itself, so
+when several rules fail in the same scope the scope is searched only once,
+and the cache is discarded together with the tree.
 """
 
 import ast
+import json
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable, Hashable, TypeVar
 
 from ..ast_utils import get_full_name
 
+# Name of the attribute under which the candidate cache is stored on a tree.
+_CANDIDATES_ATTR = "_code_validator_candidates"
+
+T = TypeVar("T")
+
 
 @dataclass
 class NameCandidate:
@@ -35,6 +45,75 @@ class NameCandidate:
     node: ast.AST
 
 
+class CandidateCache:
+    """Per-tree storage for the results of typo analysis.
+
+    Holds the name candidates extracted for each scope and target type, and
+    anything derived from them (such as candidate indexes), for the lifetime
+    of one tree.
+
+    Attributes:
+        hits: Number of lookups answered from the cache
+        misses: Number of lookups that had to build their value
+        _entries: Cached values by key
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[Hashable, Any] = {}
+
+    def get(self, key: Hashable, build: Callable[[], T]) -> T:
+        """Return the cached value for a key, building it on the first lookup.
+
+        Args:
+            key: A hashable key describing the value
+            build: Creates the value if it is not cached yet
+
+        Returns:
+            The cached or newly built value
+        """
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            value = self._entries[key] = build()
+            return value
+        self.hits += 1
+        return value
+
+
+def get_candidate_cache(tree: ast.Module) -> CandidateCache:
+    """Return the candidate cache of a tree, creating it on first use.
+
+    Args:
+        tree: The root of the AST (the module object)
+
+    Returns:
+        The tree's `CandidateCache`
+    """
+    cache = getattr(tree, _CANDIDATES_ATTR, None)
+    if cache is None:
+        cache = CandidateCache()
+        setattr(tree, _CANDIDATES_ATTR, cache)
+    return cache
+
+
+def scope_cache_key(scope_config: dict[str, Any] | str) -> str:
+    """Turn a scope configuration into a hashable cache key.
+
+    Args:
+        scope_config: Scope configuration dict or string
+
+    Returns:
+        A string that is equal for equal scope configurations
+    """
+    if isinstance(scope_config, str):
+        return scope_config
+    return json.dumps(scope_config, sort_keys=True, default=str)
+
+
 class ScopeAnalyzer:
     """Analyzer for extracting names from specific scopes in AST.
 
@@ -73,7 +152,9 @@ class ScopeAnalyzer:
             target_type: Type of names to extract ('assignment', 'function_def', 'class_def')
 
         Returns:
-            List of name candidates found in the scope, limited by max_candidates
+            List of name candidates found in the scope, limited by max_candidates.
+            The list is cached on the tree and shared between calls, so it must
+            not be modified
 
         Examples:
             >>> analyzer = ScopeAnalyzer()
@@ -83,6 +164,22 @@ class ScopeAnalyzer:
             >>> [c.name for c in candidates]
             ['self.scale', 'self.sped', 'self.health']
         """
+        key = ("candidates", scope_cache_key(scope_config), target_type, self.max_candidates)
+        return get_candidate_cache(tree).get(key, lambda: self._extract_names(tree, scope_config, target_type))
+
+    def _extract_names(
+        self, tree: ast.Module, scope_config: dict[str, Any] | str, target_type: str
+    ) -> list[NameCandidate]:
+        """Extract the names of a scope without consulting the cache.
+
+        Args:
+            tree: The AST tree to search in
+            scope_config: Scope configuration dict or string ('global')
+            target_type: Type of names to extract
+
+        Returns:
+            List of name candidates found in the scope, limited by max_candidates
+        """
         from ..scope_handler import find_scope_node
 
         # Find the target scope in AST
@@ -9,7 +9,7 @@ clear "shape" for the application's data.
 from dataclasses import dataclass, field
 from enum import IntEnum, StrEnum
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 
 class ExitCode(IntEnum):
@@ -33,6 +33,10 @@ class LogLevel(StrEnum):
     CRITICAL = "CRITICAL"
 
 
+# The default size limit of the result cache directory, in bytes.
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
 @dataclass(frozen=True)
 class AppConfig:
     """Stores the main application configuration from CLI arguments.
@@ -44,6 +48,10 @@ class AppConfig:
         is_quiet: If True, suppresses all non-log output to stdout.
         exit_on_first_error: If True, halts validation after the first failed rule.
         max_messages: Maximum number of error messages to display. 0 for no limit. Default: 0.
+        cache_dir: The directory of the result cache. None disables caching. Default: None.
+            Linter outcomes and parsed syntax trees are cached in its subdirectories.
+        cache_max_bytes: The size limit of the result cache directory, in bytes.
+        cache_rules: If True, the compiled rules are cached next to the rules file. Default: False.
     """
 
     solution_path: Path
@@ -52,6 +60,9 @@ class AppConfig:
     is_quiet: bool
     exit_on_first_error: bool
     max_messages: int = 0
+    cache_dir: Path | None = None
+    cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES
+    cache_rules: bool = False
 
 
 @dataclass(frozen=True)
@@ -152,3 +163,127 @@ class FullRuleConfig:
 
 # A type alias representing any possible rule configuration object.
 ValidationRuleConfig = ShortRuleConfig | FullRuleConfig
+
+
+@dataclass(frozen=True)
+class RuleFailure:
+    """Describes a single rule that failed during a validation run.
+
+    Attributes:
+        rule_id: The identifier of the failed rule.
+        message: The error message configured for the rule.
+        typo_suggestion: An optional typo suggestion produced for the failure.
+    """
+
+    rule_id: int
+    message: str
+    typo_suggestion: str | None = None
+
+
+@dataclass(frozen=True)
+class RuleResult:
+    """Describes the outcome of one executed rule, as soon as it has executed.
+
+    The typo suggestion of a failed rule is analyzed on first access, so
+    results whose suggestion is never read cost nothing extra.
+
+    Attributes:
+        rule_id: The identifier of the executed rule.
+        passed: True if the rule passed.
+        message: The error message configured for the rule.
+        elapsed: The time the rule took to execute, in seconds.
+        rule: The executed rule object.
+        _typo_suggestion: The typo suggestion of a failed rule, or a callable
+            that produces it.
+    """
+
+    rule_id: int
+    passed: bool
+    message: str
+    elapsed: float
+    rule: Any = field(default=None, repr=False, compare=False)
+    _typo_suggestion: str | Callable[[], str | None] | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def typo_suggestion(self) -> str | None:
+        """The typo suggestion of a failed rule, or None."""
+        if callable(self._typo_suggestion):
+            object.__setattr__(self, "_typo_suggestion", self._typo_suggestion())
+        return self._typo_suggestion
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts the result into a JSON-serializable dictionary.
+
+        Returns:
+            The result without the rule object, with its typo suggestion resolved.
+        """
+        return {
+            "rule_id": self.rule_id,
+            "passed": self.passed,
+            "message": self.message,
+            "elapsed": self.elapsed,
+            "typo_suggestion": self.typo_suggestion,
+        }
+
+
+@dataclass(frozen=True)
+class ValidationResult:
+    """Stores the outcome of validating one source against a rule set.
+
+    Attributes:
+        solution_path: The path (or display name) of the validated source.
+        is_valid: True if every executed rule passed.
+        failures: The failed rules, in the order they were executed.
+        syntax_error: The syntax error message if the source could not be parsed.
+        error: A description of a problem that prevented validation, such as
+            an unreadable file. Only set by batch validation.
+    """
+
+    solution_path: Path | str
+    is_valid: bool
+    failures: tuple[RuleFailure, ...] = ()
+    syntax_error: str | None = None
+    error: str | None = None
+
+    @property
+    def failed_rules_id(self) -> list[int]:
+        """list[int]: The IDs of the rules that failed, in execution order."""
+        return [failure.rule_id for failure in self.failures]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts the result into a JSON-serializable dictionary.
+
+        Returns:
+            The result with its failures as a list of dictionaries.
+        """
+        return {
+            "solution_path": str(self.solution_path),
+            "is_valid": self.is_valid,
+            "failures": [
+                {"rule_id": f.rule_id, "message": f.message, "typo_suggestion": f.typo_suggestion}
+                for f in self.failures
+            ],
+            "syntax_error": self.syntax_error,
+            "error": self.error,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ValidationResult":
+        """Rebuilds a result from the output of `to_dict`.
+
+        Args:
+            data: A dictionary produced by `to_dict`.
+
+        Returns:
+            An equal `ValidationResult`, with `solution_path` as a string.
+        """
+        failures = tuple(
+            RuleFailure(f["rule_id"], f["message"], f.get("typo_suggestion")) for f in data.get("failures", ())
+        )
+        return cls(
+            data["solution_path"],
+            data["is_valid"],
+            failures,
+            syntax_error=data.get("syntax_error"),
+            error=data.get("error"),
+        )
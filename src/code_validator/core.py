@@ -41,13 +41,596 @@ Example:
 
 import ast
 import json
-
-from .components.ast_utils import enrich_ast_with_parents
+import time
+from concurrent.futures import Future
+from dataclasses import replace
+from functools import partial
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Sequence, overload
+
+from .cache import AST_CACHE_SUBDIR, LINT_CACHE_SUBDIR, AstCache, ResultCache, RuleSetCache, get_lint_cache
+from .components.ast_utils import parse_source
+from .components.context import ExecutionContext
 from .components.definitions import Rule
 from .components.factories import RuleFactory
-from .config import AppConfig, LogLevel, ShortRuleConfig
+from .config import (
+    DEFAULT_CACHE_MAX_BYTES,
+    AppConfig,
+    LogLevel,
+    RuleFailure,
+    RuleResult,
+    ShortRuleConfig,
+    ValidationResult,
+)
 from .exceptions import RuleParsingError
-from .output import Console, log_initialization
+from .output import Console, log_initialization, report_failures
+from .profiling import profile_phase
+
+
+def load_rules_file(rules_path: Path, console: Console) -> dict[str, Any]:
+    """Reads and decodes a JSON rules file.
+
+    Args:
+        rules_path: The path to the JSON rules file.
+        console: A `Console` object for handling all output.
+
+    Returns:
+        The decoded content of the rules file.
+
+    Raises:
+        FileNotFoundError: If the rules file does not exist.
+        RuleParsingError: If the file does not contain valid JSON.
+    """
+    console.print("Loading rules from: %s", rules_path, level=LogLevel.DEBUG)
+    try:
+        with profile_phase("load_rules"):
+            rules_bytes = Path(rules_path).read_bytes()
+    except FileNotFoundError:
+        console.print("During reading file of rules raised FileNotFound", level=LogLevel.TRACE)
+        raise
+    return decode_rules(rules_bytes, console)
+
+
+def decode_rules(rules_bytes: bytes, console: Console) -> dict[str, Any]:
+    """Decodes the raw content of a JSON rules file.
+
+    Args:
+        rules_bytes: The raw content of the rules file.
+        console: A `Console` object for handling all output.
+
+    Returns:
+        The decoded content of the rules file.
+
+    Raises:
+        RuleParsingError: If the content is not valid UTF-8 JSON.
+    """
+    try:
+        with profile_phase("load_rules"):
+            rules_data = json.loads(rules_bytes.decode("utf-8"))
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        console.print("During reading file of rules raised JsonDecodeError..", level=LogLevel.TRACE)
+        raise RuleParsingError(f"Invalid JSON in rules file: {e}") from e
+
+    console.print("Load rules:\n%s", rules_data, level=LogLevel.TRACE)
+    return rules_data
+
+
+class CompiledRuleSet:
+    """A set of validation rules that is built once and reused for many sources.
+
+    Loading a rules file means reading JSON and running the `RuleFactory` for
+    every rule. This class performs that work a single time, so the same rule
+    objects can then validate any number of solutions in one process. Every
+    validation call returns its own `ValidationResult`.
+
+    Attributes:
+        _rules (list[Rule]): The initialized, executable rule objects.
+        _console (Console): The handler for all logging and stdout printing.
+        _syntax_rule (Rule | None): The `check_syntax` rule, if one is defined.
+        _cache (ResultCache | None): The optional cache of finished results.
+        _ast_cache (AstCache | None): The optional cache of parsed syntax trees.
+        _lint_starts (dict[int, list[Rule]]): The linter rules whose flake8 run starts in the
+            background, keyed by the position of the rule after which it starts (-1: before the
+            first rule). A run starts only once no critical rule remains before its linter rule.
+        _linter_rule_ids (set[int]): The IDs of the linter rules, which print their findings.
+
+    Example:
+        .. code-block:: python
+
+            rule_set = CompiledRuleSet.from_file(Path("rules.json"), console)
+            for result in rule_set.validate_many(Path("submissions").glob("*.py")):
+                print(result.solution_path, result.is_valid, result.failed_rules_id)
+    """
+
+    @log_initialization(level=LogLevel.DEBUG)
+    def __init__(
+        self,
+        rules: list[Rule],
+        console: Console,
+        *,
+        cache: ResultCache | None = None,
+        ast_cache: AstCache | None = None,
+    ):
+        """Initializes the CompiledRuleSet.
+
+        Args:
+            rules: The already constructed rule objects, in execution order.
+            console: A `Console` object for handling all output.
+            cache: A result cache created for the same rules, if caching is enabled.
+            ast_cache: A cache of parsed syntax trees, if caching is enabled.
+        """
+        self._rules = rules
+        self._console = console
+        self._cache = cache
+        self._ast_cache = ast_cache
+        self._syntax_rule = next(
+            (rule for rule in rules if getattr(rule.config, "type", None) == "check_syntax"),
+            None,
+        )
+        self._lint_starts: dict[int, list[Rule]] = {}
+        last_critical = -1
+        for position, rule in enumerate(rules):
+            # Only worth it if other rules execute in the meantime
+            if hasattr(rule, "flake8_params") and position > last_critical + 1:
+                self._lint_starts.setdefault(last_critical, []).append(rule)
+            if getattr(rule.config, "is_critical", False):
+                last_critical = position
+        self._linter_rule_ids = {rule.config.rule_id for rule in rules if hasattr(rule, "flake8_params")}
+
+    @classmethod
+    def from_dict(
+        cls,
+        rules_data: dict[str, Any],
+        console: Console,
+        *,
+        cache_dir: Path | None = None,
+        cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ) -> "CompiledRuleSet":
+        """Builds a rule set from already decoded rules JSON.
+
+        Args:
+            rules_data: The decoded content of a rules file.
+            console: A `Console` object for handling all output.
+            cache_dir: The directory of the result cache. None disables caching.
+                Linter outcomes and parsed syntax trees are also cached in its
+                `lint` and `ast` subdirectories.
+            cache_max_bytes: The size limit of the result cache directory.
+
+        Returns:
+            A compiled rule set ready to validate sources.
+
+        Raises:
+            RuleParsingError: If `validation_rules` is missing or a rule is invalid.
+        """
+        raw_rules = rules_data.get("validation_rules") if isinstance(rules_data, dict) else None
+        if not isinstance(raw_rules, list):
+            raise RuleParsingError("`validation_rules` key not found or is not a list.")
+
+        console.print("Found %d.", len(raw_rules), level=LogLevel.DEBUG)
+        with profile_phase("build_rules"):
+            rule_factory = RuleFactory(console)
+            rules = [rule_factory.create(rule) for rule in raw_rules]
+        console.print("Successfully parsed %d rules.", len(rules), level=LogLevel.DEBUG)
+        return cls._with_caches(rules, rules_data, console, cache_dir, cache_max_bytes)
+
+    @classmethod
+    def _with_caches(
+        cls,
+        rules: list[Rule],
+        rules_data: dict[str, Any],
+        console: Console,
+        cache_dir: Path | None,
+        cache_max_bytes: int,
+    ) -> "CompiledRuleSet":
+        """Creates a rule set together with the caches in `cache_dir`, if any."""
+        cache = ast_cache = None
+        if cache_dir is not None:
+            cache = ResultCache(cache_dir, rules_data, max_bytes=cache_max_bytes)
+            ast_cache = AstCache(cache_dir / AST_CACHE_SUBDIR, max_bytes=cache_max_bytes)
+            get_lint_cache().attach_directory(cache_dir / LINT_CACHE_SUBDIR, max_bytes=cache_max_bytes)
+        return cls(rules, console, cache=cache, ast_cache=ast_cache)
+
+    @classmethod
+    def from_file(
+        cls,
+        rules_path: Path,
+        console: Console,
+        *,
+        cache_dir: Path | None = None,
+        cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        cache_rules: bool = False,
+    ) -> "CompiledRuleSet":
+        """Reads a JSON rules file and builds a rule set from it.
+
+        Args:
+            rules_path: The path to the JSON rules file.
+            console: A `Console` object for handling all output.
+            cache_dir: The directory of the result cache. None disables caching.
+            cache_max_bytes: The size limit of the result cache directory.
+            cache_rules: If True, the built rules are stored in a `RuleSetCache`
+                next to the rules file and loaded from it while the file, the
+                Python version and the validator version are unchanged.
+
+        Returns:
+            A compiled rule set ready to validate sources.
+
+        Raises:
+            FileNotFoundError: If the rules file does not exist.
+            RuleParsingError: If the JSON is malformed or a rule is invalid.
+        """
+        if not cache_rules:
+            rules_data = load_rules_file(rules_path, console)
+            return cls.from_dict(rules_data, console, cache_dir=cache_dir, cache_max_bytes=cache_max_bytes)
+
+        console.print("Loading rules from: %s", rules_path, level=LogLevel.DEBUG)
+        rule_cache = RuleSetCache(rules_path)
+        with profile_phase("load_rules"):
+            rules_bytes = Path(rules_path).read_bytes()
+            rules = rule_cache.load(rules_bytes, console)
+
+        if rules is None:
+            rule_set = cls.from_dict(
+                decode_rules(rules_bytes, console), console, cache_dir=cache_dir, cache_max_bytes=cache_max_bytes
+            )
+            rule_cache.store(rules_bytes, rule_set.rules, console)
+            return rule_set
+
+        console.print("Loaded %d compiled rules from: %s", len(rules), rule_cache.path, level=LogLevel.DEBUG)
+        # The result cache is keyed by the decoded rules, which are only read if it is used
+        rules_data = decode_rules(rules_bytes, console) if cache_dir is not None else {}
+        return cls._with_caches(rules, rules_data, console, cache_dir, cache_max_bytes)
+
+    @property
+    def rules(self) -> list[Rule]:
+        """list[Rule]: The executable rule objects, in execution order."""
+        return self._rules
+
+    @property
+    def syntax_rule(self) -> Rule | None:
+        """Rule | None: The `check_syntax` rule of this set, if one is defined."""
+        return self._syntax_rule
+
+    @property
+    def cache(self) -> ResultCache | None:
+        """ResultCache | None: The result cache of this set, if caching is enabled."""
+        return self._cache
+
+    def _start_linting(self, position: int, source_code: str) -> list[Future]:
+        """Starts the background flake8 runs that are due after the rule at `position`.
+
+        A run is only started once every critical rule before its linter rule
+        has passed, so it is not wasted on a validation that halts early; the
+        linter rule picks the outcome up when it executes.
+
+        Args:
+            position: The position of the rule that has just passed, or -1.
+            source_code: The source being validated.
+
+        Returns:
+            The futures of the started runs.
+        """
+        linter_rules = self._lint_starts.get(position)
+        if not linter_rules:
+            return []
+
+        try:
+            from .components.linter import get_flake8_engine
+
+            engine = get_flake8_engine()
+        except ImportError:
+            # The linter rules report the missing linter themselves
+            return []
+        return [engine.check_async(source_code, *rule.flake8_params) for rule in linter_rules]
+
+    def execute(
+        self,
+        tree: ast.Module,
+        source_code: str,
+        *,
+        exit_on_first_error: bool = False,
+        context: ExecutionContext | None = None,
+    ) -> list[Rule]:
+        """Executes every rule against an already parsed source.
+
+        Rules run in the order they were defined. Execution halts after a
+        failed critical rule, or after the first failure when
+        `exit_on_first_error` is set.
+
+        The rule set keeps no state of its own execution, so several threads
+        may execute it at once, each with its own context.
+
+        Args:
+            tree: The enriched AST of the source code.
+            source_code: The raw source code string.
+            exit_on_first_error: If True, halts after the first failed rule.
+            context: Receives the state of this execution, such as the typo
+                suggestions of the failed rules. None uses a fresh context.
+
+        Returns:
+            The rules that failed, in execution order.
+        """
+        results = self.iter_execute(tree, source_code, exit_on_first_error=exit_on_first_error, context=context)
+        return [result.rule for result in results if not result.passed]
+
+    def iter_execute(
+        self,
+        tree: ast.Module,
+        source_code: str,
+        *,
+        exit_on_first_error: bool = False,
+        context: ExecutionContext | None = None,
+    ) -> Iterator[RuleResult]:
+        """Executes the rules one by one, yielding each result as soon as it is known.
+
+        Rules run in the order they were defined, with the same halting
+        behavior as `execute`. The `check_syntax` rule passed when the tree
+        was parsed and is reported without executing anything. If the
+        consumer stops iterating, the remaining rules are not executed.
+
+        The flake8 run of a linter rule starts on a background thread as soon
+        as no critical rule remains before it, and overlaps with the rules in
+        between. With `exit_on_first_error`, any failure may halt execution,
+        so linter rules run when they are reached.
+
+        Args:
+            tree: The enriched AST of the source code.
+            source_code: The raw source code string.
+            exit_on_first_error: If True, halts after the first failed rule.
+            context: Receives the state of this execution. None uses a fresh context.
+
+        Yields:
+            One `RuleResult` per executed rule, in execution order.
+        """
+        if context is None:
+            context = ExecutionContext()
+        lint_in_background = not exit_on_first_error and bool(self._lint_starts)
+        pending_lint = self._start_linting(-1, source_code) if lint_in_background else []
+        try:
+            yield from self._iter_execute(
+                tree, source_code, context, exit_on_first_error, lint_in_background, pending_lint
+            )
+        finally:
+            # Runs that have not started are not needed if the consumer stopped early
+            for future in pending_lint:
+                if future.cancel():
+                    self._console.print("Cancelled a pending linter run.", level=LogLevel.DEBUG)
+
+    def _iter_execute(
+        self,
+        tree: ast.Module,
+        source_code: str,
+        context: ExecutionContext,
+        exit_on_first_error: bool,
+        lint_in_background: bool,
+        pending_lint: list[Future],
+    ) -> Iterator[RuleResult]:
+        """Executes the rules for `iter_execute`, adding started linter runs to `pending_lint`."""
+        self._console.print("Starting check rules..", level=LogLevel.DEBUG)
+        for position, rule in enumerate(self._rules):
+            if rule is self._syntax_rule:
+                if lint_in_background:
+                    pending_lint.extend(self._start_linting(position, source_code))
+                yield RuleResult(rule.config.rule_id, True, rule.config.message, 0.0, rule)
+                continue
+
+            if isinstance(rule.config, ShortRuleConfig):
+                self._console.print("Executing rule: %s", rule.config.rule_id, level=LogLevel.INFO)
+            else:
+                self._console.print(
+                    "Executing rule: %s [%s, %s, is_critical=%s]",
+                    rule.config.rule_id,
+                    rule.config.check.selector.type,
+                    rule.config.check.constraint.type,
+                    rule.config.is_critical,
+                    level=LogLevel.INFO,
+                )
+            started = time.perf_counter()
+            with profile_phase("rule[%s]", rule.config.rule_id):
+                is_passed = rule.execute(tree, source_code, context)
+            elapsed = time.perf_counter() - started
+
+            if is_passed:
+                self._console.print("Rule %s - PASS", rule.config.rule_id, level=LogLevel.INFO)
+                if lint_in_background:
+                    pending_lint.extend(self._start_linting(position, source_code))
+                yield RuleResult(rule.config.rule_id, True, rule.config.message, elapsed, rule)
+                continue
+
+            self._console.print("Rule %s - FAIL", rule.config.rule_id, level=LogLevel.INFO)
+            typo_suggestion = context.deferred_typo_suggestion(rule)
+            if callable(typo_suggestion):
+                # Resolve through the context, so the analysis runs once for all readers
+                typo_suggestion = partial(context.typo_suggestion, rule)
+            yield RuleResult(rule.config.rule_id, False, rule.config.message, elapsed, rule, typo_suggestion)
+            if getattr(rule.config, "is_critical", False):
+                self._console.print("Critical rule failed. Halting validation.", level=LogLevel.WARNING)
+                break
+            elif exit_on_first_error:
+                self._console.print("Exiting on first error.", level=LogLevel.INFO)
+                break
+
+    def validate_source(
+        self,
+        source_code: str,
+        solution_path: Path | str = "<string>",
+        *,
+        exit_on_first_error: bool = False,
+        max_typo_suggestions: int | None = None,
+    ) -> ValidationResult:
+        """Validates source code that is already held in memory.
+
+        If the rule set has a result cache, a source that was validated
+        before is answered from the cache without being parsed. Results are
+        stored complete, so with a cache every typo suggestion is analyzed
+        once, whatever `max_typo_suggestions` is, and later hits are free.
+
+        Args:
+            source_code: The raw Python source code to validate.
+            solution_path: The path or display name used in messages and results.
+            exit_on_first_error: If True, halts after the first failed rule.
+            max_typo_suggestions: The number of leading failures whose typo
+                suggestion is analyzed, for example the failures that will be
+                displayed. None analyzes every failure; the others get no
+                suggestion.
+
+        Returns:
+            A new `ValidationResult` describing this validation only.
+        """
+        if self._cache is None:
+            return self._validate_source(source_code, solution_path, exit_on_first_error, max_typo_suggestions)
+
+        cache_key = self._cache.key_for(source_code, exit_on_first_error=exit_on_first_error)
+        result = self._cache.get(cache_key, solution_path)
+        if result is not None:
+            self._console.print("Result cache hit for: %s", solution_path, level=LogLevel.DEBUG)
+            return result
+
+        result = self._validate_source(source_code, solution_path, exit_on_first_error, None)
+        if self.is_cacheable(result):
+            self._cache.put(cache_key, result)
+        return result
+
+    def is_cacheable(self, result: ValidationResult) -> bool:
+        """Tells whether a result can be answered from the result cache later.
+
+        A failed linter rule prints the flake8 findings, which are not part of
+        the result. A cache hit would replay the failure without them, so such
+        results are not stored.
+
+        Args:
+            result: A result produced with this rule set.
+
+        Returns:
+            True if no linter rule failed.
+        """
+        return not any(failure.rule_id in self._linter_rule_ids for failure in result.failures)
+
+    def _validate_source(
+        self, source_code: str, solution_path: Path | str, exit_on_first_error: bool, max_typo_suggestions: int | None
+    ) -> ValidationResult:
+        """Parses and validates a source without consulting the cache.
+
+        Args:
+            source_code: The raw Python source code to validate.
+            solution_path: The path or display name used in messages and results.
+            exit_on_first_error: If True, halts after the first failed rule.
+            max_typo_suggestions: The number of leading failures whose typo
+                suggestion is analyzed. None analyzes every failure.
+
+        Returns:
+            A new `ValidationResult` describing this validation only.
+        """
+        try:
+            tree = parse_source(source_code, cache=self._ast_cache)
+        except SyntaxError as e:
+            self._console.print("Syntax Error found: %s", e, level=LogLevel.ERROR)
+            failures: tuple[RuleFailure, ...] = ()
+            if self._syntax_rule is not None:
+                failures = (RuleFailure(self._syntax_rule.config.rule_id, self._syntax_rule.config.message),)
+            return ValidationResult(solution_path, False, failures, syntax_error=str(e))
+
+        context = ExecutionContext(str(solution_path))
+        failed_rules = self.execute(tree, source_code, exit_on_first_error=exit_on_first_error, context=context)
+        failures = _FailureView(failed_rules, context).describe(max_typo_suggestions)
+        return ValidationResult(solution_path, not failures, failures)
+
+    def validate(
+        self, solution_path: Path, *, exit_on_first_error: bool = False, max_typo_suggestions: int | None = None
+    ) -> ValidationResult:
+        """Reads a solution file and validates it.
+
+        Args:
+            solution_path: The path to the Python file to validate.
+            exit_on_first_error: If True, halts after the first failed rule.
+            max_typo_suggestions: As in `validate_source`.
+
+        Returns:
+            A new `ValidationResult` for the file.
+
+        Raises:
+            FileNotFoundError: If the solution file does not exist.
+        """
+        self._console.print("Reading source file: %s", solution_path, level=LogLevel.DEBUG)
+        with profile_phase("read_source"):
+            source_code = Path(solution_path).read_text(encoding="utf-8")
+        return self.validate_source(
+            source_code,
+            solution_path,
+            exit_on_first_error=exit_on_first_error,
+            max_typo_suggestions=max_typo_suggestions,
+        )
+
+    def validate_many(
+        self, solution_paths: Iterable[Path], *, exit_on_first_error: bool = False
+    ) -> Iterator[ValidationResult]:
+        """Validates several solution files with the same compiled rules.
+
+        Results are produced lazily, one per path, in the order of the input.
+
+        Args:
+            solution_paths: The paths of the Python files to validate.
+            exit_on_first_error: If True, halts each file after its first failed rule.
+
+        Yields:
+            One `ValidationResult` per solution path.
+        """
+        for solution_path in solution_paths:
+            yield self.validate(solution_path, exit_on_first_error=exit_on_first_error)
+
+
+class _FailureView(Sequence[RuleFailure]):
+    """A read-only sequence of `RuleFailure` objects built on access.
+
+    Creating a failure reads the typo suggestion of its rule from the
+    execution context, which runs the deferred typo analysis. The view lets a
+    reporter that shows only the first few failures analyze only those.
+    """
+
+    def __init__(self, rules: Sequence[Rule], context: ExecutionContext):
+        """Initializes the view over the failed rules, in execution order, and their context."""
+        self._rules = rules
+        self._context = context
+
+    def __len__(self) -> int:
+        """Returns the number of failed rules."""
+        return len(self._rules)
+
+    @overload
+    def __getitem__(self, index: int) -> RuleFailure: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[RuleFailure]: ...
+
+    def __getitem__(self, index: int | slice) -> RuleFailure | list[RuleFailure]:
+        """Describes one failed rule, or a list of them for a slice."""
+        if isinstance(index, slice):
+            return [self._describe(rule) for rule in self._rules[index]]
+        return self._describe(self._rules[index])
+
+    def _describe(self, rule: Rule) -> RuleFailure:
+        """Describes a failed rule, resolving its typo suggestion."""
+        return RuleFailure(rule.config.rule_id, rule.config.message, self._context.typo_suggestion(rule))
+
+    def describe(self, limit: int | None = None) -> tuple[RuleFailure, ...]:
+        """Describes every failed rule, analyzing the typo suggestions of the first `limit` only.
+
+        Args:
+            limit: The number of leading failures whose pending typo analysis
+                runs. None analyzes every failure.
+
+        Returns:
+            The failures in execution order. A failure past the limit keeps a
+            suggestion that was already known and otherwise has none.
+        """
+        if limit is None:
+            return tuple(self)
+        failures = list(self[:limit])
+        for rule in self._rules[limit:]:
+            suggestion = self._context.deferred_typo_suggestion(rule)
+            failures.append(
+                RuleFailure(rule.config.rule_id, rule.config.message, None if callable(suggestion) else suggestion)
+            )
+        return tuple(failures)
 
 
 class StaticValidator:
@@ -60,11 +643,14 @@ class StaticValidator:
     Attributes:
         _config (AppConfig): The application configuration object.
         _console (Console): The handler for all logging and stdout printing.
-        _rule_factory (RuleFactory): The factory responsible for creating rule objects.
+        _rule_set (CompiledRuleSet | None): The compiled rules loaded from the rules file.
         _source_code (str): The raw text content of the Python file being validated.
         _ast_tree (ast.Module | None): The Abstract Syntax Tree of the source code.
         _rules (list[Rule]): A list of initialized, executable rule objects.
         _failed_rules (list[Rule]): A list of rules that contained IDs of failed checks during the run.
+        _syntax_error (str | None): The syntax error of the source, if it could not be parsed.
+        _context (ExecutionContext): The state of the rule execution, such as typo suggestions.
+        _result_cache (ResultCache | None): The result cache, if `config.cache_dir` is set.
     """
 
     @log_initialization(level=LogLevel.DEBUG)
@@ -79,17 +665,40 @@ class StaticValidator:
         self._config = config
         self._console = console
 
-        self._rule_factory = RuleFactory(self._console)
+        self._rule_set: CompiledRuleSet | None = None
         self._source_code: str = ""
         self._ast_tree: ast.Module | None = None
         self._rules: list[Rule] = []
         self._failed_rules: list[Rule] = []
+        self._syntax_error: str | None = None
+        self._result_cache: ResultCache | None = None
+        self._context = ExecutionContext(str(config.solution_path))
 
     @property
     def failed_rules_id(self) -> list[Rule]:
         """list[int]: A list of rule IDs that failed during the last run."""
         return self._failed_rules
 
+    @property
+    def is_valid(self) -> bool:
+        """bool: True if no rule failed and the source could be parsed during the last run."""
+        return not self._failed_rules and self._syntax_error is None
+
+    @property
+    def failures(self) -> tuple[RuleFailure, ...]:
+        """tuple[RuleFailure, ...]: The failed rules of the last run, in execution order."""
+        return tuple(self._collect_failures())
+
+    @property
+    def syntax_error(self) -> str | None:
+        """The syntax error of the source in the last run, or None if it could be parsed."""
+        return self._syntax_error
+
+    @property
+    def result_cache(self) -> ResultCache | None:
+        """ResultCache | None: The result cache used by the last run, if caching is enabled."""
+        return self._result_cache
+
     def _load_source_code(self) -> None:
         """Loads the content of the student's solution file into memory.
 
@@ -97,10 +706,11 @@ class StaticValidator:
             FileNotFoundError: If the source file specified in the config does not exist.
             RuleParsingError: If the source file cannot be read for any other reason.
         """
-        self._console.print(f"Reading source file: {self._config.solution_path}", level=LogLevel.DEBUG)
+        self._console.print("Reading source file: %s", self._config.solution_path, level=LogLevel.DEBUG)
         try:
-            self._source_code = self._config.solution_path.read_text(encoding="utf-8")
-            self._console.print(f"Source code:\n{self._source_code}\n", level=LogLevel.TRACE)
+            with profile_phase("read_source"):
+                self._source_code = self._config.solution_path.read_text(encoding="utf-8")
+            self._console.print("Source code:\n%s\n", self._source_code, level=LogLevel.TRACE)
         except FileNotFoundError:
             self._console.print("During reading source file raised FileNotFound", level=LogLevel.TRACE)
             raise
@@ -108,35 +718,31 @@ class StaticValidator:
             self._console.print("During reading source file raised some exception..", level=LogLevel.TRACE)
             raise RuleParsingError(f"Cannot read source file: {e}") from e
 
-    def _load_and_parse_rules(self) -> None:
+    def _load_and_parse_rules(self, rules_data: dict[str, Any] | None = None) -> None:
         """Loads and parses the JSON file into executable Rule objects.
 
-        This method reads the JSON rules file, validates its basic structure,
-        and then uses the `RuleFactory` to instantiate a list of concrete
-        Rule objects.
+        This method delegates to `CompiledRuleSet.from_dict`, which validates
+        the basic structure of the rules and uses the `RuleFactory` to
+        instantiate a list of concrete Rule objects. If `cache_rules` is set
+        in the config, the rules are loaded from their `RuleSetCache` instead
+        whenever possible.
+
+        Args:
+            rules_data: The already decoded rules file. If None, the file from
+                the config is read first.
 
         Raises:
             FileNotFoundError: If the rules file does not exist.
             RuleParsingError: If the JSON is malformed or a rule configuration
                 is invalid.
         """
-        self._console.print(f"Loading rules from: {self._config.rules_path}", level=LogLevel.DEBUG)
-        try:
-            rules_data = json.loads(self._config.rules_path.read_text(encoding="utf-8"))
-            self._console.print(f"Load rules:\n{rules_data}", level=LogLevel.TRACE)
-            raw_rules = rules_data.get("validation_rules")
-            if not isinstance(raw_rules, list):
-                raise RuleParsingError("`validation_rules` key not found or is not a list.")
-
-            self._console.print(f"Found {len(raw_rules)}.", level=LogLevel.DEBUG)
-            self._rules = [self._rule_factory.create(rule) for rule in raw_rules]
-            self._console.print(f"Successfully parsed {len(self._rules)} rules.", level=LogLevel.DEBUG)
-        except json.JSONDecodeError as e:
-            self._console.print("During reading file of rules raised JsonDecodeError..", level=LogLevel.TRACE)
-            raise RuleParsingError(f"Invalid JSON in rules file: {e}") from e
-        except FileNotFoundError:
-            self._console.print("During reading file of rules raised FileNotFound", level=LogLevel.TRACE)
-            raise
+        if self._config.cache_rules:
+            self._rule_set = CompiledRuleSet.from_file(self._config.rules_path, self._console, cache_rules=True)
+        else:
+            if rules_data is None:
+                rules_data = load_rules_file(self._config.rules_path, self._console)
+            self._rule_set = CompiledRuleSet.from_dict(rules_data, self._console)
+        self._rules = self._rule_set.rules
 
     def _parse_ast_tree(self) -> bool:
         """Parses the loaded source code into an AST and enriches it.
@@ -145,6 +751,8 @@ class StaticValidator:
         a helper to add parent references to each node in the tree, which is
         crucial for many advanced checks. If a `SyntaxError` occurs, it
         checks if a `check_syntax` rule was defined to provide a custom message.
+        If `cache_dir` is set in the config, a tree stored by an earlier run is
+        loaded from its `ast` subdirectory instead.
 
         Returns:
             bool: True if parsing was successful, False otherwise.
@@ -152,18 +760,21 @@ class StaticValidator:
         self._console.print("Parsing Abstract Syntax Tree (AST)...", level=LogLevel.DEBUG)
         try:
             self._console.print("Start parse source code.", level=LogLevel.TRACE)
-            self._ast_tree = ast.parse(self._source_code)
-            enrich_ast_with_parents(self._ast_tree)
+            ast_cache = None
+            if self._config.cache_dir is not None:
+                ast_cache = AstCache(self._config.cache_dir / AST_CACHE_SUBDIR, max_bytes=self._config.cache_max_bytes)
+            self._ast_tree = parse_source(self._source_code, cache=ast_cache)
             return True
         except SyntaxError as e:
             self._console.print("In source code SyntaxError..", level=LogLevel.TRACE)
-            for rule in self._rules:
-                if getattr(rule.config, "type", None) == "check_syntax":
-                    self._console.print(rule.config.message, level=LogLevel.ERROR, show_user=True)
-                    self._console.print(f"Failed rule id: {rule.config.rule_id}", level=LogLevel.DEBUG)
-                    self._failed_rules.append(rule)
-                    return False
-            self._console.print(f"Syntax Error found: {e}", level=LogLevel.ERROR)
+            self._syntax_error = str(e)
+            syntax_rule = self._rule_set.syntax_rule
+            if syntax_rule is not None:
+                self._console.print(syntax_rule.config.message, level=LogLevel.ERROR, show_user=True)
+                self._console.print("Failed rule id: %s", syntax_rule.config.rule_id, level=LogLevel.DEBUG)
+                self._failed_rules.append(syntax_rule)
+                return False
+            self._console.print("Syntax Error found: %s", e, level=LogLevel.ERROR)
             return False
 
     def _report_errors(self) -> None:
@@ -176,8 +787,9 @@ class StaticValidator:
         a summary message indicating how many more errors were found.
 
         The method retrieves the list of failed rules from `self._failed_rules`
-        and the display limit from `self._config`. All user-facing output is
-        channeled through the `self._console` object.
+        and the display limit from `self._config`, and hands them to
+        `report_failures`. All user-facing output is channeled through the
+        `self._console` object.
 
         Enhanced with numbered error messages and typo suggestions for better UX.
 
@@ -190,100 +802,167 @@ class StaticValidator:
           4. If the error list was truncated, prints a summary line, e.g.,
              "... (5 more errors found)".
         """
-        max_errors = self._config.max_messages
-        num_errors = len(self._failed_rules)
+        with profile_phase("report"):
+            report_failures(self._console, _FailureView(self._failed_rules, self._context), self._config.max_messages)
 
-        if num_errors == 0:
-            return None
+    def _collect_failures(self) -> list[RuleFailure]:
+        """Describes the failed rules of the current run as `RuleFailure` objects."""
+        return list(_FailureView(self._failed_rules, self._context))
 
-        errors_to_show = self._failed_rules
-        if 0 < max_errors < num_errors:
-            errors_to_show = self._failed_rules[:max_errors]
+    def _lookup_cached_result(self, rules_data: dict[str, Any]) -> tuple[str, ValidationResult | None]:
+        """Opens the result cache and looks up the current source.
 
-        for i, rule in enumerate(errors_to_show, 1):
-            # Print numbered error message
-            self._console.print(f"{i}. {rule.config.message}", level=LogLevel.WARNING, show_user=True)
+        Args:
+            rules_data: The decoded rules file, part of the cache key.
 
-            # Print typo suggestion if available
-            if hasattr(rule, "typo_suggestion") and rule.typo_suggestion:
-                # Add 4-space indentation to each line of the suggestion
-                suggestion_lines = rule.typo_suggestion.split("\n")
-                for line in suggestion_lines:
-                    self._console.print(f"    {line}", level=LogLevel.WARNING, show_user=True)
+        Returns:
+            The cache key of the source and the cached result, or None on a miss.
+        """
+        self._result_cache = ResultCache(self._config.cache_dir, rules_data, max_bytes=self._config.cache_max_bytes)
+        get_lint_cache().attach_directory(
+            self._config.cache_dir / LINT_CACHE_SUBDIR, max_bytes=self._config.cache_max_bytes
+        )
+        cache_key = self._result_cache.key_for(self._source_code, exit_on_first_error=self._config.exit_on_first_error)
+        with profile_phase("cache_lookup"):
+            cached = self._result_cache.get(cache_key, self._config.solution_path)
+        self._console.print(
+            "Result cache %s for: %s",
+            "hit" if cached is not None else "miss",
+            self._config.solution_path,
+            level=LogLevel.DEBUG,
+        )
+        return cache_key, cached
 
-                # Add empty line after suggestion for better readability
-                if i < len(errors_to_show):  # Don't add empty line after last error
-                    self._console.print("", level=LogLevel.WARNING, show_user=True)
+    def _replay_cached_result(self, result: ValidationResult, rules_data: dict[str, Any]) -> Iterator[RuleResult]:
+        """Replays a cached result exactly as a real run would have produced it.
 
-        if 0 < max_errors < num_errors:
-            remaining_count = num_errors - max_errors
-            self._console.print(
-                f"... ({remaining_count} more error{'s' if remaining_count > 1 else ''} found)",
-                level=LogLevel.WARNING,
-                show_user=True,
-            )
+        Only the rules that failed are instantiated, so that `failed_rules_id`
+        holds the same kind of objects as after a real run. The source is not
+        parsed and no rule is executed.
 
-    def run(self) -> bool:
-        """Runs the entire validation process from start to finish.
+        Args:
+            result: The cached validation result.
+            rules_data: The decoded rules file the result was produced with.
 
-        This is the main public method of the class. It orchestrates the
-        sequence of loading, parsing, and rule execution.
+        Yields:
+            A `RuleResult` for each cached failure; passed rules are not
+            cached and therefore not yielded.
+        """
+        raw_rules = {raw.get("rule_id"): raw for raw in rules_data["validation_rules"]}
+        rule_factory = RuleFactory(self._console)
+        for failure in result.failures:
+            rule = rule_factory.create(raw_rules[failure.rule_id])
+            self._context.set_typo_suggestion(rule, failure.typo_suggestion)
+            self._failed_rules.append(rule)
+
+        self._syntax_error = result.syntax_error
+        if self._syntax_error is not None:
+            if self._failed_rules:
+                self._console.print(self._failed_rules[0].config.message, level=LogLevel.ERROR, show_user=True)
+            else:
+                self._console.print("Syntax Error found: %s", self._syntax_error, level=LogLevel.ERROR)
 
-        Returns:
-            bool: True if all validation rules passed, False otherwise.
+        for failure, rule in zip(result.failures, self._failed_rules, strict=True):
+            yield RuleResult(failure.rule_id, False, failure.message, 0.0, rule, failure.typo_suggestion)
+
+    def _store_result(self, cache_key: str) -> None:
+        """Writes the outcome of the current run to the result cache, if it is cacheable.
+
+        A stored result is complete, so that it answers every later run
+        whatever its display limit: the typo suggestions that the report did
+        not need are analyzed here, once per source, and later hits are free.
+        """
+        failures = _FailureView(self._failed_rules, self._context).describe(0)
+        result = ValidationResult(
+            self._config.solution_path, not failures and self._syntax_error is None, failures, self._syntax_error
+        )
+        if not self._rule_set.is_cacheable(result):
+            self._console.print("Result not cached: a linter rule reported findings.", level=LogLevel.DEBUG)
+            return
+        with profile_phase("cache_store"):
+            result = replace(result, failures=tuple(self._collect_failures()))
+            self._result_cache.put(cache_key, result)
+
+    def iter_results(self) -> Iterator[RuleResult]:
+        """Runs the validation, yielding the result of each rule as soon as it has executed.
+
+        This orchestrates the sequence of loading, parsing, and rule
+        execution. If `cache_dir` is set in the config and the same source
+        was validated with the same rules before, the stored failures are
+        yielded instead. If the source cannot be parsed, only the failed
+        `check_syntax` rule is yielded, if one is defined.
+
+        Failures are not printed; `run` reports them once all results are
+        known. If the consumer stops iterating early, the remaining rules
+        are not executed and nothing is stored in the result cache.
+
+        Yields:
+            One `RuleResult` per executed rule, in execution order.
 
         Raises:
             RuleParsingError: Propagated from loading/parsing steps.
             FileNotFoundError: Propagated from loading steps.
         """
+        cache_key = None
         try:
             self._load_source_code()
-            self._load_and_parse_rules()
 
+            rules_data = None
+            if self._config.cache_dir is not None:
+                rules_data = load_rules_file(self._config.rules_path, self._console)
+                cache_key, cached = self._lookup_cached_result(rules_data)
+                if cached is not None:
+                    yield from self._replay_cached_result(cached, rules_data)
+                    return
+
+            self._load_and_parse_rules(rules_data)
+
+            started = time.perf_counter()
             if not self._parse_ast_tree():
-                self._report_errors()
-                return False
+                elapsed = time.perf_counter() - started
+                if cache_key is not None:
+                    self._store_result(cache_key)
+                for rule in self._failed_rules:
+                    yield RuleResult(rule.config.rule_id, False, rule.config.message, elapsed, rule)
+                return
 
             self._console.print("Lead source code, load and parse rules and parsing code - PASS", level=LogLevel.DEBUG)
 
         except (FileNotFoundError, RuleParsingError) as e:
             self._console.print(
-                f"In method `run` of 'StaticValidator' raised exception {e.__class__.__name__}", level=LogLevel.WARNING
+                "In method `run` of 'StaticValidator' raised exception %s", e.__class__.__name__, level=LogLevel.WARNING
             )
             raise
 
-        # Set current file path for typo detection context
-        self._console.set_current_file_path(str(self._config.solution_path))
+        results = self._rule_set.iter_execute(
+            self._ast_tree,
+            self._source_code,
+            exit_on_first_error=self._config.exit_on_first_error,
+            context=self._context,
+        )
+        for result in results:
+            if not result.passed:
+                self._failed_rules.append(result.rule)
+            yield result
 
-        self._console.print("Starting check rules..", level=LogLevel.DEBUG)
-        for rule in self._rules:
-            if getattr(rule.config, "type", None) == "check_syntax":
-                continue
+        if cache_key is not None:
+            self._store_result(cache_key)
 
-            self._console.print(
-                f"Executing rule: {rule.config.rule_id}"
-                + (
-                    f" [{rule.config.check.selector.type}, {rule.config.check.constraint.type}, "
-                    f"is_critical={rule.config.is_critical}]"
-                    if not isinstance(rule.config, ShortRuleConfig)
-                    else ""
-                ),
-                level=LogLevel.INFO,
-            )
-            is_passed = rule.execute(self._ast_tree, self._source_code)
-            if not is_passed:
-                self._failed_rules.append(rule)
-                # self._console.print(rule.config.message, level=LogLevel.WARNING, show_user=True)
-                self._console.print(f"Rule {rule.config.rule_id} - FAIL", level=LogLevel.INFO)
-                if getattr(rule.config, "is_critical", False):
-                    self._console.print("Critical rule failed. Halting validation.", level=LogLevel.WARNING)
-                    break
-                elif self._config.exit_on_first_error:
-                    self._console.print("Exiting on first error.", level=LogLevel.INFO)
-                    break
-            else:
-                self._console.print(f"Rule {rule.config.rule_id} - PASS", level=LogLevel.INFO)
+    def run(self) -> bool:
+        """Runs the entire validation process from start to finish.
 
-        self._report_errors()
+        This is the main public method of the class. It executes every rule
+        through `iter_results` and then reports the failures.
+
+        Returns:
+            bool: True if all validation rules passed, False otherwise.
 
-        return not self._failed_rules
+        Raises:
+            RuleParsingError: Propagated from loading/parsing steps.
+            FileNotFoundError: Propagated from loading steps.
+        """
+        for _ in self.iter_results():
+            pass
+
+        self._report_errors()
+        return self.is_valid
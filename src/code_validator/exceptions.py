@@ -46,3 +46,21 @@ class ValidationFailedError(CodeValidatorError):
     """
 
     pass
+
+
+class ServerRequestError(CodeValidatorError):
+    """Raised by the validation client when the server rejects a request.
+
+    Attributes:
+        status (int): The HTTP status code returned by the server.
+    """
+
+    def __init__(self, message: str, status: int):
+        """Initializes the ServerRequestError.
+
+        Args:
+            message (str): The error message returned by the server.
+            status (int): The HTTP status code returned by the server.
+        """
+        self.status = status
+        super().__init__(f"Server returned {status}: {message}")
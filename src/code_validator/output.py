@@ -5,12 +5,20 @@ internal logging. It ensures that all output is consistent and can be
 controlled via configuration (e.g., log levels, silent mode).
 """
 
+import atexit
+import json
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
+from abc import ABC, abstractmethod
 from functools import wraps
-from typing import Callable, Concatenate, Literal, ParamSpec, TypeVar
+from multiprocessing import util as mp_util
+from pathlib import Path
+from typing import Any, Callable, Concatenate, Literal, ParamSpec, Sequence, TextIO, TypeVar
 
-from .config import LogLevel
+from .config import LogLevel, RuleFailure, RuleResult, ValidationResult
 
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 LOG_FORMAT = (
@@ -52,22 +60,45 @@ def trace(self, message, *args, **kws):
 
 logging.Logger.trace = trace
 
+# Numeric values of the supported levels. `LogLevel` is a `StrEnum`, so the
+# same lookup serves enum members and their string names.
+_LEVEL_NUMBERS: dict[str, int] = {level: logging.getLevelName(level.value) for level in LogLevel}
 
-def setup_logging(log_level: LogLevel) -> logging.Logger:
+
+def _level_number(level: LogLevel | str) -> int:
+    """Returns the numeric value of a log level given as an enum member or name."""
+    try:
+        return _LEVEL_NUMBERS[level]
+    except KeyError:
+        return logging.getLevelName(level)
+
+
+# The listener of the queued logging mode, if it is active in this process.
+_queue_listener: logging.handlers.QueueListener | None = None
+
+
+def setup_logging(log_level: LogLevel, *, queued: bool = False) -> logging.Logger:
     """Configures the root logger for the application.
 
     Sets up the basic configuration for logging, including the level,
     message format, and date format.
 
+    In queued mode the root logger only puts records on a queue, and a
+    background listener thread formats them and writes them to stderr, so
+    the logging thread never waits for the terminal. The listener writes
+    the remaining records when the process exits, including worker
+    processes of a `multiprocessing` pool that are shut down normally.
+
     Args:
         log_level: The minimum level of logs to display.
+        queued: If True, hands records to a background thread.
 
     Returns:
         The configured root logger instance.
     """
     formatter = logging.Formatter(fmt=LOG_FORMAT, datefmt=DATE_FORMAT, style="{")
 
-    handler = logging.StreamHandler(sys.stderr)
+    handler: logging.Handler = logging.StreamHandler(sys.stderr)
     handler.setFormatter(formatter)
 
     root_logger = logging.getLogger()
@@ -75,12 +106,108 @@ def setup_logging(log_level: LogLevel) -> logging.Logger:
 
     if root_logger.hasHandlers():
         root_logger.handlers.clear()
+    stop_queued_logging()
+
+    if queued:
+        global _queue_listener
+
+        records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        _queue_listener = logging.handlers.QueueListener(records, handler, respect_handler_level=True)
+        _queue_listener.start()
+        # Worker processes of a pool skip `atexit`, but run multiprocessing finalizers.
+        mp_util.Finalize(None, stop_queued_logging, exitpriority=10)
+        handler = logging.handlers.QueueHandler(records)
 
     root_logger.addHandler(handler)
 
     return root_logger
 
 
+def stop_queued_logging() -> None:
+    """Writes all queued records and stops the listener of the queued mode.
+
+    Does nothing if queued logging is not active.
+    """
+    global _queue_listener
+
+    listener, _queue_listener = _queue_listener, None
+    if listener is not None:
+        listener.stop()
+
+
+atexit.register(stop_queued_logging)
+
+
+class BackgroundWriter:
+    """A text stream that writes to another stream from a background thread.
+
+    Writes return immediately. The writer thread collects everything that
+    was written while it was busy and writes it in a single call, so a
+    burst of messages costs one write to the terminal.
+
+    Attributes:
+        stream (TextIO): The stream that receives the text.
+        _pending (queue.Queue[str | None]): Texts waiting to be written; None stops the thread.
+        _thread (threading.Thread): The writer thread.
+    """
+
+    def __init__(self, stream: TextIO):
+        """Starts the writer thread.
+
+        Args:
+            stream: The stream that receives the text.
+        """
+        self.stream = stream
+        self._pending: queue.Queue[str | None] = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="code-validator-stdout", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, text: str) -> int:
+        """Queues text for writing.
+
+        Args:
+            text: The text to write.
+
+        Returns:
+            The number of characters queued.
+        """
+        self._pending.put(text)
+        return len(text)
+
+    def flush(self) -> None:
+        """Waits until all queued text has been written and flushed."""
+        if self._thread.is_alive():
+            self._pending.join()
+
+    def close(self) -> None:
+        """Writes the queued text and stops the writer thread."""
+        if self._thread.is_alive():
+            self._pending.put(None)
+            self._thread.join()
+
+    def _run(self) -> None:
+        """Writes queued text in batches until stopped."""
+        while True:
+            batch = [self._pending.get()]
+            while True:
+                try:
+                    batch.append(self._pending.get_nowait())
+                except queue.Empty:
+                    break
+
+            texts = [text for text in batch if text is not None]
+            try:
+                if texts:
+                    self.stream.write("".join(texts))
+                    self.stream.flush()
+            finally:
+                for _ in batch:
+                    self._pending.task_done()
+            if len(texts) < len(batch):
+                return
+
+
 P = ParamSpec("P")
 T_self = TypeVar("T_self")
 
@@ -98,7 +225,8 @@ def log_initialization(
     cluttering the `__init__` method itself.
 
     The log messages can include a `{class_name}` placeholder, which will
-    be replaced by the actual name of the class being initialized.
+    be replaced by the actual name of the class being initialized. If the
+    level is disabled for the class's logger, the messages are not built.
 
     Args:
         level: The logging level (e.g., `LogLevel.DEBUG`, `LogLevel.INFO`)
@@ -117,17 +245,23 @@ def log_initialization(
 
     def decorator(init_method: Callable[Concatenate[T_self, P], None]) -> Callable[Concatenate[T_self, P], None]:
         """The actual decorator function."""
+        level_num = _level_number(level)
+        loggers: dict[type, logging.Logger] = {}
 
         @wraps(init_method)
         def wrapper(self: T_self, *args: P.args, **kwargs: P.kwargs) -> None:
             """The wrapper function that adds logging around __init__."""
-            class_name = self.__class__.__name__
-            logger = logging.getLogger(self.__class__.__module__)
-            level_num = logging.getLevelName(level if isinstance(level, LogLevel) else level)
+            cls = self.__class__
+            logger = loggers.get(cls)
+            if logger is None:
+                logger = loggers[cls] = logging.getLogger(cls.__module__)
+
+            if not logger.isEnabledFor(level_num):
+                return init_method(self, *args, **kwargs)
 
-            logger.log(level_num, start_message.format(class_name=class_name))
+            logger.log(level_num, start_message.format(class_name=cls.__name__))
             result = init_method(self, *args, **kwargs)
-            logger.log(level_num, end_message.format(class_name=class_name))
+            logger.log(level_num, end_message.format(class_name=cls.__name__))
 
             return result
 
@@ -143,10 +277,18 @@ class Console:
     formatting and easy control over verbosity (e.g., silent mode). It ensures
     that every user-facing message is also properly logged.
 
+    Messages may be given lazily, as a callable or as a %-style format with
+    arguments, and are only built if they are printed or logged. The
+    logger's effective level is read once, so a message below it costs a
+    single comparison. Call `refresh_log_level` after changing the level of
+    the logger.
+
     Attributes:
         _logger (logging.Logger): The logger instance used for all log records.
         _is_quiet (bool): A flag to suppress printing to stdout.
-        _stdout (TextIO): The stream to write messages to (defaults to sys.stdout).
+        _stdout (TextIO): The stream to write messages to (sys.stdout, or a
+            `BackgroundWriter` over it with `buffered_output`).
+        _log_threshold (int): The lowest level number that reaches the logger.
 
     Example:
         >>> import logging
@@ -159,19 +301,49 @@ class Console:
     """
 
     @log_initialization(level=LogLevel.TRACE)
-    def __init__(self, logger: logging.Logger, *, is_quiet: bool = False, show_verdict: bool = True):
+    def __init__(
+        self,
+        logger: logging.Logger,
+        *,
+        is_quiet: bool = False,
+        show_verdict: bool = True,
+        buffered_output: bool = False,
+    ):
         """Initializes the Console handler.
 
         Args:
             logger: The configured logger instance to use for logging.
             is_quiet: If True, suppresses output to stdout. Defaults to False.
             show_verdict: If False, suppresses showing verdicts. Default to True
+            buffered_output: If True, stdout is written in batches by a
+                `BackgroundWriter`; call `flush` to wait for it. Default to False
         """
         self._logger = logger
         self._is_quiet = is_quiet
         self._show_verdict = show_verdict
-        self._stdout = sys.stdout
-        self._current_file_path: str = "<unknown>"  # For typo detection context
+        self._stdout: TextIO | BackgroundWriter = BackgroundWriter(sys.stdout) if buffered_output else sys.stdout
+        self._log_threshold = 0
+        self.refresh_log_level()
+
+    @property
+    def logger(self) -> logging.Logger:
+        """logging.Logger: The logger that receives the log records of this console."""
+        return self._logger
+
+    def flush(self) -> None:
+        """Waits until everything printed so far has reached stdout."""
+        self._stdout.flush()
+
+    def refresh_log_level(self) -> None:
+        """Re-reads the effective level of the logger.
+
+        The level is cached when the console is created; call this method
+        after changing the level of the logger or one of its ancestors.
+        """
+        if self._logger.disabled:
+            self._log_threshold = sys.maxsize
+        else:
+            self._log_threshold = max(self._logger.getEffectiveLevel(), logging.root.manager.disable + 1)
 
     def should_print(self, is_verdict: bool, show_user: bool) -> bool:
         """Decides whether a message should be printed to stdout based on console flags.
@@ -204,10 +376,25 @@ class Console:
         """
         return not self._is_quiet and ((not is_verdict and show_user) or (is_verdict and self._show_verdict))
 
+    def is_enabled(self, level: LogLevel, *, is_verdict: bool = False, show_user: bool = False) -> bool:
+        """Tells whether a message would reach stdout or the log.
+
+        Lets callers skip building messages that would be discarded anyway.
+
+        Args:
+            level: The logging level the message would be printed with.
+            is_verdict: As in `print`.
+            show_user: As in `print`.
+
+        Returns:
+            True if the message would be printed or logged.
+        """
+        return self.should_print(is_verdict, show_user) or _level_number(level) >= self._log_threshold
+
     def print(
         self,
-        message: str,
-        *,
+        message: str | Callable[[], str],
+        *args: object,
         level: LogLevel | Literal["TRACE", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = LogLevel.TRACE,
         is_verdict: bool = False,
         show_user: bool = False,
@@ -215,12 +402,18 @@ class Console:
     ) -> None:
         """Prints a message to stdout and logs it simultaneously.
 
-        The message is always sent to the logger with the specified level. It is
+        The message is sent to the logger with the specified level. It is
         printed to the configured stdout stream only if the console is not in
-        silent mode.
+        silent mode. A message that is neither logged nor printed is never
+        built, so costly messages should be passed lazily:
+
+            console.print("Loaded rules: %s", rules_data, level=LogLevel.TRACE)
+            console.print(lambda: render(tree), level=LogLevel.DEBUG)
 
         Args:
-            message: The string message to be displayed and logged.
+            message: The message to be displayed and logged, a %-style format
+                     string for `args`, or a callable that returns the message.
+            *args: Arguments merged into `message` with the % operator.
             level: The logging level for the message. Accepts both LogLevel
                    enum members and their string representations.
                    Defaults to LogLevel.TRACE.
@@ -232,16 +425,284 @@ class Console:
                         False.
             exc_info:   If True this work as loggings.exception("<message>").
         """
-        level_num = logging.getLevelName(level if isinstance(level, LogLevel) else level)
-        self._logger.log(level_num, message, stacklevel=2, exc_info=exc_info)
-
-        if (not self._is_quiet) and ((not is_verdict and show_user) or (is_verdict and self._show_verdict)):
+        level_num = _level_number(level)
+        is_logged = level_num >= self._log_threshold
+        if not (is_logged or show_user or is_verdict):
+            return
+
+        is_printed = (not self._is_quiet) and ((not is_verdict and show_user) or (is_verdict and self._show_verdict))
+        if not (is_logged or is_printed):
+            return
+
+        if callable(message):
+            message = message()
+        if args:
+            message = message % args
+
+        if is_logged:
+            self._logger.log(level_num, message, stacklevel=2, exc_info=exc_info)
+        if is_printed:
             print(message, file=self._stdout)
 
-    def set_current_file_path(self, file_path: str) -> None:
-        """Set the current file path for typo detection context.
+
+def report_failures(console: Console, failures: Sequence[RuleFailure], max_messages: int = 0) -> None:
+    """Prints numbered failure messages and their typo suggestions.
+
+    At most `max_messages` failures are shown (0 means no limit). If the list
+    is truncated, a summary line such as "... (5 more errors found)" is
+    printed after the shown messages.
+
+    Failures are only read up to the display limit, so a lazy sequence lets
+    the failures that are not shown skip their typo analysis. Nothing is read
+    if the console would neither print nor log the report.
+
+    Args:
+        console: The console used for all user-facing output.
+        failures: The failed rules to report, in execution order.
+        max_messages: Maximum number of failures to display. 0 for no limit.
+    """
+    num_errors = len(failures)
+    if num_errors == 0 or not console.is_enabled(LogLevel.WARNING, show_user=True):
+        return None
+
+    errors_to_show = failures
+    if 0 < max_messages < num_errors:
+        errors_to_show = failures[:max_messages]
+
+    for i, failure in enumerate(errors_to_show, 1):
+        # Print numbered error message
+        console.print(f"{i}. {failure.message}", level=LogLevel.WARNING, show_user=True)
+
+        # Print typo suggestion if available
+        if failure.typo_suggestion:
+            # Add 4-space indentation to each line of the suggestion
+            for line in failure.typo_suggestion.split("\n"):
+                console.print(f"    {line}", level=LogLevel.WARNING, show_user=True)
+
+            # Add empty line after suggestion for better readability
+            if i < len(errors_to_show):  # Don't add empty line after last error
+                console.print("", level=LogLevel.WARNING, show_user=True)
+
+    if 0 < max_messages < num_errors:
+        remaining_count = num_errors - max_messages
+        console.print(
+            f"... ({remaining_count} more error{'s' if remaining_count > 1 else ''} found)",
+            level=LogLevel.WARNING,
+            show_user=True,
+        )
+
+
+class ResultWriter(ABC):
+    """Writes validation results to a stream in a machine-readable format.
+
+    Every record is written and flushed as soon as it is passed in, so a
+    consumer can process the results of a long batch while it runs. Writers
+    keep no results in memory.
+
+    A writer is used as follows: `start` once, then `write_rule` for each
+    executed rule of a single validation or `write_file` for each validated
+    file, and `finish` once at the end.
+
+    Attributes:
+        _stream (TextIO): The stream the records are written to.
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        """Initializes the writer.
+
+        Args:
+            stream: The stream the records are written to, usually stdout.
+        """
+        self._stream = stream
+
+    def start(self) -> None:  # noqa: B027 - optional hook, most formats have no header
+        """Writes what precedes the first record."""
+
+    @abstractmethod
+    def write_rule(self, solution_path: Path | str, result: RuleResult) -> None:
+        """Writes the outcome of one executed rule.
+
+        Args:
+            solution_path: The path (or display name) of the validated source.
+            result: The result of the rule.
+        """
+
+    @abstractmethod
+    def write_file(self, result: ValidationResult) -> None:
+        """Writes the outcome of one validated file.
+
+        Args:
+            result: The result of the file.
+        """
+
+    def finish(self) -> None:
+        """Writes what follows the last record and flushes the stream."""
+        self._stream.flush()
+
+
+class JsonLinesWriter(ResultWriter):
+    """Writes one JSON object per line (JSON Lines).
+
+    Rule records are ``{"type": "rule", "solution_path": ...}`` followed by
+    the fields of `RuleResult.to_dict`; file records are ``{"type": "file"}``
+    followed by the fields of `ValidationResult.to_dict`.
+    """
+
+    def write_rule(self, solution_path: Path | str, result: RuleResult) -> None:
+        """Writes the outcome of one executed rule as a ``rule`` record."""
+        self._write_record({"type": "rule", "solution_path": str(solution_path), **result.to_dict()})
+
+    def write_file(self, result: ValidationResult) -> None:
+        """Writes the outcome of one validated file as a ``file`` record."""
+        self._write_record({"type": "file", **result.to_dict()})
+
+    def _write_record(self, record: dict[str, Any]) -> None:
+        """Writes one record and flushes the stream."""
+        self._stream.write(json.dumps(record) + "\n")
+        self._stream.flush()
+
+
+class JsonWriter(JsonLinesWriter):
+    """Writes the records of `JsonLinesWriter` as a single JSON array.
+
+    The array is streamed: each record is written as soon as it is known, and
+    the closing bracket is written by `finish`.
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        """Initializes the writer.
 
         Args:
-            file_path: Path to the file currently being validated
+            stream: The stream the array is written to, usually stdout.
         """
-        self._current_file_path = file_path
+        super().__init__(stream)
+        self._separator = "\n"
+
+    def start(self) -> None:
+        """Opens the array."""
+        self._stream.write("[")
+
+    def _write_record(self, record: dict[str, Any]) -> None:
+        """Writes one array element and flushes the stream."""
+        self._stream.write(self._separator + json.dumps(record))
+        self._separator = ",\n"
+        self._stream.flush()
+
+    def finish(self) -> None:
+        """Closes the array."""
+        self._stream.write("\n]\n")
+        super().finish()
+
+
+# The version and schema of the SARIF documents written by `SarifWriter`.
+SARIF_VERSION = "2.1.0"
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+
+class SarifWriter(ResultWriter):
+    """Writes failures as a SARIF 2.1.0 log with a single run.
+
+    Only failures are written, as ``error`` results whose ``ruleId`` is the
+    rule ID. A file that could not be read or parsed, without a failed rule
+    reporting it, gets an ``input-error`` or ``syntax-error`` result. The
+    ``results`` array is streamed like the array of `JsonWriter`.
+
+    Attributes:
+        _separator (str): The text written before the next result.
+        _file_has_results (bool): True if `write_rule` wrote a failure since
+            the last `write_file`.
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        """Initializes the writer.
+
+        Args:
+            stream: The stream the log is written to, usually stdout.
+        """
+        super().__init__(stream)
+        self._separator = "\n"
+        self._file_has_results = False
+
+    def start(self) -> None:
+        """Writes the log header and opens the ``results`` array."""
+        from . import __version__
+
+        header = json.dumps(
+            {
+                "version": SARIF_VERSION,
+                "$schema": SARIF_SCHEMA,
+                "runs": [{"tool": {"driver": {"name": "code-validator", "version": __version__}}, "results": []}],
+            }
+        )
+        # Everything up to the empty results array, which is filled by the writes
+        self._stream.write(header[: header.rindex("[]") + 1])
+
+    def write_rule(self, solution_path: Path | str, result: RuleResult) -> None:
+        """Writes a failed rule as a result; passed rules are skipped."""
+        if not result.passed:
+            self._write_result(str(result.rule_id), result.message, solution_path, result.typo_suggestion)
+            self._file_has_results = True
+
+    def write_file(self, result: ValidationResult) -> None:
+        """Writes the failures of a file and the problems that prevented its validation.
+
+        Failures already written by `write_rule` are not written again.
+        """
+        if self._file_has_results:
+            self._file_has_results = False
+            return
+        if result.error:
+            self._write_result("input-error", result.error, result.solution_path)
+        elif result.syntax_error and not result.failures:
+            self._write_result("syntax-error", result.syntax_error, result.solution_path)
+        for failure in result.failures:
+            self._write_result(str(failure.rule_id), failure.message, result.solution_path, failure.typo_suggestion)
+        self._file_has_results = False
+
+    def _write_result(
+        self, rule_id: str, message: str, solution_path: Path | str, typo_suggestion: str | None = None
+    ) -> None:
+        """Writes one SARIF result and flushes the stream."""
+        result: dict[str, Any] = {
+            "ruleId": rule_id,
+            "level": "error",
+            "message": {"text": message},
+            "locations": [{"physicalLocation": {"artifactLocation": {"uri": Path(solution_path).as_posix()}}}],
+        }
+        if typo_suggestion:
+            result["properties"] = {"typoSuggestion": typo_suggestion}
+        self._stream.write(self._separator + json.dumps(result))
+        self._separator = ",\n"
+        self._stream.flush()
+
+    def finish(self) -> None:
+        """Closes the ``results`` array and the log."""
+        self._stream.write("\n]}]}\n")
+        super().finish()
+
+
+# The structured output formats accepted by `create_result_writer`.
+RESULT_WRITERS: dict[str, type[ResultWriter]] = {
+    "jsonl": JsonLinesWriter,
+    "json": JsonWriter,
+    "sarif": SarifWriter,
+}
+
+
+def create_result_writer(format_name: str, stream: TextIO) -> ResultWriter:
+    """Creates the writer of a structured output format.
+
+    Args:
+        format_name: One of the keys of `RESULT_WRITERS`.
+        stream: The stream the records are written to.
+
+    Returns:
+        A new writer; call its `start` method before writing.
+
+    Raises:
+        ValueError: If the format is unknown.
+    """
+    try:
+        return RESULT_WRITERS[format_name](stream)
+    except KeyError:
+        raise ValueError(f"Unknown output format: {format_name}") from None
@@ -0,0 +1,191 @@
+"""Measures where the time of a validation run is spent.
+
+The validator is instrumented with named phases (reading files, loading and
+building rules, parsing, running each rule's selector and constraint, typo
+detection, flake8, ...). Measuring is off by default: a phase only records
+its duration while a `Profiler` is active in the current context, so the
+instrumentation costs next to nothing in normal runs.
+
+Phases nest. A phase that starts while another one is running is recorded
+under a path such as ``rule[101]/constraint/typo_detection``, which keeps
+per-rule timings apart while still allowing totals per kind of phase.
+
+Example:
+    .. code-block:: python
+
+        profiler = Profiler()
+        with profiler.activate():
+            validator.run()
+        print(profiler.format_table())
+        json.dump(profiler.report(), sys.stdout)
+
+"""
+
+import contextvars
+import re
+import time
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from typing import Any, Iterator
+
+# The profiler that records phases in the current context, if any.
+_active_profiler: contextvars.ContextVar["Profiler | None"] = contextvars.ContextVar(
+    "code_validator_profiler", default=None
+)
+
+# Separator between the names of nested phases.
+PATH_SEPARATOR = "/"
+
+# The phase returned while profiling is off; nullcontext is reusable.
+_NO_PHASE = nullcontext()
+
+# Matches the instance part of a phase name, e.g. the "[101]" of "rule[101]".
+_INSTANCE_SUFFIX = re.compile(r"\[[^\]]*\]$")
+
+
+class Profiler:
+    """Collects monotonic timings of named, possibly nested phases.
+
+    Attributes:
+        _timings (dict[str, list]): Maps a phase path to `[count, total_seconds]`.
+        _stack (list[str]): The paths of the phases that are currently running.
+        _started (float): The `perf_counter` value when profiling started.
+        _elapsed (float | None): The wall time of the profiled run, once finished.
+        _token (contextvars.Token | None): The token to deactivate this profiler.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty profiler."""
+        self._timings: dict[str, list] = {}
+        self._stack: list[str] = []
+        self._started = time.perf_counter()
+        self._elapsed: float | None = None
+        self._token: contextvars.Token | None = None
+
+    def start(self) -> None:
+        """Makes this profiler record all phases started in the current context."""
+        self._token = _active_profiler.set(self)
+        self._started = time.perf_counter()
+        self._elapsed = None
+
+    def stop(self) -> None:
+        """Stops recording and fixes the total wall time of the run."""
+        self._elapsed = time.perf_counter() - self._started
+        if self._token is not None:
+            _active_profiler.reset(self._token)
+            self._token = None
+
+    @contextmanager
+    def activate(self) -> Iterator["Profiler"]:
+        """Records all phases started in the current context within a block.
+
+        Yields:
+            This profiler.
+        """
+        self.start()
+        try:
+            yield self
+        finally:
+            self.stop()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Measures the duration of a block of code.
+
+        Args:
+            name: The name of the phase, relative to the enclosing phase.
+        """
+        path = f"{self._stack[-1]}{PATH_SEPARATOR}{name}" if self._stack else name
+        self._stack.append(path)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            self._stack.pop()
+            entry = self._timings.get(path)
+            if entry is None:
+                self._timings[path] = [1, duration]
+            else:
+                entry[0] += 1
+                entry[1] += duration
+
+    def report(self) -> dict[str, Any]:
+        """Builds a machine-readable report of the recorded timings.
+
+        Returns:
+            A JSON-serializable dictionary with the total wall time, every
+            phase path (``phases``) and the totals per kind of phase across
+            all paths (``summary``, e.g. all ``rule[...]`` phases together),
+            both sorted by total time, slowest first. Times are in
+            milliseconds.
+        """
+        elapsed = self._elapsed if self._elapsed is not None else time.perf_counter() - self._started
+
+        summary: dict[str, list] = {}
+        for path, (count, total) in self._timings.items():
+            kind = _INSTANCE_SUFFIX.sub("", path.rsplit(PATH_SEPARATOR, 1)[-1])
+            entry = summary.setdefault(kind, [0, 0.0])
+            entry[0] += count
+            entry[1] += total
+
+        return {
+            "total_ms": elapsed * 1000,
+            "phases": _to_rows(self._timings),
+            "summary": _to_rows(summary),
+        }
+
+    def format_table(self) -> str:
+        """Formats the recorded timings as a human-readable table.
+
+        Returns:
+            A table of the totals per kind of phase followed by every phase path,
+            each sorted by total time, slowest first.
+        """
+        report = self.report()
+        lines = [f"Profile of validation run: {report['total_ms']:.2f} ms total"]
+        for title, rows in (("By phase", report["summary"]), ("By path", report["phases"])):
+            width = max([len(title)] + [len(row["name"]) for row in rows])
+            lines.append("")
+            lines.append(f"{title:<{width}}  {'calls':>7}  {'total ms':>10}  {'mean ms':>9}  {'%':>6}")
+            for row in rows:
+                share = row["total_ms"] / report["total_ms"] * 100 if report["total_ms"] else 0.0
+                lines.append(
+                    f"{row['name']:<{width}}  {row['count']:>7}  {row['total_ms']:>10.3f}  "
+                    f"{row['mean_ms']:>9.3f}  {share:>6.1f}"
+                )
+        return "\n".join(lines)
+
+
+def _to_rows(timings: dict[str, list]) -> list[dict[str, Any]]:
+    """Converts `[count, seconds]` entries into report rows, slowest first."""
+    rows = [
+        {"name": name, "count": count, "total_ms": total * 1000, "mean_ms": total * 1000 / count}
+        for name, (count, total) in timings.items()
+    ]
+    rows.sort(key=lambda row: row["total_ms"], reverse=True)
+    return rows
+
+
+def get_active_profiler() -> Profiler | None:
+    """Returns the profiler that is active in the current context, if any."""
+    return _active_profiler.get()
+
+
+def profile_phase(name: str, *args: object) -> AbstractContextManager:
+    """Returns a context manager that measures a phase if profiling is active.
+
+    A name with a per-call part is passed lazily, so that it is only
+    formatted while profiling, e.g. ``profile_phase("rule[%s]", rule_id)``.
+
+    Args:
+        name: The name of the phase, relative to the enclosing phase, or a
+            %-style format string for `args`.
+        *args: Arguments merged into `name` with the % operator.
+
+    Returns:
+        The active profiler's phase, or a no-op context manager.
+    """
+    profiler = _active_profiler.get()
+    if profiler is None:
+        return _NO_PHASE
+    return profiler.phase(name % args if args else name)
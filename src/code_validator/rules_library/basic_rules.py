@@ -8,12 +8,13 @@ instantiate the correct handler for each rule defined in a JSON file.
 """
 
 import ast
-import subprocess
-import sys
+from itertools import islice
 
+from ..components.context import ExecutionContext
 from ..components.definitions import Constraint, Rule, Selector
 from ..config import FullRuleConfig, ShortRuleConfig
 from ..output import Console, LogLevel, log_initialization
+from ..profiling import profile_phase
 
 
 class CheckSyntaxRule(Rule):
@@ -37,9 +38,10 @@ class CheckSyntaxRule(Rule):
         """
         self.config = config
         self._console = console
-        self.typo_suggestion: str | None = None
 
-    def execute(self, tree: ast.Module | None, source_code: str | None = None) -> bool:
+    def execute(
+        self, tree: ast.Module | None, source_code: str | None = None, context: ExecutionContext | None = None
+    ) -> bool:
         """Confirms that syntax is valid.
 
         This method is guaranteed to be called only after a successful AST parsing.
@@ -47,16 +49,16 @@ class CheckSyntaxRule(Rule):
         Returns:
             Always returns True.
         """
-        self._console.print(f"Rule {self.config.rule_id}: Syntax is valid.", level=LogLevel.INFO)
+        self._console.print("Rule %s: Syntax is valid.", self.config.rule_id, level=LogLevel.INFO)
         return True
 
 
 class CheckLinterRule(Rule):
     """Handles the 'check_linter_pep8' short rule by running flake8.
 
-    This rule executes the `flake8` linter as an external subprocess on the
-    source code to check for style and common programming errors. It is
-    configurable via the 'params' field in the JSON rule.
+    This rule runs the `flake8` linter in-process on the source code to check
+    for style and common programming errors. It is configurable via the
+    'params' field in the JSON rule.
     """
 
     @log_initialization(level=LogLevel.TRACE)
@@ -64,18 +66,29 @@ class CheckLinterRule(Rule):
         """Initializes a PEP8 linter check rule handler."""
         self.config = config
         self._console = console
-        self.typo_suggestion: str | None = None
 
-    def execute(self, tree: ast.Module | None, source_code: str | None = None) -> bool:
-        """Executes the flake8 linter on the source code via a subprocess.
+    @property
+    def flake8_params(self) -> tuple[list[str] | None, list[str] | None]:
+        """tuple[list[str] | None, list[str] | None]: The select and ignore codes passed to flake8."""
+        params = self.config.params
+        # As on the command line, an explicit selection takes precedence over ignores.
+        select_list = params.get("select") or None
+        ignore_list = None if select_list else params.get("ignore") or None
+        return select_list, ignore_list
+
+    def execute(
+        self, tree: ast.Module | None, source_code: str | None = None, context: ExecutionContext | None = None
+    ) -> bool:
+        """Executes the flake8 linter on the source code.
 
-        It constructs a command-line call to `flake8`, passing the source code
-        via stdin. This approach ensures isolation and uses flake8's stable
-        CLI interface.
+        The check runs through the shared `Flake8Engine`, which loads flake8's
+        plugins and configuration once per process. The source is linted from
+        memory and reported exactly as ``flake8 -`` would report it.
 
         Args:
             tree: Not used by this rule.
             source_code: The raw source code string to be linted.
+            context: Not used by this rule.
 
         Returns:
             True if no PEP8 violations are found, False otherwise.
@@ -84,47 +97,34 @@ class CheckLinterRule(Rule):
             self._console.print("Source code is empty, skipping PEP8 check.", level=LogLevel.WARNING)
             return True
 
-        self._console.print(f"Rule {self.config.rule_id}: Running PEP8 linter...", level=LogLevel.INFO)
+        self._console.print("Rule %s: Running PEP8 linter...", self.config.rule_id, level=LogLevel.INFO)
 
-        params = self.config.params
-        args = [sys.executable, "-m", "flake8", "-"]
+        select_list, ignore_list = self.flake8_params
 
-        if select_list := params.get("select"):
-            args.append(f"--select={','.join(select_list)}")
-        elif ignore_list := params.get("ignore"):
-            args.append(f"--ignore={','.join(ignore_list)}")
-
-        self._console.print(f"Arguments for flake8: {args}", level=LogLevel.TRACE)
+        self._console.print(
+            "Arguments for flake8: select=%s, ignore=%s", select_list, ignore_list, level=LogLevel.TRACE
+        )
 
         try:
-            process = subprocess.run(
-                args,
-                input=source_code,
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                check=False,
-            )
-
-            if process.returncode != 0 and process.stdout:
-                linter_output = process.stdout.strip()
-                self._console.print(f"Flake8 found issues:\n{linter_output}", level=LogLevel.WARNING, show_user=True)
-                return False
-            elif process.returncode != 0:
-                self._console.print(
-                    f"Flake8 exited with code {process.returncode}:\n{process.stderr}", level=LogLevel.ERROR
-                )
-                return False
+            with profile_phase("flake8"):
+                from ..components.linter import get_flake8_engine
 
-            self._console.print("PEP8 check passed.", level=LogLevel.INFO)
-            return True
-        except FileNotFoundError:
+                violations = get_flake8_engine().check(source_code, select=select_list, ignore=ignore_list)
+        except ImportError:
             self._console.print("flake8 not found. Is it installed in the venv?", level=LogLevel.CRITICAL)
             return False
         except Exception as e:
             self._console.print(f"An unexpected error occurred while running flake8: {e}", level=LogLevel.CRITICAL)
             return False
 
+        if violations:
+            linter_output = "\n".join(violation.format() for violation in violations)
+            self._console.print(f"Flake8 found issues:\n{linter_output}", level=LogLevel.WARNING, show_user=True)
+            return False
+
+        self._console.print("PEP8 check passed.", level=LogLevel.INFO)
+        return True
+
 
 class FullRuleHandler(Rule):
     """Handles a full, custom rule composed of a selector and a constraint.
@@ -154,14 +154,40 @@ class FullRuleHandler(Rule):
         self._selector = selector
         self._constraint = constraint
         self._console = console
-        self.typo_suggestion: str | None = None
 
-    def execute(self, tree: ast.Module | None, source_code: str | None = None) -> bool:
+    def _select_nodes(self, tree: ast.Module) -> list[ast.AST]:
+        """Runs the selector, stopping once the constraint has enough nodes.
+
+        If the constraint declares `max_nodes` and the selector can yield its
+        matches lazily, only that many matches are collected and the rest of
+        the search is skipped. Otherwise all matches are collected.
+
+        Args:
+            tree: The enriched AST of the source code.
+
+        Returns:
+            The selected nodes to pass to the constraint.
+        """
+        max_nodes = getattr(self._constraint, "max_nodes", None)
+        iter_select = getattr(self._selector, "iter_select", None)
+        if max_nodes is None or iter_select is None:
+            return self._selector.select(tree)
+        return list(islice(iter_select(tree), max_nodes))
+
+    def execute(
+        self, tree: ast.Module | None, source_code: str | None = None, context: ExecutionContext | None = None
+    ) -> bool:
         """Executes the rule by running the selector and applying the constraint.
 
+        If the constraint supports typo detection and fails, the typo
+        suggestion is stored in `context`. The constraint only prepares the
+        typo analysis; it runs when the suggestion is first read, so failures
+        that are never displayed cost nothing.
+
         Args:
             tree: The enriched AST of the source code.
             source_code: Not used by this rule.
+            context: The state of the current validation.
 
         Returns:
             The boolean result of applying the constraint to the selected nodes.
@@ -170,32 +196,35 @@ class FullRuleHandler(Rule):
             self._console.print("AST not available, skipping rule.", level=LogLevel.WARNING)
             return True
 
-        self._console.print(f"Applying selector: {self._selector.__class__.__name__}", level=LogLevel.TRACE)
-        selected_nodes = self._selector.select(tree)
+        if context is None:
+            context = ExecutionContext()
 
-        self._console.print(f"Applying constraint: {self._constraint.__class__.__name__}", level=LogLevel.TRACE)
+        self._console.print("Applying selector: %s", self._selector.__class__.__name__, level=LogLevel.TRACE)
+        with profile_phase("selector"):
+            selected_nodes = self._select_nodes(tree)
+
+        self._console.print("Applying constraint: %s", self._constraint.__class__.__name__, level=LogLevel.TRACE)
 
         # Check if constraint supports typo detection context
         if hasattr(self._constraint, "check_with_context"):
-            # Get file path from console context if available
-            file_path = getattr(self._console, "_current_file_path", "<unknown>")
-
-            context_result = self._constraint.check_with_context(
-                selected_nodes,
-                target_name=self.config.check.selector.name,
-                scope_config=self.config.check.selector.in_scope,
-                ast_tree=tree,
-                file_path=file_path,
-                console=self._console,
-            )
+            with profile_phase("constraint"):
+                context_result = self._constraint.check_with_context(
+                    selected_nodes,
+                    target_name=self.config.check.selector.name,
+                    scope_config=self.config.check.selector.in_scope,
+                    ast_tree=tree,
+                    context=context,
+                    console=self._console,
+                )
 
             # Handle both old (bool) and new (tuple) return formats
             if isinstance(context_result, tuple):
                 result, typo_suggestion = context_result
-                self.typo_suggestion = typo_suggestion
+                context.set_typo_suggestion(self, typo_suggestion)
                 return result
             else:
                 # Old format - just boolean result
                 return context_result
         else:
-            return self._constraint.check(selected_nodes)
+            with profile_phase("constraint"):
+                return self._constraint.check(selected_nodes)
@@ -10,12 +10,15 @@ used internally by the constraint classes.
 """
 
 import ast
-from typing import Any
+from functools import partial
+from typing import Any, Callable
 
 from .. import LogLevel
 from ..components.ast_utils import get_full_name
+from ..components.context import ExecutionContext
 from ..components.definitions import Constraint
 from ..output import log_initialization
+from ..profiling import profile_phase
 
 
 class IsRequiredConstraint(Constraint):
@@ -30,6 +33,10 @@ class IsRequiredConstraint(Constraint):
     JSON Params:
         count (int, optional): If provided, checks if the number of found
             nodes is exactly equal to this value.
+
+    Attributes:
+        max_nodes (int): The number of matches that decides the verdict: one
+            without `count`, otherwise `count + 1`.
     """
 
     @log_initialization(level=LogLevel.TRACE)
@@ -40,7 +47,7 @@ class IsRequiredConstraint(Constraint):
             **kwargs: Configuration for the constraint, e.g., 'count'.
         """
         self.expected_count = kwargs.get("count")
-        self._typo_detector = None  # Lazy initialization
+        self.max_nodes = max(self.expected_count, 0) + 1 if isinstance(self.expected_count, int) else 1
 
     def check(self, nodes: list[ast.AST]) -> bool:
         """Checks if the list of nodes is not empty or matches expected count."""
@@ -54,37 +61,48 @@ class IsRequiredConstraint(Constraint):
         target_name: str,
         scope_config: dict[str, Any] | str,
         ast_tree: ast.Module,
-        file_path: str,
+        context: ExecutionContext,
         console,
-    ) -> tuple[bool, str | None]:
+    ) -> tuple[bool, Callable[[], str | None] | None]:
         """Enhanced check with typo detection support.
 
         Performs the standard constraint check, and if it fails due to no nodes
-        being found, analyzes potential typos and provides helpful suggestions.
+        being found, prepares an analysis of potential typos. The analysis is
+        deferred: it runs only when the returned callable is invoked, which
+        the rule handler does once the suggestion is actually displayed.
 
         Args:
             nodes: List of AST nodes found by the selector
             target_name: The name that was being searched for
             scope_config: Scope configuration for the search
             ast_tree: The complete AST tree for analysis
-            file_path: Path to the source file
+            context: The state of the current validation, with the file path
+                and the typo detector
             console: Console instance for output
 
         Returns:
-            Tuple of (constraint_result, typo_suggestion_message)
+            Tuple of (constraint_result, deferred_typo_suggestion), where the
+            second item returns the suggestion message or None when called
         """
         # Perform standard check first
         standard_result = self.check(nodes)
 
-        # If check fails and no nodes found, try typo detection
+        # If check fails and no nodes found, defer typo detection until it is needed
         if not standard_result and len(nodes) == 0 and target_name:
-            typo_suggestion = self._analyze_typo_and_suggest(target_name, scope_config, ast_tree, file_path, console)
+            typo_suggestion = partial(
+                self._analyze_typo_and_suggest, target_name, scope_config, ast_tree, context, console
+            )
             return standard_result, typo_suggestion
 
         return standard_result, None
 
     def _analyze_typo_and_suggest(
-        self, target_name: str, scope_config: dict[str, Any] | str, ast_tree: ast.Module, file_path: str, console
+        self,
+        target_name: str,
+        scope_config: dict[str, Any] | str,
+        ast_tree: ast.Module,
+        context: ExecutionContext,
+        console,
     ) -> str | None:
         """Analyze potential typos and return suggestion message.
 
@@ -92,21 +110,18 @@ class IsRequiredConstraint(Constraint):
             target_name: The name that was being searched for
             scope_config: Scope configuration for the search
             ast_tree: The complete AST tree for analysis
-            file_path: Path to the source file
+            context: The state of the current validation
             console: Console instance for output
 
         Returns:
             User-friendly typo suggestion message or None if no suggestion
         """
         try:
-            # Lazy import to avoid circular dependencies
-            if self._typo_detector is None:
-                from ..components.typo_detection import TypoDetector
-
-                self._typo_detector = TypoDetector()
-
             # Analyze failed search for typos
-            suggestion = self._typo_detector.analyze_failed_search(target_name, scope_config, ast_tree, file_path)
+            with profile_phase("typo_detection"):
+                suggestion = context.typo_detector.analyze_failed_search(
+                    target_name, scope_config, ast_tree, context.file_path
+                )
 
             # Log debug information
             console.print(suggestion.debug_info, level=LogLevel.DEBUG)
@@ -114,14 +129,14 @@ class IsRequiredConstraint(Constraint):
             # If we have a good suggestion, return full formatted message
             if suggestion.has_suggestion:
                 # Log detailed suggestion for debugging
-                console.print(f"Typo suggestion: {suggestion.message}", level=LogLevel.INFO)
+                console.print("Typo suggestion: %s", suggestion.message, level=LogLevel.INFO)
 
                 # Return full formatted message for user display
                 return suggestion.message
 
         except Exception as e:
             # Don't let typo detection break the main validation
-            console.print(f"Typo detection failed: {e}", level=LogLevel.DEBUG)
+            console.print("Typo detection failed: %s", e, level=LogLevel.DEBUG)
 
         return None
 
@@ -131,8 +146,13 @@ class IsForbiddenConstraint(Constraint):
 
     This is the inverse of `IsRequiredConstraint` and is used to forbid certain
     constructs, such as specific function calls or imports.
+
+    Attributes:
+        max_nodes (int): A single match already decides the verdict.
     """
 
+    max_nodes = 1
+
     @log_initialization(level=LogLevel.TRACE)
     def __init__(self, **kwargs: Any):
         """Initializes the constraint."""
@@ -152,8 +172,13 @@ class MustInheritFromConstraint(Constraint):
 
     JSON Params:
         parent_name (str): The expected name of the parent class.
+
+    Attributes:
+        max_nodes (int): A second match already makes the check fail.
     """
 
+    max_nodes = 2
+
     @log_initialization(level=LogLevel.TRACE)
     def __init__(self, **kwargs: Any):
         """Initializes the constraint.
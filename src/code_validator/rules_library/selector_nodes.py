@@ -2,15 +2,18 @@
 
 Each class in this module implements the `Selector` protocol and is responsible
 for finding and returning specific types of nodes from an Abstract Syntax Tree.
-They use `ast.walk` to traverse the tree and can be constrained to specific
-scopes via the `ScopedSelector` base class, which uses the `scope_handler`.
+Matches are produced lazily by `iter_select`, so a rule whose constraint only
+needs the first few of them can stop the search early.
+They look nodes up in the tree's `AstIndex` (falling back to `ast.walk` for
+trees that were never enriched) and can be constrained to specific scopes via
+the `ScopedSelector` base class, which uses the `scope_handler`.
 These classes are instantiated by the `SelectorFactory`.
 """
 
 import ast
-from typing import Any
+from typing import Any, Iterable, Iterator
 
-from ..components.ast_utils import get_full_name
+from ..components.ast_utils import get_ast_index, get_full_name
 from ..components.definitions import Selector
 from ..components.scope_handler import find_scope_node
 from ..output import LogLevel, log_initialization
@@ -56,10 +59,41 @@ class ScopedSelector(Selector):
         scope_node = find_scope_node(tree, self.in_scope_config)
         return scope_node
 
-    def select(self, tree: ast.Module) -> list[ast.AST]:
-        """Abstract select method to be implemented by subclasses."""
+    @staticmethod
+    def _iter_nodes(tree: ast.Module, search_tree: ast.AST, node_types: type | tuple[type, ...]) -> Iterable[ast.AST]:
+        """Returns the nodes of the given types inside `search_tree`.
+
+        The lookup goes through the tree's `AstIndex`, so no traversal is
+        needed. Trees without an index are walked with `ast.walk`, in which
+        case nodes of other types are returned too and must be filtered by
+        the caller.
+
+        Args:
+            tree: The root of the full AST.
+            search_tree: The subtree to search in (included in the results).
+            node_types: The AST node class or classes of interest.
+
+        Returns:
+            The candidate nodes, in `ast.walk` order.
+        """
+        index = get_ast_index(tree)
+        if index is None:
+            return ast.walk(search_tree)
+        return index.nodes_of_type(node_types, within=search_tree)
+
+    def iter_select(self, tree: ast.Module) -> Iterator[ast.AST]:
+        """Lazily yields the matching nodes, to be implemented by subclasses.
+
+        Nodes are yielded in the same order as `select` returns them, so a
+        caller that only needs the first few matches can stop early and
+        skip the rest of the search.
+        """
         raise NotImplementedError
 
+    def select(self, tree: ast.Module) -> list[ast.AST]:
+        """Returns all nodes yielded by `iter_select` as a list."""
+        return list(self.iter_select(tree))
+
 
 class FunctionDefSelector(ScopedSelector):
     """Selects function definition (`def`) nodes from an AST.
@@ -79,26 +113,23 @@ class FunctionDefSelector(ScopedSelector):
         super().__init__(**kwargs)
         self.name_to_find = kwargs.get("name")
 
-    def select(self, tree: ast.Module) -> list[ast.AST]:
+    def iter_select(self, tree: ast.Module) -> Iterator[ast.AST]:
         """Finds all `ast.FunctionDef` nodes that match the name criteria."""
         search_tree = self._get_search_tree(tree)
         if not search_tree:
-            return []
-
-        found_nodes: list[ast.AST] = []
+            return
 
         # Для глобального scope ищем только в tree.body, не рекурсивно
         if self.in_scope_config == "global":
             nodes_to_check = search_tree.body
         else:
-            # Для других scope используем ast.walk как раньше
-            nodes_to_check = ast.walk(search_tree)
+            # Для других scope берём узлы нужного типа из индекса AST
+            nodes_to_check = self._iter_nodes(tree, search_tree, ast.FunctionDef)
 
         for node in nodes_to_check:
             if isinstance(node, ast.FunctionDef):
                 if self.name_to_find == "*" or node.name == self.name_to_find:
-                    found_nodes.append(node)
-        return found_nodes
+                    yield node
 
 
 class ClassDefSelector(ScopedSelector):
@@ -114,26 +145,23 @@ class ClassDefSelector(ScopedSelector):
         super().__init__(**kwargs)
         self.name_to_find = kwargs.get("name")
 
-    def select(self, tree: ast.Module) -> list[ast.AST]:
+    def iter_select(self, tree: ast.Module) -> Iterator[ast.AST]:
         """Finds all `ast.ClassDef` nodes that match the name criteria."""
         search_tree = self._get_search_tree(tree)
         if not search_tree:
-            return []
-
-        found_nodes: list[ast.AST] = []
+            return
 
         # Для глобального scope ищем только в tree.body, не рекурсивно
         if self.in_scope_config == "global":
             nodes_to_check = search_tree.body
         else:
-            # Для других scope используем ast.walk как раньше
-            nodes_to_check = ast.walk(search_tree)
+            # Для других scope берём узлы нужного типа из индекса AST
+            nodes_to_check = self._iter_nodes(tree, search_tree, ast.ClassDef)
 
         for node in nodes_to_check:
             if isinstance(node, ast.ClassDef):
                 if self.name_to_find == "*" or node.name == self.name_to_find:
-                    found_nodes.append(node)
-        return found_nodes
+                    yield node
 
 
 class ImportStatementSelector(ScopedSelector):
@@ -154,23 +182,21 @@ class ImportStatementSelector(ScopedSelector):
         super().__init__(**kwargs)
         self.module_name_to_find = kwargs.get("name")
 
-    def select(self, tree: ast.Module) -> list[ast.AST]:
+    def iter_select(self, tree: ast.Module) -> Iterator[ast.AST]:
         """Finds all import-related nodes that match the name criteria."""
         if not self.module_name_to_find:
-            return []
+            return
 
         search_tree = self._get_search_tree(tree)
         if not search_tree:
-            return []
-
-        found_nodes: list[ast.AST] = []
+            return
 
         # Для глобального scope ищем только в tree.body, не рекурсивно
         if self.in_scope_config == "global":
             nodes_to_check = search_tree.body
         else:
-            # Для других scope используем ast.walk как раньше
-            nodes_to_check = ast.walk(search_tree)
+            # Для других scope берём узлы нужного типа из индекса AST
+            nodes_to_check = self._iter_nodes(tree, search_tree, (ast.Import, ast.ImportFrom))
 
         for node in nodes_to_check:
             if isinstance(node, ast.Import):
@@ -178,13 +204,11 @@ class ImportStatementSelector(ScopedSelector):
                     # Проверяем 'os' в 'import os.path'
                     module_parts = alias.name.split(".")
                     if alias.name.startswith(self.module_name_to_find) or self.module_name_to_find in module_parts:
-                        found_nodes.append(node)
+                        yield node
                         break
             elif isinstance(node, ast.ImportFrom):
                 if node.module and node.module.startswith(self.module_name_to_find):
-                    found_nodes.append(node)
-
-        return found_nodes
+                    yield node
 
 
 class FunctionCallSelector(ScopedSelector):
@@ -203,13 +227,11 @@ class FunctionCallSelector(ScopedSelector):
         super().__init__(**kwargs)
         self.name_to_find = kwargs.get("name")
 
-    def select(self, tree: ast.Module) -> list[ast.AST]:
+    def iter_select(self, tree: ast.Module) -> Iterator[ast.AST]:
         """Finds all `ast.Call` nodes that match the name criteria."""
         search_tree = self._get_search_tree(tree)
         if not search_tree:
-            return []
-
-        found_nodes: list[ast.AST] = []
+            return
 
         # Для глобального scope ищем на уровне модуля, но включаем содержимое if __name__ == "__main__"
         if self.in_scope_config == "global":
@@ -218,23 +240,22 @@ class FunctionCallSelector(ScopedSelector):
                 if isinstance(node, ast.Call):
                     full_name = get_full_name(node.func)
                     if full_name and full_name == self.name_to_find:
-                        found_nodes.append(node)
+                        yield node
                 elif isinstance(node, ast.If):
                     # Проверяем, является ли это if __name__ == "__main__"
                     if self._is_main_guard(node):
-                        for child in ast.walk(node):
+                        for child in self._iter_nodes(tree, node, ast.Call):
                             if isinstance(child, ast.Call):
                                 full_name = get_full_name(child.func)
                                 if full_name and full_name == self.name_to_find:
-                                    found_nodes.append(child)
+                                    yield child
         else:
-            # Для других scope используем ast.walk как раньше
-            for node in ast.walk(search_tree):
+            # Для других scope берём узлы нужного типа из индекса AST
+            for node in self._iter_nodes(tree, search_tree, ast.Call):
                 if isinstance(node, ast.Call):
                     full_name = get_full_name(node.func)
                     if full_name and full_name == self.name_to_find:
-                        found_nodes.append(node)
-        return found_nodes
+                        yield node
 
     @staticmethod
     def _is_main_guard(node: ast.If) -> bool:
@@ -277,20 +298,18 @@ class AssignmentSelector(ScopedSelector):
         super().__init__(**kwargs)
         self.target_name_to_find = kwargs.get("name")
 
-    def select(self, tree: ast.Module) -> list[ast.AST]:
+    def iter_select(self, tree: ast.Module) -> Iterator[ast.AST]:
         """Finds all `ast.Assign` or `ast.AnnAssign` nodes matching the target name."""
         search_tree = self._get_search_tree(tree)
         if not search_tree:
-            return []
-
-        found_nodes: list[ast.AST] = []
+            return
 
         # Для глобального scope ищем только в tree.body, не рекурсивно
         if self.in_scope_config == "global":
             nodes_to_check = search_tree.body
         else:
-            # Для других scope используем ast.walk как раньше
-            nodes_to_check = ast.walk(search_tree)
+            # Для других scope берём узлы нужного типа из индекса AST
+            nodes_to_check = self._iter_nodes(tree, search_tree, (ast.Assign, ast.AnnAssign))
 
         for node in nodes_to_check:
             # Мы поддерживаем и простое присваивание (x=5), и с аннотацией (x: int = 5)
@@ -300,8 +319,7 @@ class AssignmentSelector(ScopedSelector):
                 for target in targets:
                     full_name = get_full_name(target)
                     if full_name and (self.target_name_to_find == "*" or full_name == self.target_name_to_find):
-                        found_nodes.append(node)
-        return found_nodes
+                        yield node
 
 
 class UsageSelector(ScopedSelector):
@@ -326,28 +344,25 @@ class UsageSelector(ScopedSelector):
         super().__init__(**kwargs)
         self.variable_name_to_find = kwargs.get("name")
 
-    def select(self, tree: ast.Module) -> list[ast.AST]:
+    def iter_select(self, tree: ast.Module) -> Iterator[ast.AST]:
         """Finds all `ast.Name` nodes (in load context) matching the name."""
         search_tree = self._get_search_tree(tree)
         if not search_tree:
-            return []
-
-        found_nodes: list[ast.AST] = []
+            return
 
         # Для глобального scope ищем только в tree.body, не рекурсивно
         if self.in_scope_config == "global":
             nodes_to_check = search_tree.body
         else:
-            # Для других scope используем ast.walk как раньше
-            nodes_to_check = ast.walk(search_tree)
+            # Для других scope берём узлы нужного типа из индекса AST
+            nodes_to_check = self._iter_nodes(tree, search_tree, (ast.Name, ast.Attribute))
 
         for node in nodes_to_check:
             # Проверяем и простые имена, и атрибуты, когда их "читают"
             if isinstance(node, (ast.Name, ast.Attribute)) and isinstance(getattr(node, "ctx", None), ast.Load):
                 full_name = get_full_name(node)
                 if full_name and full_name == self.variable_name_to_find:
-                    found_nodes.append(node)
-        return found_nodes
+                    yield node
 
 
 class LiteralSelector(ScopedSelector):
@@ -369,37 +384,35 @@ class LiteralSelector(ScopedSelector):
         super().__init__(**kwargs)
         self.literal_type = kwargs.get("name")
 
-    def select(self, tree: ast.Module) -> list[ast.AST]:
+    def iter_select(self, tree: ast.Module) -> Iterator[ast.AST]:
         """Finds all ast.Constant nodes that match the type criteria.
 
         This method traverses the given AST (or a sub-tree defined by `in_scope`)
-        and collects all number or string literals. It contains special logic
+        and yields all number or string literals. It contains special logic
         to intelligently ignore nodes that are likely to be docstrings or parts
         of f-strings to avoid false positives.
 
         Args:
             tree: The root of the AST (the module object) to be searched.
 
-        Returns:
-            A list of `ast.Constant` nodes matching the criteria.
+        Yields:
+            The `ast.Constant` nodes matching the criteria.
         """
         search_tree = self._get_search_tree(tree)
         if not search_tree:
-            return []
+            return
 
         type_map = {"number": (int, float), "string": (str,)}
         expected_py_types = type_map.get(self.literal_type)
         if not expected_py_types:
-            return []
-
-        found_nodes: list[ast.AST] = []
+            return
 
         # Для глобального scope ищем только в tree.body, не рекурсивно
         if self.in_scope_config == "global":
             nodes_to_check = search_tree.body
         else:
-            # Для других scope используем ast.walk как раньше
-            nodes_to_check = ast.walk(search_tree)
+            # Для других scope берём узлы нужного типа из индекса AST
+            nodes_to_check = self._iter_nodes(tree, search_tree, ast.Constant)
 
         for node in nodes_to_check:
             # Мы ищем только узлы Constant
@@ -418,9 +431,7 @@ class LiteralSelector(ScopedSelector):
             if hasattr(node, "parent") and isinstance(node.parent, ast.JoinedStr):
                 continue
 
-            found_nodes.append(node)
-
-        return found_nodes
+            yield node
 
 
 class AstNodeSelector(ScopedSelector):
@@ -452,22 +463,19 @@ class AstNodeSelector(ScopedSelector):
         else:
             self.node_types_to_find = ()
 
-    def select(self, tree: ast.Module) -> list[ast.AST]:
+    def iter_select(self, tree: ast.Module) -> Iterator[ast.AST]:
         """Finds all AST nodes that are instances of the specified types."""
         search_tree = self._get_search_tree(tree)
         if not search_tree or not self.node_types_to_find:
-            return []
-
-        found_nodes: list[ast.AST] = []
+            return
 
         # Для глобального scope ищем только в tree.body, не рекурсивно
         if self.in_scope_config == "global":
             nodes_to_check = search_tree.body
         else:
-            # Для других scope используем ast.walk как раньше
-            nodes_to_check = ast.walk(search_tree)
+            # Для других scope берём узлы нужного типа из индекса AST
+            nodes_to_check = self._iter_nodes(tree, search_tree, self.node_types_to_find)
 
         for node in nodes_to_check:
             if isinstance(node, self.node_types_to_find):
-                found_nodes.append(node)
-        return found_nodes
+                yield node
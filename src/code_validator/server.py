@@ -0,0 +1,480 @@
+"""Serves validation requests from a long-running process.
+
+Starting `validate-code` for every submission pays for interpreter start-up,
+rule compilation and flake8 plugin loading on each call. A `ValidationServer`
+does that work once: it compiles every rule set when it starts, warms the
+flake8 engine if any rule needs it, and then answers requests over HTTP on a
+local TCP port or a Unix domain socket.
+
+The protocol is plain JSON over HTTP/1.1 (connections are kept alive):
+
+- ``POST /validate`` with ``{"source": "...", "rules": "<id>"}`` and the
+  optional keys ``"path"`` (the display name used in the result) and
+  ``"exit_on_first_error"``. The response is the `ValidationResult` as JSON
+  plus the ``rules`` id and the server-side ``elapsed_ms``.
+- ``GET /health`` returns the status, the version, the loaded rule set ids and
+  request counters.
+
+A rule set is identified by the stem of its file name, so ``rules/lab1.json``
+is requested as ``"lab1"``. If the server holds a single rule set, ``rules``
+may be omitted.
+
+Validation runs in a pool of worker processes, each of which compiles all rule
+sets once in its initializer. With ``jobs=1`` requests are validated by a
+single thread of the server process instead, which has the lowest latency
+when requests do not overlap. A request that does not finish within
+``timeout`` seconds is answered with ``504``; a validation that is already
+running cannot be interrupted and keeps its worker busy until it finishes.
+
+Example:
+    .. code-block:: python
+
+        rule_files = discover_rule_files([Path("rules/")])
+        with ValidationServer(rule_files, console, jobs=4) as server:
+            http_server = server.create_http_server(port=8765)
+            http_server.serve_forever()
+
+"""
+
+import json
+import os
+import socket
+import socketserver
+import stat
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import partial
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from . import __version__
+from .config import LogLevel, ValidationResult
+from .core import CompiledRuleSet
+from .exceptions import RuleParsingError
+from .output import Console, log_initialization, setup_logging
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_MAX_REQUEST_BYTES = 4 * 1024 * 1024
+
+# The rule sets compiled by `_init_worker`, one dictionary per worker process.
+_worker_rule_sets: dict[str, CompiledRuleSet] = {}
+
+
+def discover_rule_files(inputs: Iterable[str | Path]) -> dict[str, Path]:
+    """Maps rule set ids to rules files.
+
+    Args:
+        inputs: JSON rules files, or directories whose ``*.json`` files are
+            all served.
+
+    Returns:
+        The rules files keyed by their file name stem, sorted by id.
+
+    Raises:
+        FileNotFoundError: If an input does not exist.
+        RuleParsingError: If two rules files have the same id.
+    """
+    rule_files: dict[str, Path] = {}
+    for raw in inputs:
+        path = Path(raw)
+        if path.is_dir():
+            candidates = sorted(path.glob("*.json"))
+        elif path.is_file():
+            candidates = [path]
+        else:
+            raise FileNotFoundError(2, "Rules file not found", str(path))
+
+        for candidate in candidates:
+            if candidate.stem in rule_files:
+                raise RuleParsingError(
+                    f"Duplicate rule set id '{candidate.stem}': {rule_files[candidate.stem]} and {candidate}"
+                )
+            rule_files[candidate.stem] = candidate
+
+    return dict(sorted(rule_files.items()))
+
+
+def _compile_rule_sets(rule_files: dict[str, Path], console: Console) -> dict[str, CompiledRuleSet]:
+    """Compiles every rule set and warms the flake8 engine if a rule uses it.
+
+    Args:
+        rule_files: The rules files keyed by rule set id.
+        console: The console used by the compiled rules.
+
+    Returns:
+        The compiled rule sets keyed by id.
+    """
+    rule_sets = {rules_id: CompiledRuleSet.from_file(path, console) for rules_id, path in rule_files.items()}
+
+    uses_linter = any(
+        getattr(rule.config, "type", None) == "check_linter_pep8"
+        for rule_set in rule_sets.values()
+        for rule in rule_set.rules
+    )
+    if uses_linter:
+        try:
+            from .components.linter import get_flake8_engine
+
+            get_flake8_engine()
+        except ImportError:
+            console.print("flake8 is not installed; linter rules will fail.", level=LogLevel.WARNING)
+
+    return rule_sets
+
+
+def _init_worker(rule_files: dict[str, Path], log_level: LogLevel, queued_logging: bool = False) -> None:
+    """Compiles all rule sets once per worker process.
+
+    Args:
+        rule_files: The rules files keyed by rule set id.
+        log_level: The logging level for the worker.
+        queued_logging: If True, the worker logs through a background thread.
+    """
+    global _worker_rule_sets
+
+    console = Console(setup_logging(log_level, queued=queued_logging), is_quiet=True)
+    _worker_rule_sets = _compile_rule_sets(rule_files, console)
+
+
+def _validate_with(
+    rule_sets: dict[str, CompiledRuleSet], rules_id: str, source_code: str, path: str, exit_on_first_error: bool
+) -> ValidationResult:
+    """Validates one source with one of the given rule sets.
+
+    Args:
+        rule_sets: The compiled rule sets keyed by id.
+        rules_id: The id of the rule set to apply.
+        source_code: The source code to validate.
+        path: The display name of the source.
+        exit_on_first_error: If True, halts after the first failed rule.
+
+    Returns:
+        The validation result.
+    """
+    return rule_sets[rules_id].validate_source(source_code, path, exit_on_first_error=exit_on_first_error)
+
+
+def _validate_in_worker(rules_id: str, source_code: str, path: str, exit_on_first_error: bool) -> ValidationResult:
+    """Validates one source with the rule sets compiled by `_init_worker`."""
+    return _validate_with(_worker_rule_sets, rules_id, source_code, path, exit_on_first_error)
+
+
+def _ping() -> int:
+    """Returns the id of the worker process; used to start all workers up front."""
+    return os.getpid()
+
+
+class ValidationServer:
+    """Keeps rule sets warm and validates sources on a pool of workers.
+
+    The object is independent of the transport: `validate` and
+    `handle_validate` can be called directly, and `create_http_server` binds
+    it to a TCP port or a Unix socket.
+
+    Attributes:
+        rule_files (dict[str, Path]): The served rules files keyed by id.
+        jobs (int): The number of workers validating in parallel.
+        timeout (float): The maximum time in seconds to wait for a verdict.
+        max_request_bytes (int): The size limit of a request body.
+        console (Console): The handler for all logging.
+    """
+
+    @log_initialization(level=LogLevel.DEBUG)
+    def __init__(
+        self,
+        rule_files: dict[str, Path],
+        console: Console,
+        *,
+        jobs: int = 0,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_request_bytes: int = DEFAULT_MAX_REQUEST_BYTES,
+        log_level: LogLevel = LogLevel.ERROR,
+        queued_logging: bool = False,
+    ):
+        """Compiles the rule sets and starts the worker pool.
+
+        Args:
+            rule_files: The rules files keyed by rule set id, e.g. from
+                `discover_rule_files`.
+            console: The handler for all logging.
+            jobs: The number of worker processes. 0 uses every available
+                CPU, 1 validates in a single thread of this process.
+            timeout: The maximum time in seconds to wait for a verdict.
+            max_request_bytes: The size limit of a request body.
+            log_level: The logging level for worker processes.
+            queued_logging: If True, worker processes log through a
+                background thread (see `setup_logging`).
+
+        Raises:
+            FileNotFoundError: If a rules file does not exist.
+            RuleParsingError: If there are no rule sets or one is invalid.
+        """
+        if not rule_files:
+            raise RuleParsingError("No rules files to serve.")
+
+        self.rule_files = dict(rule_files)
+        self.jobs = jobs or os.cpu_count() or 1
+        self.timeout = timeout
+        self.max_request_bytes = max_request_bytes
+        self.console = console
+
+        # Compiling here surfaces rule errors before the server accepts requests. Like the
+        # workers, the rules log with the server's logger but never print to its stdout.
+        rule_sets = _compile_rule_sets(self.rule_files, Console(console.logger, is_quiet=True))
+
+        self._executor: Executor
+        self._task: Callable[..., ValidationResult]
+        if self.jobs == 1:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="code-validator")
+            self._task = partial(_validate_with, rule_sets)
+        else:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.jobs, initializer=_init_worker, initargs=(self.rule_files, log_level, queued_logging)
+            )
+            self._task = _validate_in_worker
+            # Start every worker now, so that no request pays for compiling rules.
+            for future in [self._executor.submit(_ping) for _ in range(self.jobs)]:
+                future.result()
+
+        self._started = time.monotonic()
+        self._stats_lock = threading.Lock()
+        self._stats = {"requests": 0, "failed_requests": 0, "timeouts": 0}
+        console.print(f"Serving rule sets: {', '.join(self.rule_files)} with {self.jobs} workers", level=LogLevel.INFO)
+
+    def __enter__(self) -> "ValidationServer":
+        """Returns the server itself."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stops the worker pool."""
+        self.close()
+
+    def close(self) -> None:
+        """Stops the worker pool, cancelling validations that have not started."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def validate(
+        self, source_code: str, rules_id: str, *, path: str = "<string>", exit_on_first_error: bool = False
+    ) -> ValidationResult:
+        """Validates a source with one of the served rule sets.
+
+        Args:
+            source_code: The source code to validate.
+            rules_id: The id of the rule set to apply.
+            path: The display name of the source.
+            exit_on_first_error: If True, halts after the first failed rule.
+
+        Returns:
+            The validation result.
+
+        Raises:
+            KeyError: If there is no rule set with this id.
+            TimeoutError: If no verdict was reached within `timeout` seconds.
+        """
+        if rules_id not in self.rule_files:
+            raise KeyError(rules_id)
+
+        future = self._executor.submit(self._task, rules_id, source_code, path, exit_on_first_error)
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise TimeoutError(f"Validation did not finish within {self.timeout:g} seconds.") from None
+
+    def handle_validate(self, payload: Any) -> tuple[HTTPStatus, dict[str, Any]]:
+        """Answers a decoded ``/validate`` request.
+
+        Args:
+            payload: The decoded JSON body of the request.
+
+        Returns:
+            The HTTP status and the JSON-serializable response body.
+        """
+        start = time.perf_counter()
+        status, body = self._handle_validate(payload)
+        body["elapsed_ms"] = (time.perf_counter() - start) * 1000
+
+        with self._stats_lock:
+            self._stats["requests"] += 1
+            if status != HTTPStatus.OK:
+                self._stats["failed_requests"] += 1
+            if status == HTTPStatus.GATEWAY_TIMEOUT:
+                self._stats["timeouts"] += 1
+        return status, body
+
+    def _handle_validate(self, payload: Any) -> tuple[HTTPStatus, dict[str, Any]]:
+        """Validates the request fields and runs the validation."""
+        if not isinstance(payload, dict) or not isinstance(payload.get("source"), str):
+            return HTTPStatus.BAD_REQUEST, {"error": "The request must be a JSON object with a 'source' string."}
+
+        rules_id = payload.get("rules")
+        if rules_id is None and len(self.rule_files) == 1:
+            rules_id = next(iter(self.rule_files))
+        if not isinstance(rules_id, str):
+            return HTTPStatus.BAD_REQUEST, {"error": f"'rules' must be one of: {', '.join(self.rule_files)}."}
+
+        path = payload.get("path", "<string>")
+        exit_on_first_error = payload.get("exit_on_first_error", False)
+        if not isinstance(path, str) or not isinstance(exit_on_first_error, bool):
+            return HTTPStatus.BAD_REQUEST, {"error": "'path' must be a string and 'exit_on_first_error' a boolean."}
+
+        try:
+            result = self.validate(payload["source"], rules_id, path=path, exit_on_first_error=exit_on_first_error)
+        except KeyError:
+            return HTTPStatus.NOT_FOUND, {"error": f"Unknown rule set '{rules_id}'."}
+        except TimeoutError as e:
+            self.console.print(f"Request for rule set '{rules_id}' timed out.", level=LogLevel.WARNING)
+            return HTTPStatus.GATEWAY_TIMEOUT, {"error": str(e)}
+        except Exception as e:
+            self.console.print(f"Validation failed with {e.__class__.__name__}: {e}", level=LogLevel.ERROR)
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"{e.__class__.__name__}: {e}"}
+
+        return HTTPStatus.OK, {"rules": rules_id, **result.to_dict()}
+
+    def health(self) -> dict[str, Any]:
+        """Describes the state of the server.
+
+        Returns:
+            The status, version, worker count, rule set ids, uptime and
+            request counters.
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+        return {
+            "status": "ok",
+            "version": __version__,
+            "jobs": self.jobs,
+            "rule_sets": list(self.rule_files),
+            "uptime_seconds": time.monotonic() - self._started,
+            **stats,
+        }
+
+    def create_http_server(
+        self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, *, socket_path: Path | None = None
+    ) -> socketserver.BaseServer:
+        """Binds an HTTP front-end for this server.
+
+        Each connection is handled in its own thread; the validations
+        themselves run on the worker pool.
+
+        Args:
+            host: The interface to listen on.
+            port: The TCP port to listen on. 0 picks a free port.
+            socket_path: If given, listen on this Unix socket instead of TCP.
+                A stale socket file at this path is replaced.
+
+        Returns:
+            The bound server; call `serve_forever` to start answering requests.
+        """
+        if socket_path is None:
+            return _TCPServer((host, port), _RequestHandler, self)
+
+        socket_path = Path(socket_path)
+        if socket_path.exists() and stat.S_ISSOCK(socket_path.stat().st_mode):
+            socket_path.unlink()
+        return _UnixServer(str(socket_path), _RequestHandler, self)
+
+
+class _TCPServer(ThreadingHTTPServer):
+    """A threading HTTP server on a TCP port that knows its `ValidationServer`."""
+
+    request_queue_size = 128
+
+    def __init__(self, address: tuple[str, int], handler: type, validation_server: ValidationServer):
+        """Binds the server to `address`."""
+        self.validation_server = validation_server
+        super().__init__(address, handler)
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """A threading HTTP server on a Unix socket that knows its `ValidationServer`."""
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, path: str, handler: type, validation_server: ValidationServer):
+        """Binds the server to the socket file at `path`."""
+        self.validation_server = validation_server
+        super().__init__(path, handler)
+
+    def server_close(self) -> None:
+        """Closes the socket and removes its file."""
+        super().server_close()
+        Path(self.server_address).unlink(missing_ok=True)
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Translates HTTP requests into calls on the `ValidationServer`."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = f"code-validator/{__version__}"
+    server: _TCPServer | _UnixServer
+
+    def setup(self) -> None:
+        """Applies the request timeout to reads from slow clients."""
+        self.timeout = self.server.validation_server.timeout
+        super().setup()
+        if self.server.address_family != socket.AF_UNIX:
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_GET(self) -> None:
+        """Answers ``GET /health``."""
+        if self.path != "/health":
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown endpoint: {self.path}"})
+            return
+        self._send_json(HTTPStatus.OK, self.server.validation_server.health())
+
+    def do_POST(self) -> None:
+        """Answers ``POST /validate``."""
+        validation_server = self.server.validation_server
+        if self.path != "/validate":
+            self.close_connection = True
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown endpoint: {self.path}"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            self.close_connection = True
+            self._send_json(HTTPStatus.LENGTH_REQUIRED, {"error": "A Content-Length header is required."})
+            return
+        if length < 0:
+            self.close_connection = True
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": "The Content-Length header must not be negative."})
+            return
+        if length > validation_server.max_request_bytes:
+            self.close_connection = True
+            self._send_json(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                {"error": f"The request exceeds {validation_server.max_request_bytes} bytes."},
+            )
+            return
+
+        try:
+            payload = json.loads(self.rfile.read(length))
+        except ValueError as e:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": f"Invalid JSON: {e}"})
+            return
+
+        self._send_json(*validation_server.handle_validate(payload))
+
+    def _send_json(self, status: HTTPStatus, body: dict[str, Any]) -> None:
+        """Sends a JSON response."""
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Routes the access log to the console instead of stderr."""
+        self.server.validation_server.console.print("HTTP " + format, *args, level=LogLevel.DEBUG)
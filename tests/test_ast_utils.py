@@ -0,0 +1,107 @@
+import ast
+import unittest
+from itertools import islice
+from pathlib import Path
+
+from src.code_validator.components.ast_utils import (
+    enrich_ast_with_parents,
+    get_ast_index,
+    get_source_buffer,
+    parse_source,
+)
+from src.code_validator.components.source_buffer import SourceBuffer
+from src.code_validator.rules_library.selector_nodes import AstNodeSelector, FunctionCallSelector
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+FIXTURE_FILES = ["valid_code.py", "p05_advanced_code.py", "p08_flask_app.py", "arcade_hero_game.py"]
+
+
+class TestAstIndex(unittest.TestCase):
+    def setUp(self):
+        self.trees = []
+        for name in FIXTURE_FILES:
+            tree = ast.parse((FIXTURES_DIR / name).read_text(encoding="utf-8"))
+            enrich_ast_with_parents(tree)
+            self.trees.append(tree)
+
+    def test_enrichment_attaches_index_and_parents(self):
+        tree = self.trees[0]
+        self.assertIsNotNone(get_ast_index(tree))
+        for node in ast.walk(tree):
+            for child in ast.iter_child_nodes(node):
+                if isinstance(child, (ast.stmt, ast.expr)):  # contexts and operators are shared singletons
+                    self.assertIs(child.parent, node)
+
+    def test_matches_ast_walk_order(self):
+        queries = [ast.Call, (ast.Name, ast.Attribute), ast.stmt, ast.expr, (ast.Assign, ast.AnnAssign)]
+        for tree in self.trees:
+            index = get_ast_index(tree)
+            for node_types in queries:
+                with self.subTest(node_types=node_types):
+                    expected = [n for n in ast.walk(tree) if isinstance(n, node_types)]
+                    self.assertEqual(list(index.nodes_of_type(node_types)), expected)
+
+    def test_matches_ast_walk_within_subtree(self):
+        for tree in self.trees:
+            index = get_ast_index(tree)
+            for scope in index.nodes_of_type((ast.ClassDef, ast.FunctionDef)):
+                expected = [n for n in ast.walk(scope) if isinstance(n, (ast.Call, ast.FunctionDef))]
+                self.assertEqual(list(index.nodes_of_type((ast.Call, ast.FunctionDef), within=scope)), expected)
+
+    def test_foreign_subtree_falls_back_to_walk(self):
+        index = get_ast_index(self.trees[0])
+        foreign = ast.parse("print(1)\n")
+        self.assertEqual(len(list(index.nodes_of_type(ast.Call, within=foreign))), 1)
+
+    def test_nodes_are_yielded_lazily(self):
+        tree = self.trees[-1]
+        index = get_ast_index(tree)
+        expected = [n for n in ast.walk(tree) if isinstance(n, (ast.Name, ast.Call))][:3]
+
+        nodes = index.nodes_of_type((ast.Name, ast.Call))
+        self.assertIs(iter(nodes), nodes)
+        self.assertEqual(list(islice(nodes, 3)), expected)
+
+    def test_selectors_agree_with_and_without_index(self):
+        for name in FIXTURE_FILES:
+            source = (FIXTURES_DIR / name).read_text(encoding="utf-8")
+            plain = ast.parse(source)
+            indexed = ast.parse(source)
+            enrich_ast_with_parents(indexed)
+            for selector in (FunctionCallSelector(name="print"), AstNodeSelector(node_type=["For", "While"])):
+                with self.subTest(file=name, selector=selector.__class__.__name__):
+                    expected = [ast.dump(n) for n in selector.select(plain)]
+                    self.assertEqual([ast.dump(n) for n in selector.select(indexed)], expected)
+
+
+class TestSourceBuffer(unittest.TestCase):
+    def test_lines_match_the_tokenizer(self):
+        source = 'x = "héllo"\r\ny = 1\rdef f():\n    return x\x0c + y\n'
+        buffer = SourceBuffer(source)
+
+        self.assertEqual(len(buffer), 4)
+        self.assertEqual(buffer.line(1), 'x = "héllo"')
+        self.assertEqual(buffer.line(3), "def f():")
+        self.assertEqual(buffer.line(4), "    return x\x0c + y")
+        self.assertIsNone(buffer.line(0))
+        self.assertIsNone(buffer.line(5))
+
+    def test_segments_match_ast_get_source_segment(self):
+        for name in FIXTURE_FILES:
+            source = (FIXTURES_DIR / name).read_text(encoding="utf-8")
+            buffer = SourceBuffer(source)
+            with self.subTest(fixture=name):
+                for node in ast.walk(ast.parse(source)):
+                    if hasattr(node, "end_lineno"):
+                        self.assertEqual(buffer.segment(node), ast.get_source_segment(source, node))
+
+    def test_parse_source_attaches_buffer(self):
+        source = "value = 1\n"
+        tree = parse_source(source)
+
+        self.assertEqual(get_source_buffer(tree).text, source)
+        self.assertIsNone(get_source_buffer(ast.parse(source)))
+
+
+if __name__ == "__main__":
+    unittest.main()
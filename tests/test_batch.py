@@ -0,0 +1,70 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.code_validator.batch import _reorder, expand_solution_paths, is_batch_input, validate_batch
+from src.code_validator.config import ValidationResult
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+RULES_PATH = FIXTURES_DIR / "r01_require_structure.json"
+
+
+def _summary(result: ValidationResult) -> tuple:
+    return str(result.solution_path), result.is_valid, result.failed_rules_id
+
+
+class TestExpandSolutionPaths(unittest.TestCase):
+    def test_expands_directory_and_glob(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "pkg").mkdir()
+            (root / "a.py").write_text("x = 1\n", encoding="utf-8")
+            (root / "pkg" / "b.py").write_text("y = 2\n", encoding="utf-8")
+            (root / "notes.txt").write_text("not python\n", encoding="utf-8")
+
+            from_dir = expand_solution_paths([root])
+            from_glob = expand_solution_paths([str(root / "**" / "*.py"), root / "a.py"])
+
+        self.assertEqual(from_dir, [root / "a.py", root / "pkg" / "b.py"])
+        self.assertEqual(sorted(from_glob), sorted(from_dir))
+
+    def test_detects_batch_inputs(self):
+        self.assertFalse(is_batch_input([FIXTURES_DIR / "p01_simple_program.py"]))
+        self.assertTrue(is_batch_input([FIXTURES_DIR]))
+        self.assertTrue(is_batch_input(["submissions/*.py"]))
+        self.assertTrue(is_batch_input(["a.py", "b.py"]))
+
+
+class TestValidateBatch(unittest.TestCase):
+    def setUp(self):
+        self.paths = [
+            FIXTURES_DIR / "p01_simple_program.py",
+            FIXTURES_DIR / "p02_forbidden_constructs.py",
+            FIXTURES_DIR / "missing_solution.py",
+            FIXTURES_DIR / "p01_simple_program.py",
+        ]
+
+    def test_parallel_results_keep_input_order(self):
+        results = list(validate_batch(self.paths, RULES_PATH, jobs=2, keep_order=True))
+
+        self.assertEqual([r.solution_path for r in results], self.paths)
+        self.assertEqual([r.is_valid for r in results], [True, False, False, True])
+        self.assertIsNotNone(results[2].error)
+
+    def test_serial_and_parallel_agree(self):
+        serial = list(validate_batch(self.paths, RULES_PATH, jobs=1))
+        parallel = list(validate_batch(self.paths, RULES_PATH, jobs=2))
+
+        self.assertEqual(sorted(map(_summary, serial)), sorted(map(_summary, parallel)))
+
+    def test_reorder_buffer(self):
+        stream = [(2, "c"), (0, "a"), (3, "d"), (1, "b")]
+        self.assertEqual([index for index, _ in _reorder(stream)], [0, 1, 2, 3])
+
+    def test_results_are_validation_results(self):
+        for result in validate_batch(self.paths[:1], RULES_PATH, jobs=1):
+            self.assertIsInstance(result, ValidationResult)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import ast
+import unittest
+
+from benchmarks.generators import block_count, generate_module, generate_rules
+from benchmarks.suite import compare
+from src.code_validator.config import LogLevel
+from src.code_validator.core import CompiledRuleSet
+from src.code_validator.output import Console, setup_logging
+
+
+class TestBenchmarkGenerators(unittest.TestCase):
+    def test_generated_module_is_valid_and_sized(self):
+        source = generate_module(1000)
+        ast.parse(source)
+        self.assertGreaterEqual(len(source.splitlines()), 1000)
+        self.assertEqual(source, generate_module(1000))
+
+    def test_generated_rules_compile(self):
+        source = generate_module(1000)
+        rules = generate_rules(50, block_count(source))
+        self.assertEqual(len(rules["validation_rules"]), 50)
+        console = Console(setup_logging(LogLevel.CRITICAL), is_quiet=True)
+        rule_set = CompiledRuleSet.from_dict(rules, console)
+        result = rule_set.validate_source(source, "bench.py")
+        self.assertIsNone(result.syntax_error)
+
+
+class TestBenchmarkComparison(unittest.TestCase):
+    def _document(self, min_ms, peak_kib):
+        return {"results": {"case": {"min_ms": min_ms, "peak_kib": peak_kib}}}
+
+    def test_regression_above_threshold_is_reported(self):
+        comparisons, regressions = compare(self._document(13.0, 100.0), self._document(10.0, 100.0), threshold=0.2)
+        self.assertEqual(len(comparisons), 2)
+        self.assertEqual([(row["name"], row["metric"]) for row in regressions], [("case", "min_ms")])
+
+    def test_changes_within_threshold_and_unknown_cases_are_ignored(self):
+        current = self._document(11.0, 110.0)
+        current["results"]["new_case"] = {"min_ms": 1.0, "peak_kib": 1.0}
+        _, regressions = compare(current, self._document(10.0, 100.0), threshold=0.2)
+        self.assertEqual(regressions, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
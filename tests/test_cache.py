@@ -0,0 +1,227 @@
+import ast
+import io
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.code_validator.cache import AstCache, DiskCache, LintCache, ResultCache
+from src.code_validator.components.ast_utils import get_ast_index, get_source_buffer, parse_source
+from src.code_validator.config import AppConfig, LogLevel, RuleFailure, ValidationResult
+from src.code_validator.core import CompiledRuleSet, StaticValidator
+from src.code_validator.output import Console, setup_logging
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_hits_and_misses_are_counted(self):
+        cache = DiskCache(self.directory)
+        self.assertIsNone(cache.get("ab" * 32))
+        cache.put("ab" * 32, {"value": 1})
+
+        self.assertEqual(cache.get("ab" * 32), {"value": 1})
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = DiskCache(self.directory, max_bytes=300)
+        keys = [f"{i:02d}" * 32 for i in range(3)]
+        for age, key in enumerate(keys):
+            cache.put(key, {"payload": "x" * 80})
+            os.utime(cache._path_for(key), (1000 + age, 1000 + age))
+
+        # Reading the oldest entry makes it the most recently used one.
+        self.assertIsNotNone(cache.get(keys[0]))
+        cache.put("99" * 32, {"payload": "x" * 80})
+
+        self.assertGreater(cache.evictions, 0)
+        self.assertIsNotNone(cache.get(keys[0]))
+        self.assertIsNone(cache.get(keys[1]))
+
+    def test_damaged_entry_is_a_miss(self):
+        cache = DiskCache(self.directory)
+        cache.put("cd" * 32, {"value": 1})
+        cache._path_for("cd" * 32).write_text("{not json", encoding="utf-8")
+
+        self.assertIsNone(cache.get("cd" * 32))
+        self.assertFalse(cache._path_for("cd" * 32).exists())
+
+
+class TestLintCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = Path(self.tmp.name)
+        self.entries = (("E225", 2, 2, "missing whitespace around operator"),)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_key_depends_on_source_params_and_settings(self):
+        key = LintCache.key_for("x=1\n", ["E"], [], "flake8 7.0")
+
+        self.assertEqual(key, LintCache.key_for("x=1\n", ["E"], [], "flake8 7.0"))
+        self.assertNotEqual(key, LintCache.key_for("x = 1\n", ["E"], [], "flake8 7.0"))
+        self.assertNotEqual(key, LintCache.key_for("x=1\n", [], ["E"], "flake8 7.0"))
+        self.assertNotEqual(key, LintCache.key_for("x=1\n", ["E"], [], "flake8 7.1"))
+
+    def test_memory_tier_is_bounded(self):
+        cache = LintCache(max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.put(key, ())
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("c"), ())
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_disk_tier_is_shared_between_caches(self):
+        key = LintCache.key_for("x=1\n", [], [], "settings")
+        writer = LintCache()
+        writer.attach_directory(self.directory)
+        writer.put(key, self.entries)
+
+        reader = LintCache()
+        self.assertIsNone(reader.get(key))
+        reader.attach_directory(self.directory)
+        self.assertEqual(reader.get(key), self.entries)
+        self.assertEqual(reader.directory, self.directory)
+
+
+class TestAstCache(unittest.TestCase):
+    SOURCE = "class Hero:\n    def move(self):\n        return 1\n\n\ndef main():\n    Hero().move()\n"
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = AstCache(Path(self.tmp.name))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_restored_tree_is_enriched(self):
+        parsed = parse_source(self.SOURCE, cache=self.cache)
+        restored = parse_source(self.SOURCE, cache=self.cache)
+
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertIsNot(restored, parsed)
+        self.assertEqual(ast.dump(restored), ast.dump(parsed))
+        self.assertEqual(get_source_buffer(restored).line(2), "    def move(self):")
+
+        class_def = restored.body[0]
+        methods = list(get_ast_index(restored).nodes_of_type(ast.FunctionDef, within=class_def))
+        self.assertEqual([method.name for method in methods], ["move"])
+        self.assertIs(methods[0].parent, class_def)
+        self.assertIs(class_def.parent, restored)
+
+    def test_damaged_entry_is_a_miss(self):
+        parse_source(self.SOURCE, cache=self.cache)
+        path = self.cache._store._path_for(self.cache.key_for(self.SOURCE))
+        path.write_bytes(b"not a pickle")
+
+        self.assertIsNone(self.cache.get(self.SOURCE))
+        self.assertFalse(path.exists())
+        self.assertEqual(ast.dump(parse_source(self.SOURCE, cache=self.cache)), ast.dump(ast.parse(self.SOURCE)))
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = Path(self.tmp.name)
+        self.rules = {"validation_rules": [{"rule_id": 1, "type": "check_syntax", "message": "Syntax"}]}
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_key_ignores_rules_formatting_but_not_content(self):
+        cache = ResultCache(self.directory, self.rules)
+        reordered = {"validation_rules": [{"message": "Syntax", "type": "check_syntax", "rule_id": 1}]}
+        changed = {"validation_rules": [{"rule_id": 2, "type": "check_syntax", "message": "Syntax"}]}
+
+        key = cache.key_for("x = 1\n")
+        self.assertEqual(key, ResultCache(self.directory, reordered).key_for("x = 1\n"))
+        self.assertNotEqual(key, ResultCache(self.directory, changed).key_for("x = 1\n"))
+        self.assertNotEqual(key, cache.key_for("x = 2\n"))
+        self.assertNotEqual(key, cache.key_for("x = 1\n", exit_on_first_error=True))
+
+    def test_round_trip(self):
+        cache = ResultCache(self.directory, self.rules)
+        result = ValidationResult("a.py", False, (RuleFailure(3, "Missing main", "did you mean?"),))
+        cache.put("ef" * 32, result)
+
+        self.assertEqual(cache.get("ef" * 32, "b.py"), ValidationResult("b.py", False, result.failures))
+
+
+class TestValidatorWithCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.tmp.name)
+        self.console = Console(setup_logging(LogLevel.CRITICAL), is_quiet=True)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_validator(self, solution_file: str, rules_file: str) -> StaticValidator:
+        config = AppConfig(
+            solution_path=FIXTURES_DIR / solution_file,
+            rules_path=FIXTURES_DIR / rules_file,
+            log_level=LogLevel.CRITICAL,
+            is_quiet=True,
+            exit_on_first_error=False,
+            cache_dir=self.cache_dir,
+        )
+        validator = StaticValidator(config, self.console)
+        validator.run()
+        return validator
+
+    def test_hit_returns_stored_result_without_parsing(self):
+        first = self.run_validator("p02_forbidden_constructs.py", "r01_require_structure.json")
+        self.assertEqual(first.result_cache.misses, 1)
+
+        with mock.patch("src.code_validator.core.parse_source") as parse_source:
+            second = self.run_validator("p02_forbidden_constructs.py", "r01_require_structure.json")
+        parse_source.assert_not_called()
+
+        self.assertEqual(second.result_cache.hits, 1)
+        self.assertEqual(
+            [rule.config.rule_id for rule in second.failed_rules_id],
+            [rule.config.rule_id for rule in first.failed_rules_id],
+        )
+        self.assertTrue(second.failed_rules_id)
+
+    def test_syntax_error_is_cached(self):
+        first = self.run_validator("invalid_syntax.ppy", "basic_rules.json")
+        second = self.run_validator("invalid_syntax.ppy", "basic_rules.json")
+
+        self.assertEqual(second.result_cache.hits, 1)
+        self.assertEqual([rule.config.rule_id for rule in first.failed_rules_id], [1])
+        self.assertEqual([rule.config.rule_id for rule in second.failed_rules_id], [1])
+
+    def test_linter_findings_are_not_replayed_from_cache(self):
+        for _ in range(2):
+            self.console = Console(setup_logging(LogLevel.CRITICAL))
+            self.console._stdout = io.StringIO()
+            validator = self.run_validator("invalid_code.py", "basic_rules.json")
+
+            self.assertEqual([rule.config.rule_id for rule in validator.failed_rules_id], [2])
+            self.assertIn("Flake8 found issues:", self.console._stdout.getvalue())
+        self.assertEqual((validator.result_cache.hits, validator.result_cache.misses), (0, 1))
+
+    def test_rule_set_uses_cache(self):
+        rule_set = CompiledRuleSet.from_file(
+            FIXTURES_DIR / "r01_require_structure.json", self.console, cache_dir=self.cache_dir
+        )
+        first = rule_set.validate(FIXTURES_DIR / "p02_forbidden_constructs.py")
+        second = rule_set.validate(FIXTURES_DIR / "p02_forbidden_constructs.py")
+
+        self.assertEqual(first, second)
+        self.assertEqual((rule_set.cache.hits, rule_set.cache.misses), (1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
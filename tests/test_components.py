@@ -1,6 +1,11 @@
 import ast
 import unittest
 from pathlib import Path
+from unittest.mock import MagicMock
+
+from src.code_validator.components.ast_utils import parse_source
+from src.code_validator.config import ConstraintConfig, FullRuleCheck, FullRuleConfig, SelectorConfig
+from src.code_validator.rules_library.basic_rules import FullRuleHandler
 
 # Импортируем ВСЕ наши компоненты
 from src.code_validator.rules_library.constraint_logic import (
@@ -211,5 +216,54 @@ class TestAdvancedConstraints(unittest.TestCase):
         self.assertTrue(constraint.check([]))
 
 
+class TestEarlyTermination(unittest.TestCase):
+    SOURCE = "\n".join(f"print({i})" for i in range(10))
+
+    def _run(self, constraint, constraint_type, *, count=None):
+        tree = parse_source(self.SOURCE)
+        selector = FunctionCallSelector(name="print")
+        yielded = []
+
+        def counting_iter_select(search_tree):
+            for node in FunctionCallSelector.iter_select(selector, search_tree):
+                yielded.append(node)
+                yield node
+
+        selector.iter_select = counting_iter_select
+        config = FullRuleConfig(
+            rule_id=1,
+            message="msg",
+            check=FullRuleCheck(
+                selector=SelectorConfig(type="function_call", name="print"),
+                constraint=ConstraintConfig(type=constraint_type, count=count),
+            ),
+        )
+        result = FullRuleHandler(config, selector, constraint, MagicMock()).execute(tree)
+        return result, len(yielded)
+
+    def test_iter_select_matches_select(self):
+        tree = parse_source(VALID_CODE_CONTENT)
+        for selector in (FunctionDefSelector(name="*"), LiteralSelector(name="string"), ClassDefSelector(name="*")):
+            with self.subTest(selector=selector.__class__.__name__):
+                self.assertEqual(list(selector.iter_select(tree)), selector.select(tree))
+
+    def test_forbidden_stops_at_first_match(self):
+        result, yielded = self._run(IsForbiddenConstraint(), "is_forbidden")
+        self.assertFalse(result)
+        self.assertEqual(yielded, 1)
+
+    def test_required_with_count_stops_after_count_plus_one(self):
+        for count, expected in ((3, False), (10, True), (12, False)):
+            with self.subTest(count=count):
+                result, yielded = self._run(IsRequiredConstraint(count=count), "is_required", count=count)
+                self.assertEqual(result, expected)
+                self.assertEqual(yielded, min(count + 1, 10))
+
+    def test_constraints_without_limit_see_all_nodes(self):
+        constraint = NameMustBeInConstraint(allowed_names=["print"])
+        _, yielded = self._run(constraint, "name_must_be_in")
+        self.assertEqual(yielded, 10)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+from unittest import mock
+
+from src.code_validator.cache import LintCache
+from src.code_validator.components.linter import Flake8Engine, LintViolation, get_flake8_engine
+
+
+class TestFlake8Engine(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = get_flake8_engine()
+
+    def test_engine_is_shared(self):
+        self.assertIs(get_flake8_engine(), self.engine)
+        self.assertIsInstance(self.engine, Flake8Engine)
+
+    def test_clean_source_has_no_violations(self):
+        self.assertEqual(self.engine.check("x = 1\n"), [])
+
+    def test_reports_violations_in_flake8_format(self):
+        violations = self.engine.check("import os\nx=1\n")
+
+        self.assertEqual([v.code for v in violations], ["F401", "E225"])
+        self.assertEqual(violations[1], LintViolation("E225", 2, 2, "missing whitespace around operator"))
+        self.assertEqual(violations[0].format(), "stdin:1:1: F401 'os' imported but unused")
+
+    def test_select_and_ignore(self):
+        source = "import os\nx=1\n"
+
+        self.assertEqual([v.code for v in self.engine.check(source, select=["E"])], ["E225"])
+        self.assertEqual([v.code for v in self.engine.check(source, ignore=["F401"])], ["E225"])
+
+    def test_noqa_comment_is_respected(self):
+        self.assertEqual(self.engine.check("import os  # noqa: F401\n"), [])
+
+    def test_cached_outcomes_skip_linting(self):
+        engine = Flake8Engine(cache=LintCache())
+        first = engine.check("import os\nx=1\n", select=["E"])
+        with mock.patch.object(engine, "_check") as lint:
+            second = engine.check("import os\nx=1\n", select=["E"])
+            engine.check("import os\nx=1\n", select=["F"])
+
+        self.assertEqual(second, first)
+        lint.assert_called_once()
+        self.assertEqual(engine.cache.hits, 1)
+
+    def test_check_waits_for_background_run(self):
+        engine = Flake8Engine(cache=LintCache())
+        with mock.patch.object(engine, "_check", wraps=engine._check) as lint:
+            future = engine.check_async("import os\nx=1\n")
+            violations = engine.check("import os\nx=1\n")
+
+        self.assertEqual(future.result(), violations)
+        self.assertEqual([v.code for v in violations], ["F401", "E225"])
+        lint.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,219 @@
+import contextlib
+import io
+import json
+import logging
+import logging.handlers
+import threading
+import unittest
+from unittest import mock
+
+from src.code_validator.config import LogLevel, RuleFailure, RuleResult, ValidationResult
+from src.code_validator.output import (
+    BackgroundWriter,
+    Console,
+    JsonLinesWriter,
+    ResultWriter,
+    create_result_writer,
+    log_initialization,
+    setup_logging,
+    stop_queued_logging,
+)
+
+
+class _Recorder(logging.Handler):
+    def __init__(self):
+        super().__init__(level=logging.NOTSET)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def _logger(name, level):
+    logger = logging.getLogger(f"test_output.{name}")
+    logger.setLevel(level)
+    logger.propagate = False
+    logger.handlers = [_Recorder()]
+    return logger
+
+
+class TestLazyConsoleMessages(unittest.TestCase):
+    def setUp(self):
+        self.logger = _logger("console", logging.INFO)
+        self.console = Console(self.logger)
+        self.console._stdout = io.StringIO()
+        self.calls = 0
+
+    def _message(self):
+        self.calls += 1
+        return "built"
+
+    def test_disabled_messages_are_not_built(self):
+        self.console.print(self._message, level=LogLevel.DEBUG)
+        self.console.print("value: %s", self, level=LogLevel.TRACE)
+
+        self.assertEqual(self.calls, 0)
+        self.assertEqual(self.logger.handlers[0].messages, [])
+
+    def test_enabled_messages_are_built_once(self):
+        self.console.print(self._message, level=LogLevel.INFO, show_user=True)
+        self.console.print("%s of %d", "one", 2, level=LogLevel.WARNING)
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(self.logger.handlers[0].messages, ["built", "one of 2"])
+        self.assertEqual(self.console._stdout.getvalue(), "built\n")
+
+    def test_user_messages_are_printed_below_the_log_level(self):
+        self.console.print("Shown %s", "anyway", level=LogLevel.DEBUG, show_user=True)
+
+        self.assertEqual(self.console._stdout.getvalue(), "Shown anyway\n")
+        self.assertEqual(self.logger.handlers[0].messages, [])
+
+    def test_literal_percent_without_arguments(self):
+        self.console.print("100% done", level=LogLevel.INFO)
+
+        self.assertEqual(self.logger.handlers[0].messages, ["100% done"])
+
+    def test_refresh_log_level(self):
+        self.logger.setLevel(logging.DEBUG)
+        self.console.print("before refresh", level=LogLevel.DEBUG)
+        self.console.refresh_log_level()
+        self.console.print("after refresh", level=LogLevel.DEBUG)
+
+        self.assertEqual(self.logger.handlers[0].messages, ["after refresh"])
+
+
+class TestLogInitialization(unittest.TestCase):
+    def test_messages_follow_the_logger_level(self):
+        logger = _logger("init", logging.DEBUG)
+
+        class Traced:
+            @log_initialization(level=LogLevel.DEBUG)
+            def __init__(self):
+                pass
+
+        Traced.__module__ = logger.name
+        Traced()
+        logger.setLevel(logging.INFO)
+        Traced()
+
+        self.assertEqual(logger.handlers[0].messages, ["Initializing Traced...", "Traced initialized."])
+
+
+class TestQueuedLogging(unittest.TestCase):
+    def tearDown(self):
+        stop_queued_logging()
+        setup_logging(LogLevel.ERROR)
+
+    def test_records_are_written_by_the_listener(self):
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            logger = setup_logging(LogLevel.DEBUG, queued=True)
+
+        self.assertIsInstance(logger.handlers[0], logging.handlers.QueueHandler)
+        console = Console(logger, is_quiet=True)
+        for number in range(100):
+            console.print("record %d", number, level=LogLevel.DEBUG)
+        stop_queued_logging()
+
+        lines = stderr.getvalue().splitlines()
+        self.assertEqual(len(lines), 100)
+        self.assertTrue(lines[-1].endswith("| record 99"))
+        self.assertIn("MainThread", lines[0])
+
+
+class _SlowStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+        self.release = threading.Event()
+
+    def write(self, text):
+        self.release.wait(5)
+        self.writes += 1
+        return super().write(text)
+
+
+class TestBackgroundWriter(unittest.TestCase):
+    def test_writes_do_not_block_and_are_batched(self):
+        stream = _SlowStream()
+        writer = BackgroundWriter(stream)
+        for number in range(50):
+            print(f"line {number}", file=writer)
+
+        # Nothing was written yet: the stream is still blocked
+        self.assertEqual(stream.getvalue(), "")
+        stream.release.set()
+        writer.flush()
+
+        self.assertEqual(stream.getvalue(), "".join(f"line {number}\n" for number in range(50)))
+        self.assertLess(stream.writes, 100)
+        writer.close()
+
+    def test_buffered_console_output(self):
+        console = Console(_logger("buffered", logging.ERROR), buffered_output=True)
+        console._stdout.stream = io.StringIO()
+        console.print("Validation failed.", level=LogLevel.WARNING, is_verdict=True)
+        console.flush()
+
+        self.assertEqual(console._stdout.stream.getvalue(), "Validation failed.\n")
+        console._stdout.close()
+
+
+class TestResultWriters(unittest.TestCase):
+    def _write(self, format_name, stream=None):
+        stream = stream or io.StringIO()
+        writer = create_result_writer(format_name, stream)
+        writer.start()
+        writer.write_rule("a.py", RuleResult(1, True, "Syntax", 0.5))
+        writer.write_rule("a.py", RuleResult(2, False, "Needs main", 0.25, _typo_suggestion=lambda: "Did you mean?"))
+        writer.write_file(ValidationResult("a.py", False, (RuleFailure(2, "Needs main", "Did you mean?"),)))
+        writer.write_file(ValidationResult("b.py", False, (RuleFailure(3, "No loops"),)))
+        writer.write_file(ValidationResult("c.py", False, syntax_error="invalid syntax"))
+        writer.finish()
+        return stream.getvalue()
+
+    def test_json_lines_records(self):
+        records = [json.loads(line) for line in self._write("jsonl").splitlines()]
+
+        self.assertEqual([record["type"] for record in records], ["rule", "rule", "file", "file", "file"])
+        self.assertEqual(records[1]["solution_path"], "a.py")
+        self.assertEqual(records[1]["typo_suggestion"], "Did you mean?")
+        failure = {"rule_id": 2, "message": "Needs main", "typo_suggestion": "Did you mean?"}
+        self.assertEqual(records[2]["failures"], [failure])
+        self.assertEqual(records[3]["failures"][0]["rule_id"], 3)
+
+    def test_json_array_matches_json_lines(self):
+        self.assertEqual(
+            json.loads(self._write("json")), [json.loads(line) for line in self._write("jsonl").splitlines()]
+        )
+
+    def test_sarif_contains_only_failures(self):
+        log = json.loads(self._write("sarif"))
+
+        self.assertEqual(log["version"], "2.1.0")
+        results = log["runs"][0]["results"]
+        self.assertEqual([result["ruleId"] for result in results], ["2", "3", "syntax-error"])
+        self.assertEqual(results[0]["properties"], {"typoSuggestion": "Did you mean?"})
+        self.assertEqual(results[1]["locations"][0]["physicalLocation"]["artifactLocation"]["uri"], "b.py")
+
+    def test_records_are_flushed_as_written(self):
+        stream = io.StringIO()
+        writer = JsonLinesWriter(stream)
+        with mock.patch.object(stream, "flush") as flush:
+            writer.write_rule("a.py", RuleResult(1, True, "Syntax", 0.0))
+
+        flush.assert_called_once()
+        self.assertEqual(json.loads(stream.getvalue())["rule_id"], 1)
+
+    def test_writer_must_implement_the_writes(self):
+        with self.assertRaises(TypeError):
+            ResultWriter(io.StringIO())
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            create_result_writer("xml", io.StringIO())
+
+
+if __name__ == "__main__":
+    unittest.main()
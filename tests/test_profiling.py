@@ -0,0 +1,84 @@
+import json
+import unittest
+from pathlib import Path
+
+from src.code_validator.config import AppConfig, LogLevel
+from src.code_validator.core import StaticValidator
+from src.code_validator.output import Console, setup_logging
+from src.code_validator.profiling import Profiler, get_active_profiler, profile_phase
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+class TestProfiler(unittest.TestCase):
+    def test_phases_are_recorded_only_while_active(self):
+        profiler = Profiler()
+        with profile_phase("ignored"):
+            pass
+        with profiler.activate():
+            self.assertIs(get_active_profiler(), profiler)
+            with profile_phase("outer"):
+                with profile_phase("inner"):
+                    pass
+                with profile_phase("inner"):
+                    pass
+        self.assertIsNone(get_active_profiler())
+
+        phases = {row["name"]: row["count"] for row in profiler.report()["phases"]}
+        self.assertEqual(phases, {"outer": 1, "outer/inner": 2})
+
+    def test_summary_groups_instances_of_a_phase(self):
+        profiler = Profiler()
+        with profiler.activate():
+            for rule_id in (1, 2):
+                with profile_phase("rule[%s]", rule_id):
+                    with profile_phase("selector"):
+                        pass
+
+        summary = {row["name"]: row["count"] for row in profiler.report()["summary"]}
+        self.assertEqual(summary, {"rule": 2, "selector": 2})
+
+    def test_phase_name_is_formatted_only_while_active(self):
+        formatted = []
+
+        class RuleId:
+            def __str__(self):
+                formatted.append(1)
+                return "7"
+
+        with profile_phase("rule[%s]", RuleId()):
+            with profile_phase("rule[%s]", RuleId()):
+                pass
+        self.assertEqual(formatted, [])
+
+        profiler = Profiler()
+        with profiler.activate():
+            with profile_phase("rule[%s]", RuleId()):
+                pass
+        self.assertEqual(formatted, [1])
+        self.assertEqual([row["name"] for row in profiler.report()["phases"]], ["rule[7]"])
+
+    def test_validator_run_is_instrumented(self):
+        config = AppConfig(
+            solution_path=FIXTURES_DIR / "p02_forbidden_constructs.py",
+            rules_path=FIXTURES_DIR / "r01_require_structure.json",
+            log_level=LogLevel.CRITICAL,
+            is_quiet=True,
+            exit_on_first_error=False,
+        )
+        validator = StaticValidator(config, Console(setup_logging(LogLevel.CRITICAL), is_quiet=True))
+
+        profiler = Profiler()
+        with profiler.activate():
+            validator.run()
+
+        report = json.loads(json.dumps(profiler.report()))
+        kinds = {row["name"] for row in report["summary"]}
+        for kind in ("read_source", "load_rules", "build_rules", "parse", "enrich", "rule", "selector", "constraint"):
+            self.assertIn(kind, kinds)
+        self.assertIn("rule[101]/constraint", {row["name"] for row in report["phases"]})
+        self.assertIn("By phase", profiler.format_table())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+from src.code_validator.cache import RuleSetCache
+from src.code_validator.components.factories import RuleFactory
+from src.code_validator.config import LogLevel, ValidationResult
+from src.code_validator.core import CompiledRuleSet
+from src.code_validator.exceptions import RuleParsingError
+from src.code_validator.output import Console, setup_logging
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+class TestCompiledRuleSet(unittest.TestCase):
+    def setUp(self):
+        self.logger = setup_logging(LogLevel.CRITICAL)
+        self.console = Console(self.logger, is_quiet=True)
+        self.rule_set = CompiledRuleSet.from_file(FIXTURES_DIR / "r01_require_structure.json", self.console)
+
+    def test_validate_many_returns_result_per_file(self):
+        paths = [FIXTURES_DIR / "p01_simple_program.py", FIXTURES_DIR / "p02_forbidden_constructs.py"]
+        results = list(self.rule_set.validate_many(paths))
+
+        self.assertEqual(len(results), 2)
+        self.assertIsInstance(results[0], ValidationResult)
+        self.assertTrue(results[0].is_valid)
+        self.assertEqual(results[0].failures, ())
+        self.assertFalse(results[1].is_valid)
+        self.assertTrue(results[1].failed_rules_id)
+
+    def test_results_do_not_share_state(self):
+        bad = self.rule_set.validate(FIXTURES_DIR / "p02_forbidden_constructs.py")
+        good = self.rule_set.validate(FIXTURES_DIR / "p01_simple_program.py")
+
+        self.assertFalse(bad.is_valid)
+        self.assertTrue(good.is_valid)
+        self.assertTrue(bad.failures)
+
+    def test_rules_are_built_once(self):
+        rules_before = list(self.rule_set.rules)
+        list(self.rule_set.validate_many([FIXTURES_DIR / "p01_simple_program.py"] * 3))
+        self.assertEqual([id(rule) for rule in rules_before], [id(rule) for rule in self.rule_set.rules])
+
+    def test_validate_source_reports_syntax_error(self):
+        rule_set = CompiledRuleSet.from_file(FIXTURES_DIR / "basic_rules.json", self.console)
+        result = rule_set.validate_source("def broken(:\n", "broken.py")
+
+        self.assertFalse(result.is_valid)
+        self.assertIsNotNone(result.syntax_error)
+        self.assertEqual(result.failed_rules_id, [1])
+
+    def test_from_dict_requires_rules_list(self):
+        with self.assertRaises(RuleParsingError):
+            CompiledRuleSet.from_dict({"description": "no rules"}, self.console)
+
+    def test_concurrent_validations_keep_their_typo_suggestions(self):
+        rules = {
+            "validation_rules": [
+                {
+                    "rule_id": 1,
+                    "message": "Required attribute 'self.speed' not found.",
+                    "check": {
+                        "selector": {"type": "assignment", "name": "self.speed", "in_scope": "Hero.__init__"},
+                        "constraint": {"type": "is_required"},
+                    },
+                }
+            ]
+        }
+        rule_set = CompiledRuleSet.from_dict(rules, self.console)
+        typos = ["self.sped", "self.speedd", "self.spede"] * 10
+        sources = [f"class Hero:\n    def __init__(self):\n        {typo} = 1\n" for typo in typos]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(rule_set.validate_source, sources, [f"{i}.py" for i in range(len(sources))]))
+
+        for typo, result in zip(typos, results, strict=True):
+            self.assertEqual(result.failed_rules_id, [1])
+            self.assertIn(typo, result.failures[0].typo_suggestion)
+
+
+class TestRuleSetCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.rules_path = Path(self.tmp.name) / "rules.json"
+        shutil.copy(FIXTURES_DIR / "r01_require_structure.json", self.rules_path)
+        self.console = Console(setup_logging(LogLevel.CRITICAL), is_quiet=True)
+        self.cache_path = RuleSetCache(self.rules_path).path
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _load(self):
+        return CompiledRuleSet.from_file(self.rules_path, self.console, cache_rules=True)
+
+    def test_warm_cache_skips_rule_construction(self):
+        built = self._load()
+        self.assertTrue(self.cache_path.exists())
+
+        console = Console(setup_logging(LogLevel.CRITICAL), is_quiet=True)
+        with mock.patch.object(RuleFactory, "create") as create:
+            loaded = CompiledRuleSet.from_file(self.rules_path, console, cache_rules=True)
+
+        create.assert_not_called()
+        self.assertEqual([rule.config for rule in loaded.rules], [rule.config for rule in built.rules])
+        self.assertIs(loaded.rules[0]._console, console)
+        result = loaded.validate(FIXTURES_DIR / "p02_forbidden_constructs.py")
+        self.assertEqual(result, built.validate(FIXTURES_DIR / "p02_forbidden_constructs.py"))
+
+    def test_changed_rules_file_is_rebuilt(self):
+        self._load()
+        self.rules_path.write_text('{"validation_rules": []}', encoding="utf-8")
+
+        self.assertEqual(self._load().rules, [])
+
+    def test_damaged_cache_is_ignored(self):
+        self._load()
+        key_line = self.cache_path.read_bytes().partition(b"\n")[0]
+        self.cache_path.write_bytes(key_line + b"\nnot a pickle")
+
+        self.assertEqual(len(self._load().rules), 2)
+        self.assertEqual(len(self._load().rules), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,12 +2,28 @@ import ast
 import unittest
 from pathlib import Path
 
-from src.code_validator.components.scope_handler import find_scope_node
+from src.code_validator.components.scope_handler import find_scope_node, get_symbol_index
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 ADVANCED_CODE = (FIXTURES_DIR / "p05_advanced_code.py").read_text(encoding="utf-8")
 ADVANCED_AST = ast.parse(ADVANCED_CODE)
 
+NESTED_CODE = """
+class Outer:
+    class Inner:
+        def method(self):
+            pass
+
+    def method(self):
+        def helper():
+            pass
+
+class Inner:
+    def method(self):
+        pass
+"""
+NESTED_AST = ast.parse(NESTED_CODE)
+
 
 class TestScopeHandler(unittest.TestCase):
     def test_find_global_function(self):
@@ -39,3 +55,18 @@ class TestScopeHandler(unittest.TestCase):
         scope_config = {"class": "MyAdvancedClass", "method": "non_existent_method"}
         node = find_scope_node(ADVANCED_AST, scope_config)
         self.assertIsNone(node)
+
+    def test_find_by_qualified_path(self):
+        self.assertIs(find_scope_node(ADVANCED_AST, "MyAdvancedClass.method_a"), ADVANCED_AST.body[2].body[2])
+        self.assertEqual(find_scope_node(NESTED_AST, "Outer.Inner.method").lineno, 4)
+        self.assertEqual(find_scope_node(NESTED_AST, "Outer.method.helper").name, "helper")
+        self.assertIsNone(find_scope_node(NESTED_AST, "Outer.missing"))
+
+    def test_dict_scope_uses_first_class_in_walk_order(self):
+        # The module-level `Inner` comes later in the source but is shallower.
+        node = find_scope_node(NESTED_AST, {"class": "Inner", "method": "method"})
+        self.assertEqual(node.lineno, 12)
+
+    def test_symbol_index_is_built_once_per_tree(self):
+        tree = ast.parse(ADVANCED_CODE)
+        self.assertIs(get_symbol_index(tree), get_symbol_index(tree))
@@ -0,0 +1,165 @@
+import io
+import logging
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from http import HTTPStatus
+from pathlib import Path
+
+from src.code_validator.client import ValidationClient
+from src.code_validator.config import LogLevel
+from src.code_validator.core import CompiledRuleSet
+from src.code_validator.exceptions import RuleParsingError, ServerRequestError
+from src.code_validator.output import Console
+from src.code_validator.server import ValidationServer, discover_rule_files
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+RULE_FILES = {
+    "r01_require_structure": FIXTURES_DIR / "r01_require_structure.json",
+    "r02_forbid_constructs": FIXTURES_DIR / "r02_forbid_constructs.json",
+}
+
+
+def _quiet_console() -> Console:
+    logger = logging.getLogger("test_server")
+    logger.setLevel(logging.CRITICAL)
+    return Console(logger, is_quiet=True)
+
+
+class TestDiscoverRuleFiles(unittest.TestCase):
+    def test_files_and_directories_are_keyed_by_stem(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "lab1.json").write_text("{}", encoding="utf-8")
+            (root / "lab2.json").write_text("{}", encoding="utf-8")
+            rule_files = discover_rule_files([root, RULE_FILES["r01_require_structure"]])
+
+        self.assertEqual(list(rule_files), ["lab1", "lab2", "r01_require_structure"])
+
+    def test_duplicate_ids_are_rejected(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            copy = Path(tmp) / "r01_require_structure.json"
+            copy.write_text("{}", encoding="utf-8")
+            with self.assertRaises(RuleParsingError):
+                discover_rule_files([RULE_FILES["r01_require_structure"], copy])
+
+
+class TestValidationServer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ValidationServer(RULE_FILES, _quiet_console(), jobs=1, log_level=LogLevel.CRITICAL)
+        cls.http_server = cls.server.create_http_server("127.0.0.1", 0)
+        cls.thread = threading.Thread(target=cls.http_server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.url = f"http://127.0.0.1:{cls.http_server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.http_server.shutdown()
+        cls.http_server.server_close()
+        cls.server.close()
+
+    def test_results_match_in_process_validation(self):
+        rule_set = CompiledRuleSet.from_file(RULE_FILES["r01_require_structure"], _quiet_console())
+        with ValidationClient(self.url) as client:
+            for name in ("p01_simple_program.py", "p02_forbidden_constructs.py", "invalid_code.py"):
+                with self.subTest(name=name):
+                    source = (FIXTURES_DIR / name).read_text(encoding="utf-8")
+                    expected = rule_set.validate_source(source, name)
+                    self.assertEqual(client.validate(source, "r01_require_structure", path=name), expected)
+
+    def test_health_reports_rule_sets_and_counters(self):
+        with ValidationClient(self.url) as client:
+            client.validate("x = 1\n", "r02_forbid_constructs")
+            health = client.health()
+
+        self.assertEqual(health["status"], "ok")
+        self.assertEqual(health["rule_sets"], list(RULE_FILES))
+        self.assertGreaterEqual(health["requests"], 1)
+
+    def test_request_errors(self):
+        with ValidationClient(self.url) as client:
+            with self.assertRaises(ServerRequestError) as ctx:
+                client.validate("x = 1\n", "missing")
+            self.assertEqual(ctx.exception.status, HTTPStatus.NOT_FOUND)
+
+            with self.assertRaises(ServerRequestError) as ctx:
+                client.validate("x = 1\n")
+            self.assertEqual(ctx.exception.status, HTTPStatus.BAD_REQUEST)
+
+        status, body = self.server.handle_validate(["not", "an", "object"])
+        self.assertEqual(status, HTTPStatus.BAD_REQUEST)
+        self.assertIn("error", body)
+
+    def test_negative_content_length_is_rejected(self):
+        host, port = self.http_server.server_address[:2]
+        with socket.create_connection((host, port), timeout=5) as connection:
+            connection.sendall(b"POST /validate HTTP/1.1\r\nHost: localhost\r\nContent-Length: -1\r\n\r\n")
+            status_line = connection.makefile("rb").readline()
+
+        self.assertIn(b" 400 ", status_line)
+
+    def test_findings_are_not_printed_by_the_server(self):
+        console = Console(logging.getLogger("test_server"))
+        console._stdout = io.StringIO()
+        rule_files = {"basic_rules": FIXTURES_DIR / "basic_rules.json"}
+        with ValidationServer(rule_files, console, jobs=1) as server:
+            status, body = server.handle_validate({"source": "import os\nx=1\n", "rules": "basic_rules"})
+
+        self.assertEqual(status, HTTPStatus.OK)
+        self.assertEqual([failure["rule_id"] for failure in body["failures"]], [2])
+        self.assertEqual(console._stdout.getvalue(), "")
+
+    def test_slow_validation_times_out(self):
+        server = ValidationServer(RULE_FILES, _quiet_console(), jobs=1, timeout=0.05)
+        original_task = server._task
+
+        def slow_task(*args):
+            time.sleep(0.3)
+            return original_task(*args)
+
+        server._task = slow_task
+        try:
+            status, body = server.handle_validate({"source": "x = 1\n", "rules": "r01_require_structure"})
+        finally:
+            server.close()
+
+        self.assertEqual(status, HTTPStatus.GATEWAY_TIMEOUT)
+        self.assertEqual(server.health()["timeouts"], 1)
+
+
+class TestUnixSocketServer(unittest.TestCase):
+    def test_validates_over_unix_socket_with_single_rule_set(self):
+        rule_files = {"r01_require_structure": RULE_FILES["r01_require_structure"]}
+        with tempfile.TemporaryDirectory() as tmp, ValidationServer(rule_files, _quiet_console(), jobs=1) as server:
+            socket_path = Path(tmp) / "validator.sock"
+            http_server = server.create_http_server(socket_path=socket_path)
+            thread = threading.Thread(target=http_server.serve_forever, daemon=True)
+            thread.start()
+            try:
+                with ValidationClient(socket_path=socket_path) as client:
+                    result = client.validate("def solve():\n    pass\n")
+                    self.assertEqual(result.solution_path, "<string>")
+                    self.assertEqual(client.health()["rule_sets"], ["r01_require_structure"])
+            finally:
+                http_server.shutdown()
+                http_server.server_close()
+            self.assertFalse(socket_path.exists())
+
+
+class TestProcessPool(unittest.TestCase):
+    def test_worker_processes_validate_concurrently(self):
+        source = (FIXTURES_DIR / "p02_forbidden_constructs.py").read_text(encoding="utf-8")
+        expected = CompiledRuleSet.from_file(RULE_FILES["r02_forbid_constructs"], _quiet_console()).validate_source(
+            source
+        )
+        with ValidationServer(RULE_FILES, _quiet_console(), jobs=2, log_level=LogLevel.CRITICAL) as server:
+            results = [server.validate(source, "r02_forbid_constructs") for _ in range(4)]
+
+        self.assertEqual(results, [expected] * 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
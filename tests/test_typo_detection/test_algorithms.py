@@ -72,5 +72,37 @@ class TestLevenshteinDistance(unittest.TestCase):
         self.assertLess(self.algo.similarity("Speed", "speed"), 1.0)
 
 
+class TestBoundedLevenshtein(unittest.TestCase):
+    """Test cases for the bounded Levenshtein API."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.algo = LevenshteinDistance()
+
+    def test_matches_full_distance_within_cutoff(self):
+        """Test that bounded results equal the full distance or None."""
+        words = ["", "a", "speed", "sped", "spend", "kitten", "sitting", "self.center_x", "self.centre_x", "abcabc"]
+        for s1 in words:
+            for s2 in words:
+                for cutoff in range(4):
+                    with self.subTest(s1=s1, s2=s2, cutoff=cutoff):
+                        distance = self.algo.distance(s1, s2)
+                        expected = distance if distance <= cutoff else None
+                        self.assertEqual(self.algo.bounded_distance(s1, s2, cutoff), expected)
+
+    def test_rejects_on_length_difference(self):
+        """Test that pairs differing in length by more than the cutoff are rejected."""
+        self.assertIsNone(self.algo.bounded_distance("ab", "abcdef", 3))
+        self.assertEqual(self.algo.bounded_distance("ab", "abcde", 3), 3)
+
+    def test_match_returns_distance_and_similarity(self):
+        """Test that bounded_match agrees with distance and similarity."""
+        match = self.algo.bounded_match("speed", "sped", 2)
+        self.assertEqual(match.distance, 1)
+        self.assertEqual(match.similarity, self.algo.similarity("speed", "sped"))
+        self.assertEqual(self.algo.bounded_match("", "", 0).similarity, 1.0)
+        self.assertIsNone(self.algo.bounded_match("kitten", "sitting", 2))
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,70 @@
+"""Tests for the candidate indexes used by the typo detector."""
+
+import ast
+import random
+import unittest
+from pathlib import Path
+
+from src.code_validator.components.ast_utils import enrich_ast_with_parents
+from src.code_validator.components.typo_detection import LinearCandidateIndex, NGramCandidateIndex, TypoDetector
+from src.code_validator.components.typo_detection.scope_analyzer import NameCandidate
+
+
+def _candidate(name: str) -> NameCandidate:
+    return NameCandidate(name, 1, 0, len(name), "global", "assignment", ast.Name(id=name))
+
+
+class TestNGramCandidateIndex(unittest.TestCase):
+    """Test cases for the n-gram candidate index."""
+
+    def test_matches_linear_scan(self):
+        """Test that the n-gram index finds exactly the candidates a full scan finds."""
+        rng = random.Random(7)
+        alphabet = "ab_.c"
+        for _ in range(50):
+            candidates = [
+                _candidate("".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))) for _ in range(40)
+            ]
+            linear = LinearCandidateIndex(candidates)
+            ngram = NGramCandidateIndex(candidates)
+            for _ in range(10):
+                target = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+                for max_distance in range(4):
+                    self.assertEqual(ngram.query(target, max_distance), linear.query(target, max_distance))
+
+    def test_returns_distance_and_similarity(self):
+        """Test that matches carry the bounded distance and similarity."""
+        index = NGramCandidateIndex([_candidate("self.health"), _candidate("self.sped"), _candidate("self.scale")])
+        matches = index.query("self.speed", 2)
+
+        self.assertEqual([(candidate.name, match.distance) for candidate, match in matches], [("self.sped", 1)])
+        self.assertAlmostEqual(matches[0][1].similarity, 0.9)
+
+
+class TestDetectorWithIndexes(unittest.TestCase):
+    """Test that the detector gives the same suggestions with every index."""
+
+    def test_same_suggestions_as_linear_scan(self):
+        """Test the default index against a linear scan on the typo fixtures."""
+        code = (Path(__file__).parent / "fixtures" / "typo_examples.py").read_text(encoding="utf-8")
+        tree = ast.parse(code)
+        enrich_ast_with_parents(tree)
+
+        default = TypoDetector()
+        linear = TypoDetector(index_factory=LinearCandidateIndex)
+        searches = [
+            ("self.speed", {"class": "Hero", "method": "__init__"}),
+            ("self.center_x", "global"),
+            ("update", "global"),
+            ("Hero", "global"),
+        ]
+        for target, scope in searches:
+            with self.subTest(target=target):
+                expected = linear.analyze_failed_search(target, scope, tree, "typo_examples.py")
+                actual = default.analyze_failed_search(target, scope, tree, "typo_examples.py")
+                self.assertEqual(actual.message, expected.message)
+                self.assertEqual(actual.debug_info, expected.debug_info)
+
+
+if __name__ == "__main__":
+    unittest.main()
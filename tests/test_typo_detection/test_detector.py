@@ -4,8 +4,9 @@ import ast
 import unittest
 from pathlib import Path
 
-from src.code_validator.components.ast_utils import enrich_ast_with_parents
+from src.code_validator.components.ast_utils import enrich_ast_with_parents, parse_source
 from src.code_validator.components.typo_detection import TypoDetector
+from src.code_validator.components.typo_detection.scope_analyzer import ScopeAnalyzer, get_candidate_cache
 
 
 class TestTypoDetector(unittest.TestCase):
@@ -209,6 +210,72 @@ class TestTypoDetector(unittest.TestCase):
         if not suggestion.has_suggestion:
             self.assertIn("No typo suggestions", suggestion.debug_info)
 
+    def test_source_line_from_memory(self):
+        """Test that suggestions for sources without a file show the source line."""
+        tree = parse_source("class Hero:\n    def __init__(self):\n        self.sped = 300\n")
+        suggestion = self.detector.analyze_failed_search(
+            "self.speed", {"class": "Hero", "method": "__init__"}, tree, "<string>"
+        )
+
+        self.assertIn("        self.sped = 300", suggestion.message)
+        self.assertNotIn("<source unavailable>", suggestion.message)
+
+
+class TestCandidateCache(unittest.TestCase):
+    """Test cases for the per-tree cache of scope candidates."""
+
+    def setUp(self):
+        """Set up a tree with one class scope."""
+        self.ast_tree = ast.parse(
+            "class Hero:\n    def __init__(self):\n        self.sped = 1\n        self.helth = 2\n"
+        )
+        enrich_ast_with_parents(self.ast_tree)
+        self.scope = {"class": "Hero", "method": "__init__"}
+
+    def test_scope_is_extracted_once_across_detectors(self):
+        """Test that failures in the same scope share one extraction and one index."""
+        calls = []
+        original = ScopeAnalyzer._extract_names
+
+        def counting_extract(analyzer, *args):
+            calls.append(args[1:])
+            return original(analyzer, *args)
+
+        ScopeAnalyzer._extract_names = counting_extract
+        try:
+            # Each failing rule owns its own detector
+            for target in ("self.speed", "self.health", "self.speed"):
+                suggestion = TypoDetector().analyze_failed_search(target, self.scope, self.ast_tree, "<test>")
+                self.assertTrue(suggestion.has_suggestion)
+        finally:
+            ScopeAnalyzer._extract_names = original
+
+        self.assertEqual(len(calls), 1)
+        cache = get_candidate_cache(self.ast_tree)
+        self.assertEqual(cache.misses, 2)  # the candidates and their index
+        self.assertEqual(cache.hits, 4)
+
+    def test_cache_is_keyed_by_scope_and_type(self):
+        """Test that different scopes and target types are extracted separately."""
+        analyzer = ScopeAnalyzer()
+        assignments = analyzer.extract_names_in_scope(self.ast_tree, self.scope, "assignment")
+        functions = analyzer.extract_names_in_scope(self.ast_tree, self.scope, "function_def")
+        global_classes = analyzer.extract_names_in_scope(self.ast_tree, "global", "class_def")
+
+        self.assertEqual([c.name for c in assignments], ["self.sped", "self.helth"])
+        self.assertEqual([c.name for c in functions], ["__init__"])
+        self.assertEqual([c.name for c in global_classes], ["Hero"])
+        self.assertEqual(get_candidate_cache(self.ast_tree).misses, 3)
+        self.assertIs(analyzer.extract_names_in_scope(self.ast_tree, dict(self.scope), "assignment"), assignments)
+
+    def test_cache_belongs_to_the_tree(self):
+        """Test that a new tree starts with an empty cache."""
+        ScopeAnalyzer().extract_names_in_scope(self.ast_tree, self.scope, "assignment")
+        other_tree = ast.parse("x = 1\n")
+
+        self.assertIsNot(get_candidate_cache(other_tree), get_candidate_cache(self.ast_tree))
+        self.assertEqual(get_candidate_cache(other_tree).misses, 0)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
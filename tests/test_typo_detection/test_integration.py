@@ -1,10 +1,16 @@
 """Integration tests for typo detection with the validation system."""
 
+import io
 import json
+import logging
+import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
-from src.code_validator.config import AppConfig, LogLevel
+from src.code_validator.cli import run_batch, setup_arg_parser
+from src.code_validator.components.typo_detection import TypoDetector
+from src.code_validator.config import AppConfig, ExitCode, LogLevel
 from src.code_validator.core import StaticValidator
 from src.code_validator.output import Console, setup_logging
 
@@ -327,5 +333,113 @@ class LargeClass:
             rules_path.unlink(missing_ok=True)
 
 
+class TestDeferredTypoSuggestions(unittest.TestCase):
+    """Typo suggestions are only analyzed for the failures that are displayed."""
+
+    def setUp(self):
+        """Set up code with three typos and one rule per typo."""
+        self.test_code = (
+            "class Hero:\n"
+            "    def __init__(self):\n"
+            "        self.sped = 300\n"
+            "        self.helth = 100\n"
+            "        self.centre_y = 50\n"
+        )
+        self.test_rules = {
+            "validation_rules": [
+                {
+                    "rule_id": rule_id,
+                    "message": f"Required attribute '{name}' not found.",
+                    "check": {
+                        "selector": {
+                            "type": "assignment",
+                            "name": name,
+                            "in_scope": {"class": "Hero", "method": "__init__"},
+                        },
+                        "constraint": {"type": "is_required"},
+                    },
+                }
+                for rule_id, name in enumerate(("self.speed", "self.health", "self.center_y"), 1)
+            ]
+        }
+
+    def _run(self, console, max_messages=0):
+        """Validate the shared code and rules, returning the failed rules, their suggestions and the context."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            code_path = Path(tmp_dir) / "solution.py"
+            rules_path = Path(tmp_dir) / "rules.json"
+            code_path.write_text(self.test_code, encoding="utf-8")
+            rules_path.write_text(json.dumps(self.test_rules), encoding="utf-8")
+
+            config = AppConfig(
+                solution_path=code_path,
+                rules_path=rules_path,
+                log_level=LogLevel.ERROR,
+                is_quiet=console._is_quiet,
+                exit_on_first_error=False,
+                max_messages=max_messages,
+            )
+            validator = StaticValidator(config, console)
+            self.assertFalse(validator.run())
+            failed_rules, context = validator.failed_rules_id, validator._context
+            return failed_rules, [context.deferred_typo_suggestion(rule) for rule in failed_rules], context
+
+    def _silent_logger(self):
+        """Return a logger that discards warnings."""
+        logger = logging.getLogger("test_deferred_typos")
+        logger.setLevel(LogLevel.ERROR)
+        return logger
+
+    def test_only_shown_failures_are_analyzed(self):
+        """Test that --max-messages skips the analysis of hidden failures."""
+        console = Console(self._silent_logger())
+        console._stdout = io.StringIO()
+
+        _, suggestions, _ = self._run(console, max_messages=1)
+
+        output = console._stdout.getvalue()
+        self.assertIn("self.sped", output)
+        self.assertIn("2 more errors found", output)
+        self.assertIsInstance(suggestions[0], str)
+        self.assertTrue(all(callable(suggestion) for suggestion in suggestions[1:]))
+
+    def test_quiet_mode_skips_analysis(self):
+        """Test that nothing is analyzed when the report is neither printed nor logged."""
+        failed_rules, suggestions, context = self._run(Console(self._silent_logger(), is_quiet=True))
+
+        self.assertEqual(len(failed_rules), 3)
+        self.assertTrue(all(callable(suggestion) for suggestion in suggestions))
+        # The suggestion is still available on demand
+        self.assertIn("self.sped", context.typo_suggestion(failed_rules[0]))
+
+    def _run_batch(self, console, *options):
+        """Validate two copies of the shared code in batch mode, counting the typo analyses."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for name in ("a.py", "b.py"):
+                (Path(tmp_dir) / name).write_text(self.test_code, encoding="utf-8")
+            rules_path = Path(tmp_dir) / "rules.json"
+            rules_path.write_text(json.dumps(self.test_rules), encoding="utf-8")
+
+            args = setup_arg_parser().parse_args([tmp_dir, str(rules_path), "--jobs", "1", *options])
+            analyze = TypoDetector.analyze_failed_search
+            with mock.patch.object(TypoDetector, "analyze_failed_search", autospec=True, side_effect=analyze) as spy:
+                self.assertEqual(run_batch(args, console), ExitCode.VALIDATION_FAILED)
+            return spy.call_count
+
+    def test_batch_analyzes_only_shown_failures(self):
+        """Test that --max-messages limits the analysis per file in batch mode."""
+        console = Console(self._silent_logger())
+        console._stdout = io.StringIO()
+
+        calls = self._run_batch(console, "--max-messages", "1")
+
+        self.assertEqual(calls, 2)
+        self.assertEqual(console._stdout.getvalue().count("2 more errors found"), 2)
+
+    def test_batch_quiet_mode_skips_analysis(self):
+        """Test that nothing is analyzed in a quiet batch run."""
+        self.assertEqual(self._run_batch(Console(self._silent_logger(), is_quiet=True), "--quiet"), 0)
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
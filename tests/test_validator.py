@@ -1,8 +1,11 @@
 import json
 import unittest
 from pathlib import Path
+from unittest import mock
 
-from src.code_validator.config import AppConfig, LogLevel
+from src.code_validator.cache import LintCache
+from src.code_validator.components.linter import Flake8Engine
+from src.code_validator.config import AppConfig, LogLevel, RuleResult
 from src.code_validator.core import StaticValidator
 from src.code_validator.exceptions import RuleParsingError
 from src.code_validator.output import Console, setup_logging
@@ -176,6 +179,52 @@ class TestStaticValidatorIntegration(unittest.TestCase):
         # noinspection PyTypeChecker
         self.assertEqual(validator.failed_rules_id[0].config.rule_id, 1)
 
+    def run_linter_after_failing_rule(self, is_critical: bool) -> tuple[bool, mock.Mock]:
+        """Runs a failing rule before a linter rule and spies on the flake8 runs of a fresh engine."""
+        rules = {
+            "validation_rules": [
+                {
+                    "rule_id": 1,
+                    "message": "critical" if is_critical else "not critical",
+                    "is_critical": is_critical,
+                    "check": {
+                        "selector": {"type": "function_def", "name": "non_existent"},
+                        "constraint": {"type": "is_required"},
+                    },
+                },
+                {"rule_id": 2, "type": "check_linter_pep8", "message": "PEP8 fail"},
+            ]
+        }
+        rules_path = FIXTURES_DIR / "temp_linter_rules.json"
+        with open(rules_path, "w", encoding="utf-8") as f:
+            # noinspection PyTypeChecker
+            json.dump(rules, f)
+
+        engine = Flake8Engine(cache=LintCache())
+        try:
+            with (
+                mock.patch("src.code_validator.components.linter.get_flake8_engine", return_value=engine),
+                mock.patch.object(engine, "_check", wraps=engine._check) as check,
+            ):
+                result = self.run_validator("p01_simple_program.py", str(rules_path))
+        finally:
+            rules_path.unlink()
+        return result, check
+
+    def test_linter_is_not_run_after_critical_failure(self):
+        """Tests that flake8 is never invoked when a critical rule before the linter rule fails."""
+        result, check = self.run_linter_after_failing_rule(is_critical=True)
+
+        self.assertFalse(result)
+        check.assert_not_called()
+
+    def test_linter_runs_after_non_critical_failure(self):
+        """Tests that flake8 runs exactly once when the rule before the linter rule is not critical."""
+        result, check = self.run_linter_after_failing_rule(is_critical=False)
+
+        self.assertFalse(result)
+        check.assert_called_once()
+
     def test_unknown_rule_type_raises_error(self):
         """Tests that an unknown rule type in JSON raises RuleParsingError."""
         rules = {"validation_rules": [{"rule_id": 99, "type": "non_existent_check"}]}
@@ -335,3 +384,56 @@ class TestValidatorRobustness(unittest.TestCase):
         result = self.run_validator("p09_arcade_app.py", str(rules_path))
         rules_path.unlink()
         self.assertTrue(result)
+
+
+class TestIterResults(unittest.TestCase):
+    def setUp(self):
+        self.console = Console(setup_logging(LogLevel.CRITICAL), is_quiet=True)
+
+    def _validator(self, solution_file: str, rules_file: str) -> StaticValidator:
+        config = AppConfig(
+            solution_path=FIXTURES_DIR / solution_file,
+            rules_path=FIXTURES_DIR / rules_file,
+            log_level=LogLevel.CRITICAL,
+            is_quiet=True,
+            exit_on_first_error=False,
+        )
+        return StaticValidator(config, self.console)
+
+    def test_results_are_yielded_in_rule_order(self):
+        validator = self._validator("p02_forbidden_constructs.py", "r01_require_structure.json")
+        results = list(validator.iter_results())
+
+        self.assertEqual([result.rule_id for result in results], [101, 102])
+        self.assertTrue(all(result.elapsed >= 0 for result in results))
+        failed = [result.rule for result in results if not result.passed]
+        self.assertEqual(validator.failed_rules_id, failed)
+        self.assertEqual(failed[0].config.message, results[0].message)
+        self.assertEqual(
+            [(failure.rule_id, failure.message) for failure in validator.failures],
+            [(result.rule_id, result.message) for result in results if not result.passed],
+        )
+        self.assertFalse(validator.is_valid)
+
+    def test_stopping_early_skips_remaining_rules(self):
+        validator = self._validator("p02_forbidden_constructs.py", "r01_require_structure.json")
+        results = validator.iter_results()
+        first = next(results)
+        results.close()
+
+        self.assertEqual(first.rule_id, 101)
+        self.assertLessEqual(len(validator.failed_rules_id), 1)
+
+    def test_syntax_error_yields_the_syntax_rule(self):
+        validator = self._validator("invalid_syntax.ppy", "basic_rules.json")
+        results = list(validator.iter_results())
+
+        self.assertEqual([(result.rule_id, result.passed) for result in results], [(1, False)])
+
+    def test_typo_suggestion_is_resolved_once(self):
+        calls = []
+        result = RuleResult(1, False, "missing", 0.0, _typo_suggestion=lambda: calls.append(1) or "Did you mean 'x'?")
+
+        self.assertEqual(result.typo_suggestion, "Did you mean 'x'?")
+        self.assertEqual(result.typo_suggestion, "Did you mean 'x'?")
+        self.assertEqual(len(calls), 1)